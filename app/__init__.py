@@ -50,6 +50,10 @@ app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 31536000 if not app.config['DEBUG'] el
 from .config.simple_cache import setup_caching
 setup_caching(app)
 
+# Load-aware fidelity control (per-worker in-flight/latency tracking)
+from .brain.load_control import register_request_hooks
+register_request_hooks(app)
+
 # Production logging
 if not app.config['DEBUG']:
     logging.basicConfig(
@@ -38,6 +38,10 @@ class TemplateDataAdapter:
         """
         if not base_data:
             return base_data
+        
+        # Already adapted earlier in this request - nothing to add
+        if TemplateDataAdapter.is_enhanced_data(base_data):
+            return base_data
             
         logger.debug(f"Adapting data for V2 template: {base_data.get('pump_code', 'Unknown')}")
         
@@ -132,13 +136,18 @@ class TemplateDataAdapter:
             )
         
         # Adapt alternatives
+        original_alternatives = template_data.get('alternatives')
         if 'alternatives' in template_data:
             template_data['alternatives'] = TemplateDataAdapter.adapt_alternatives_list(
                 template_data['alternatives']
             )
             
         # Ensure alternative_pumps compatibility (legacy field)
-        if 'alternative_pumps' in template_data:
+        # Reports usually pass the same list under both names - reuse it
+        if template_data.get('alternative_pumps') is not None and \
+                template_data.get('alternative_pumps') is original_alternatives:
+            template_data['alternative_pumps'] = template_data['alternatives']
+        elif 'alternative_pumps' in template_data:
             template_data['alternative_pumps'] = TemplateDataAdapter.adapt_alternatives_list(
                 template_data['alternative_pumps']
             )
@@ -0,0 +1,530 @@
+"""
+Batch Evaluator Module
+======================
+Vectorized evaluation of many pumps at many operating points in one pass
+"""
+
+import logging
+from typing import Dict, List, Any, Optional
+import numpy as np
+from .hydraulic_profile import HydraulicProfiler
+from .config_manager import config
+
+logger = logging.getLogger(__name__)
+
+# Operating zone names by tier (same tiers as PumpEvaluator)
+ZONES_BY_TIER = {1: 'preferred', 2: 'allowable', 3: 'acceptable', 4: 'marginal'}
+
+# Why a cell is infeasible (first failing check wins); 0 means feasible
+CAUSE_NONE = 0
+CAUSE_FLOW_RANGE = 1
+CAUSE_HEAD_SHORTFALL = 2
+CAUSE_TRIM_LIMIT = 3
+CAUSE_SPEED_LIMIT = 4
+CAUSE_SPEED_SOLUTION = 5
+CAUSE_EFFICIENCY = 6
+
+# Summary labels by cause (exclusion_summary keys)
+CAUSE_LABELS = {
+    CAUSE_FLOW_RANGE: 'Flow outside curve range',
+    CAUSE_HEAD_SHORTFALL: 'Insufficient head',
+    CAUSE_TRIM_LIMIT: 'Trim below minimum',
+    CAUSE_SPEED_LIMIT: 'Speed outside VFD range',
+    CAUSE_SPEED_SOLUTION: 'No speed solution',
+    CAUSE_EFFICIENCY: 'Invalid efficiency data'
+}
+
+
+def batched_interp(xp: np.ndarray, fp: np.ndarray, x: np.ndarray) -> np.ndarray:
+    """
+    Row-wise linear interpolation (np.interp for a stack of curves).
+
+    Args:
+        xp: (P, K) increasing sample flows per row, NaN-padded at the end
+        fp: (P, K) sample values per row
+        x: (P, M) query flows per row
+
+    Returns:
+        (P, M) interpolated values, NaN outside each row's sample range
+    """
+    counts = np.sum(np.isfinite(xp), axis=1)
+    idx = np.sum(xp[:, np.newaxis, :] <= x[:, :, np.newaxis], axis=2) - 1
+    idx = np.clip(idx, 0, np.maximum(counts - 2, 0)[:, np.newaxis])
+
+    x0 = np.take_along_axis(xp, idx, axis=1)
+    x1 = np.take_along_axis(xp, idx + 1, axis=1)
+    y0 = np.take_along_axis(fp, idx, axis=1)
+    y1 = np.take_along_axis(fp, idx + 1, axis=1)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        values = y0 + (x - x0) / (x1 - x0) * (y1 - y0)
+
+    lower = xp[:, :1]
+    upper = np.take_along_axis(xp, np.maximum(counts - 1, 0)[:, np.newaxis], axis=1)
+    values[~np.isfinite(x) | (x < lower) | (x > upper)] = np.nan
+    return values
+
+
+class BatchEvaluator:
+    """Evaluates pumps × operating points with array arithmetic"""
+
+    def __init__(self, brain):
+        """
+        Initialize with reference to main Brain.
+
+        Args:
+            brain: Parent PumpBrain instance
+        """
+        self.brain = brain
+
+        # Compiled per-pump rows, valid for one catalog version
+        self._rows: Dict[str, Optional[Dict[str, Any]]] = {}
+        self._rows_version = None
+
+        self.min_trim_percent = config.get('batch_evaluator', 'minimum_trim_percentage')
+        self.min_head_delivery = config.get('batch_evaluator', 'minimum_head_delivery_factor')
+        self.vfd_iterations = config.get('batch_evaluator', 'vfd_speed_solver_iterations')
+        self.vfd_tolerance = config.get('batch_evaluator', 'vfd_head_match_tolerance')
+        self.default_min_speed_ratio = config.get('performance_vfd', 'default_minimum_vfd_speed_percentage')
+        self.default_max_speed_ratio = config.get('performance_vfd', 'default_maximum_vfd_speed_percentage')
+        self.default_test_speed_rpm = config.get('performance_vfd', 'default_4pole_motor_speed_rpm')
+        self.water_density = config.get('batch_evaluator', 'water_density_kg_m3')
+        self.gravity = config.get('batch_evaluator', 'gravitational_acceleration_m_s2')
+        self.seconds_per_hour = config.get('batch_evaluator', 'seconds_per_hour')
+        self.penalty_volute = config.get('batch_evaluator', 'trim_efficiency_penalty_volute')
+        self.penalty_diffuser = config.get('batch_evaluator', 'trim_efficiency_penalty_diffuser')
+
+    # ==================== PUMP COMPILATION ====================
+
+    def _check_catalog_version(self):
+        """Drop compiled rows when the catalog has been reloaded."""
+        version = self.brain.get_catalog_version()
+        if version != self._rows_version:
+            self._rows = {}
+            self._rows_version = version
+
+    def compile_pump(self, pump_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Compile a pump's reference curve and constants into array form.
+
+        Args:
+            pump_data: Pump data from repository
+
+        Returns:
+            Compiled row or None if the pump has no usable reference curve
+        """
+        self._check_catalog_version()
+        pump_code = pump_data.get('pump_code', '')
+        if pump_code in self._rows:
+            return self._rows[pump_code]
+
+        row = None
+        curves = [c for c in pump_data.get('curves', []) if c.get('impeller_diameter_mm', 0) > 0]
+        if curves:
+            reference_curve = max(curves, key=lambda c: c.get('impeller_diameter_mm', 0))
+            points = [p for p in reference_curve.get('performance_points', [])
+                      if p.get('flow_m3hr') is not None and p.get('head_m') is not None]
+            flows = np.array([p['flow_m3hr'] for p in points], dtype=float)
+
+            unique_flows, inverse = np.unique(flows, return_inverse=True)
+            if len(unique_flows) >= 2:
+                counts = np.bincount(inverse)
+
+                def averaged(field):
+                    values = np.array([np.nan if p.get(field) is None else p[field] for p in points], dtype=float)
+                    return np.bincount(inverse, weights=np.nan_to_num(values)) / counts if np.isfinite(values).all() \
+                        else np.full(len(unique_flows), np.nan)
+
+                specs = pump_data.get('specifications', {})
+                pump_type = pump_data.get('pump_type', '')
+                exponents = HydraulicProfiler.get_profile(pump_data)['physics_exponents']
+                variable_speed = specs.get('variable_speed', False)
+                variable_diameter = specs.get('variable_diameter', True)
+
+                # Same three-path decision as PumpEvaluator (FLEXIBLE defaults to trim)
+                if variable_diameter:
+                    method = 'IMPELLER_TRIM'
+                elif variable_speed:
+                    method = 'SPEED_VARIATION'
+                else:
+                    method = 'NONE'
+
+                # Same speed limits as VFDCalculator (catalog RPM, else default ratios)
+                test_speed = specs.get('test_speed_rpm') or 0
+                if test_speed <= 0:
+                    test_speed = self.default_test_speed_rpm
+                min_speed_rpm = specs.get('min_speed_rpm') or 0
+                max_speed_rpm = specs.get('max_speed_rpm') or 0
+
+                lowered_type = (pump_type or '').lower()
+                row = {
+                    'pump_code': pump_code,
+                    'pump_data': pump_data,
+                    'flows': unique_flows,
+                    'heads': averaged('head_m'),
+                    'effs': averaged('efficiency_pct'),
+                    'npsh': averaged('npshr_m'),
+                    'reference_diameter_mm': float(reference_curve['impeller_diameter_mm']),
+                    'bep_flow': specs.get('bep_flow_m3hr') or np.nan,
+                    'bep_head': specs.get('bep_head_m') or np.nan,
+                    'flow_exp': exponents['flow_exponent_x'],
+                    'head_exp': exponents['head_exponent_y'],
+                    'npsh_exp': exponents['npshr_exponent_alpha'],
+                    'penalty': self.penalty_diffuser if ('diffuser' in lowered_type or 'turbine' in lowered_type)
+                    else self.penalty_volute,
+                    'min_speed_ratio': min_speed_rpm / test_speed if min_speed_rpm > 0 else self.default_min_speed_ratio,
+                    'max_speed_ratio': max_speed_rpm / test_speed if max_speed_rpm > 0 else self.default_max_speed_ratio,
+                    'selection_method': method
+                }
+
+        self._rows[pump_code] = row
+        return row
+
+    def stack(self, rows: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+        """Stack compiled rows into NaN-padded (P, K) matrices and (P, 1) columns."""
+        width = max(len(r['flows']) for r in rows)
+
+        def pad(field):
+            matrix = np.full((len(rows), width), np.nan)
+            for i, r in enumerate(rows):
+                matrix[i, :len(r[field])] = r[field]
+            return matrix
+
+        def column(field):
+            return np.array([r[field] for r in rows], dtype=float)[:, np.newaxis]
+
+        methods = np.array([r['selection_method'] for r in rows])
+        return {
+            'flows': pad('flows'), 'heads': pad('heads'), 'effs': pad('effs'), 'npsh': pad('npsh'),
+            'reference_diameter': column('reference_diameter_mm'),
+            'bep_flow': column('bep_flow'), 'bep_head': column('bep_head'),
+            'flow_exp': column('flow_exp'), 'head_exp': column('head_exp'), 'npsh_exp': column('npsh_exp'),
+            'penalty': column('penalty'),
+            'min_speed_ratio': column('min_speed_ratio'), 'max_speed_ratio': column('max_speed_ratio'),
+            'is_trim': (methods == 'IMPELLER_TRIM')[:, np.newaxis],
+            'is_vfd': (methods == 'SPEED_VARIATION')[:, np.newaxis]
+        }
+
+    # ==================== EVALUATION ====================
+
+    def evaluate(self, pumps: List[Dict[str, Any]], flows, heads) -> Dict[str, Any]:
+        """
+        Evaluate every pump at every operating point.
+
+        Trim-capable pumps follow the industry-standard affinity path used by
+        the single-pump calculator (largest impeller, D'/D = sqrt(H/H_full),
+        type-specific exponents, volute/diffuser efficiency penalty).
+        VFD-only pumps solve the speed ratio along the affinity parabola.
+
+        Args:
+            pumps: Pump data dictionaries
+            flows: Operating flows (M,) in m³/hr
+            heads: Operating heads (M,) in meters
+
+        Returns:
+            Dictionary of (P, M) arrays plus the compiled pump rows
+        """
+        flows = np.atleast_1d(np.asarray(flows, dtype=float))
+        heads = np.atleast_1d(np.asarray(heads, dtype=float))
+
+        rows = [row for row in (self.compile_pump(p) for p in pumps) if row is not None]
+        if not rows:
+            return {'rows': [], 'flows': flows, 'heads': heads}
+
+        s = self.stack(rows)
+        count = len(rows)
+        Q = np.broadcast_to(flows[np.newaxis, :], (count, len(flows)))
+        H = np.broadcast_to(heads[np.newaxis, :], (count, len(heads)))
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            full_head = batched_interp(s['flows'], s['heads'], Q)
+
+            # ---- Impeller trim / fixed path ----
+            diameter_ratio = np.minimum(np.sqrt(H / full_head), 1.0)
+            diameter_ratio = np.where(s['is_trim'], diameter_ratio, 1.0)
+            trim_head = full_head * diameter_ratio ** s['head_exp']
+            trim_eff = batched_interp(s['flows'], s['effs'], Q) - \
+                s['penalty'] * (1.0 - diameter_ratio) * 100.0
+            trim_npsh = batched_interp(s['flows'], s['npsh'], Q) * diameter_ratio ** s['npsh_exp']
+            trim_ok = np.isfinite(full_head) & (full_head >= H * self.min_head_delivery) & \
+                (diameter_ratio * 100.0 >= self.min_trim_percent)
+
+            # ---- Speed variation path: Q = s·Q1, H = s²·H1 ----
+            speed_ratio, vfd_head, vfd_eff, vfd_npsh, vfd_ok = self.solve_speed(s, Q, H, full_head)
+
+            is_vfd = np.broadcast_to(s['is_vfd'], Q.shape)
+            delivered_head = np.where(is_vfd, vfd_head, trim_head)
+            efficiency = np.where(is_vfd, vfd_eff, trim_eff)
+            npshr = np.where(is_vfd, vfd_npsh, trim_npsh)
+            feasible = np.where(is_vfd, vfd_ok, trim_ok) & np.isfinite(efficiency) & (efficiency > 0)
+
+            # ---- Infeasibility cause per cell ----
+            trim_cause = np.select(
+                [~np.isfinite(full_head), full_head < H * self.min_head_delivery,
+                 diameter_ratio * 100.0 < self.min_trim_percent],
+                [CAUSE_FLOW_RANGE, CAUSE_HEAD_SHORTFALL, CAUSE_TRIM_LIMIT], CAUSE_EFFICIENCY)
+            vfd_cause = np.select(
+                [(speed_ratio < s['min_speed_ratio']) | (speed_ratio > s['max_speed_ratio']),
+                 ~np.isfinite(vfd_head), np.abs(vfd_head - H) > H * self.vfd_tolerance],
+                [CAUSE_SPEED_LIMIT, CAUSE_FLOW_RANGE, CAUSE_SPEED_SOLUTION], CAUSE_EFFICIENCY)
+            cause = np.where(feasible, CAUSE_NONE, np.where(is_vfd, vfd_cause, trim_cause))
+
+            power = (self.water_density * self.gravity * Q * H) / \
+                (self.seconds_per_hour * efficiency / 100.0 * 1000.0)
+            qbp = Q / s['bep_flow'] * 100.0
+
+        result = {
+            'rows': rows,
+            'flows': flows,
+            'heads': heads,
+            'feasible': feasible,
+            'head_m': delivered_head,
+            'head_margin_m': delivered_head - H,
+            'efficiency_pct': efficiency,
+            'power_kw': power,
+            'npshr_m': npshr,
+            'qbp_percent': qbp,
+            'trim_percent': np.where(is_vfd, 100.0, diameter_ratio * 100.0),
+            'impeller_diameter_mm': s['reference_diameter'] * np.where(is_vfd, 1.0, diameter_ratio),
+            'speed_ratio': np.where(is_vfd, speed_ratio, 1.0),
+            'full_head_m': full_head,
+            'is_vfd': is_vfd,
+            'cause': cause
+        }
+        result.update(self.score(result, s['bep_head']))
+        return result
+
+    def solve_speed(self, s: Dict[str, np.ndarray], Q: np.ndarray, H: np.ndarray,
+                    full_head: Optional[np.ndarray] = None):
+        """
+        Solve the speed ratio that puts each (Q, H) on the scaled reference curve.
+
+        Fixed-point iteration on s = sqrt(H / H1(Q/s)), starting from the
+        full-speed head at Q.
+
+        Args:
+            s: Stacked rows from stack
+            Q: (P, M) flows in m³/hr
+            H: (P, M) required heads in meters
+            full_head: Optional (P, M) full-speed heads at Q (saves one interpolation)
+
+        Returns:
+            Tuple of (P, M) arrays: speed_ratio, head_m, efficiency_pct, npshr_m, feasible
+        """
+        with np.errstate(divide='ignore', invalid='ignore'):
+            if full_head is None:
+                full_head = batched_interp(s['flows'], s['heads'], Q)
+            speed_ratio = np.sqrt(H / full_head)
+            for _ in range(self.vfd_iterations):
+                reference_head = batched_interp(s['flows'], s['heads'], Q / speed_ratio)
+                speed_ratio = np.sqrt(H / reference_head)
+            reference_flow = Q / speed_ratio
+            head = speed_ratio ** 2 * batched_interp(s['flows'], s['heads'], reference_flow)
+            efficiency = batched_interp(s['flows'], s['effs'], reference_flow)
+            npshr = batched_interp(s['flows'], s['npsh'], reference_flow) * speed_ratio ** 2
+            feasible = np.isfinite(head) & (np.abs(head - H) <= H * self.vfd_tolerance) & \
+                (speed_ratio >= s['min_speed_ratio']) & (speed_ratio <= s['max_speed_ratio'])
+        return speed_ratio, head, efficiency, npshr, feasible
+
+    # ==================== SCORING ====================
+
+    def score(self, batch: Dict[str, Any], bep_head: np.ndarray) -> Dict[str, Any]:
+        """
+        Vectorized form of the PumpEvaluator scoring and tiering rules.
+
+        Args:
+            batch: Evaluation arrays from evaluate()
+            bep_head: (P, 1) BEP heads
+
+        Returns:
+            Dictionary with 'tier', 'score_components' and 'total_score' arrays
+        """
+        get = lambda key: config.get('pump_evaluator', key)
+        qbp = np.nan_to_num(batch['qbp_percent'], nan=0.0)
+        flow_ratio = qbp / 100.0
+        H = batch['heads'][np.newaxis, :]
+
+        # Operating zone tiers
+        acceptable_low = get('qbp_lower_threshold_for_acceptable_range')
+        acceptable_high = get('qbp_upper_threshold_for_acceptable_range')
+        allowable_low = get('qbp_lower_threshold_for_allowable_range')
+        allowable_high = get('qbp_upper_threshold_for_allowable_range')
+        tier = np.select(
+            [
+                (get('preferred_operating_zone_minimum_qbp_percentage') <= qbp) &
+                (qbp <= get('preferred_operating_zone_maximum_qbp_percentage')),
+                ((allowable_low <= qbp) & (qbp < get('qbp_upper_threshold_for_preferred_range_lower_bound'))) |
+                ((get('qbp_lower_threshold_for_allowable_range_upper_bound') < qbp) & (qbp <= allowable_high)),
+                ((acceptable_low <= qbp) & (qbp < allowable_low)) | ((allowable_high < qbp) & (qbp <= acceptable_high))
+            ],
+            [1, 2, 3], default=4
+        )
+
+        # BEP proximity
+        def band(lower, upper):
+            return (get(f'bep_proximity_{lower}') <= flow_ratio) & (flow_ratio <= get(f'bep_proximity_{upper}'))
+
+        bep_score = np.select(
+            [band('sweet_spot_lower_bound', 'sweet_spot_upper_bound'),
+             band('good_range_lower_bound', 'good_range_upper_bound'),
+             band('acceptable_range_lower_bound', 'acceptable_range_upper_bound'),
+             band('marginal_range_lower_bound', 'marginal_range_upper_bound')],
+            [get('bep_proximity_sweet_spot_score'), get('bep_proximity_good_range_score'),
+             get('bep_proximity_acceptable_range_score'), get('bep_proximity_marginal_range_score')],
+            default=get('bep_proximity_poor_range_score')
+        )
+
+        # Head oversizing penalty (BEP head vs requirement)
+        oversizing_pct = np.nan_to_num((bep_head - H) / H * 100.0, nan=0.0)
+        moderate = get('moderate_oversizing_base_penalty') - \
+            (oversizing_pct - get('head_oversizing_threshold_percentage')) * get('oversizing_penalty_multiplier')
+        oversizing_penalty = np.select(
+            [oversizing_pct > get('severe_head_oversizing_threshold_percentage'),
+             oversizing_pct > get('head_oversizing_threshold_percentage')],
+            [get('severe_oversizing_penalty'), moderate], default=0.0
+        )
+
+        # Efficiency
+        eff = np.nan_to_num(batch['efficiency_pct'], nan=0.0)
+        good_eff = get('good_efficiency_scoring_threshold_percentage')
+        fair_eff = get('fair_efficiency_scoring_threshold_percentage')
+        poor_eff = get('poor_efficiency_scoring_threshold_percentage')
+        eff_score = np.select(
+            [eff >= get('excellent_efficiency_scoring_threshold_percentage'), eff >= good_eff,
+             eff >= fair_eff, eff >= poor_eff],
+            [np.full_like(eff, get('maximum_efficiency_score')),
+             get('base_efficiency_score_for_good_range') + (eff - good_eff) * get('efficiency_score_multiplier_for_good_range'),
+             get('base_efficiency_score_for_fair_range') + (eff - fair_eff) * get('efficiency_score_multiplier_for_good_range'),
+             get('base_efficiency_score_for_poor_range') + (eff - poor_eff) * get('efficiency_score_multiplier_for_poor_range')],
+            default=np.maximum(0, (eff - get('minimum_acceptable_efficiency_threshold_percentage')) *
+                               get('efficiency_score_multiplier_for_minimum_range'))
+        )
+
+        # Head margin
+        margin_pct = np.nan_to_num(batch['head_margin_m'] / H * 100.0, nan=0.0)
+        perfect = get('perfect_head_margin_threshold_percentage')
+        good = get('good_head_margin_threshold_percentage')
+        acceptable = get('acceptable_head_margin_threshold_percentage')
+        perfect_score = get('perfect_head_margin_score')
+        margin_score = np.select(
+            [margin_pct <= perfect, margin_pct <= good, margin_pct <= acceptable],
+            [np.full_like(margin_pct, perfect_score), perfect_score - (margin_pct - perfect) * 2,
+             10 - (margin_pct - good) * 1],
+            default=np.maximum(0, 5 - (margin_pct - acceptable) * 2)
+        )
+
+        # Impeller trim penalty
+        trim = batch['trim_percent']
+        trim_penalty = np.select(
+            [trim >= get('trim_penalty_threshold_percentage'),
+             trim >= get('small_trim_penalty_threshold_percentage'),
+             trim >= get('moderate_trim_penalty_threshold_percentage')],
+            [0.0, get('small_trim_penalty_value'), get('moderate_trim_penalty_value')],
+            default=get('large_trim_penalty_value')
+        )
+
+        components = {
+            'bep_proximity': bep_score,
+            'head_oversizing_penalty': oversizing_penalty,
+            'efficiency': eff_score,
+            'head_margin': margin_score,
+            'trim_penalty': trim_penalty
+        }
+        total = sum(components.values())
+        return {
+            'tier': tier,
+            'score_components': components,
+            'total_score': np.where(batch['feasible'], total, -np.inf)
+        }
+
+    # ==================== OUTPUT ====================
+
+    def to_evaluation(self, batch: Dict[str, Any], pump_index: int, point_index: int) -> Dict[str, Any]:
+        """
+        Build an evaluation dictionary (PumpEvaluator shape) for one cell.
+
+        Args:
+            batch: Result of evaluate()
+            pump_index: Row index
+            point_index: Operating point index
+
+        Returns:
+            Evaluation dictionary usable by /pump_options and reports
+        """
+        row = batch['rows'][pump_index]
+        pump_data = row['pump_data']
+        cell = (pump_index, point_index)
+
+        def value(key):
+            v = batch[key][cell]
+            return float(v) if np.isfinite(v) else None
+
+        tier = int(batch['tier'][cell])
+        feasible = bool(batch['feasible'][cell])
+        evaluation = {
+            'pump_code': row['pump_code'],
+            'pump_name': pump_data.get('pump_name'),
+            'manufacturer': pump_data.get('manufacturer'),
+            'pump_type': pump_data.get('pump_type'),
+            'model_series': pump_data.get('model_series'),
+            'feasible': feasible,
+            'exclusion_reasons': [] if feasible else [self.exclusion_reason(batch, pump_index, point_index)],
+            'score_components': {k: float(v[cell]) for k, v in batch['score_components'].items()},
+            'total_score': value('total_score') if feasible else 0.0,
+            'operating_zone': ZONES_BY_TIER[tier],
+            'tier': tier,
+            'flow_m3hr': float(batch['flows'][point_index]),
+            'head_m': value('head_m'),
+            'efficiency_pct': value('efficiency_pct'),
+            'power_kw': value('power_kw'),
+            'npshr_m': value('npshr_m'),
+            'qbp_percent': value('qbp_percent'),
+            'trim_percent': value('trim_percent'),
+            'impeller_diameter_mm': value('impeller_diameter_mm'),
+            'head_margin_m': value('head_margin_m'),
+            'selection_method': row['selection_method'],
+            'sizing_method': 'Speed Variation' if batch['is_vfd'][cell] else 'Impeller Trim',
+            'batch_evaluated': True
+        }
+        if batch['is_vfd'][cell]:
+            # Reported as a percentage, like PumpEvaluator/VFDCalculator
+            speed_ratio = value('speed_ratio')
+            evaluation['speed_ratio'] = speed_ratio * 100.0 if speed_ratio is not None else None
+        return evaluation
+
+    def exclusion_reason(self, batch: Dict[str, Any], pump_index: int, point_index: int) -> str:
+        """
+        Describe why one cell is infeasible, with the numbers behind the check.
+
+        Args:
+            batch: Result of evaluate()
+            pump_index: Row index
+            point_index: Operating point index
+
+        Returns:
+            Exclusion reason text (empty for feasible cells)
+        """
+        cell = (pump_index, point_index)
+        cause = int(batch['cause'][cell])
+        flow = float(batch['flows'][point_index])
+        head = float(batch['heads'][point_index])
+        row = batch['rows'][pump_index]
+
+        if cause == CAUSE_NONE:
+            return ''
+        if cause == CAUSE_FLOW_RANGE:
+            flows = row['flows']
+            return (f"Flow {flow:.1f} m³/hr outside curve range "
+                    f"{float(flows[0]):.1f}-{float(flows[-1]):.1f} m³/hr")
+        if cause == CAUSE_HEAD_SHORTFALL:
+            return (f"Insufficient head: {float(batch['full_head_m'][cell]):.1f}m at full diameter "
+                    f"vs {head:.1f}m required")
+        if cause == CAUSE_TRIM_LIMIT:
+            return (f"Required trim {float(batch['trim_percent'][cell]):.1f}% below minimum "
+                    f"{self.min_trim_percent:.0f}%")
+        if cause == CAUSE_SPEED_LIMIT:
+            return (f"VFD speed {float(batch['speed_ratio'][cell]) * 100.0:.1f}% outside "
+                    f"{row['min_speed_ratio'] * 100.0:.0f}-{row['max_speed_ratio'] * 100.0:.0f}% range")
+        if cause == CAUSE_SPEED_SOLUTION:
+            return f"No speed on the affinity parabola delivers {head:.1f}m at {flow:.1f} m³/hr"
+        return 'Invalid efficiency data at duty point'
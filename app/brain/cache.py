@@ -1,170 +1,889 @@
 """
 Brain Cache Module
 ==================
-In-memory caching for Brain operations
+Two-tier caching for Brain operations: thread-safe in-process LRU (L1)
+over a host-wide SQLite store shared by all workers (L2), with
+stale-while-revalidate, single-flight and negative caching. L1 is bounded
+by entry count and by approximate bytes, and swept periodically
 """
 
+import hashlib
+import json
 import logging
+import operator
+import os
+import sqlite3
+import stat
+import sys
+import tempfile
+import threading
 import time
-from typing import Dict, Any, Optional
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, Callable, Hashable
 from collections import OrderedDict
-import hashlib
-import json
 from .config_manager import config
 
 logger = logging.getLogger(__name__)
 
+# Namespace of keys that carry no namespace
+_UNNAMED_NAMESPACE = 'other'
+
+# Decimal places kept for floats in typed keys
+_KEY_FLOAT_DECIMALS = config.get('cache', 'key_float_decimals')
+
+# Longer sequences are keyed by a digest (e.g. 8760-value hourly profiles)
+_KEY_MAX_INLINE_ITEMS = config.get('cache', 'key_maximum_inline_sequence_items')
+
+# Argument types used in keys unchanged
+_KEY_SCALAR_TYPES = frozenset({str, int, bool, type(None)})
+
+# Sort key of dict items (by key only, values may not be comparable)
+_item_key = operator.itemgetter(0)
+
+# Shared-tier encoding: JSON plus one-key tag objects for the types JSON lacks
+_TUPLE_TAG = '__tuple__'
+_ITEMS_TAG = '__items__'
+_ARRAY_TAG = '__ndarray__'
+_SHARED_TAGS = frozenset({_TUPLE_TAG, _ITEMS_TAG, _ARRAY_TAG})
+_JSON_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+def estimate_size(value: Any) -> int:
+    """
+    Approximate deep memory size of a value in bytes.
+
+    Walks dicts, sequences, sets and object attributes; objects reachable
+    more than once are counted once. Buffers exposing nbytes (numpy arrays)
+    count their data.
+
+    Args:
+        value: Value to measure
+
+    Returns:
+        Size estimate in bytes
+    """
+    seen = set()
+    stack = [value]
+    total = 0
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        nbytes = getattr(obj, 'nbytes', None)
+        if isinstance(nbytes, int):
+            total += max(sys.getsizeof(obj), nbytes)
+            continue
+        total += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        elif hasattr(obj, '__dict__') and not isinstance(obj, type):
+            stack.append(obj.__dict__)
+    return total
+
+
+def key_namespace(key: Hashable) -> str:
+    """Namespace of a cache key (leading string of a typed key, or the part before ':')."""
+    if isinstance(key, tuple):
+        return key[0] if key and isinstance(key[0], str) else _UNNAMED_NAMESPACE
+    namespace, separator, _ = str(key).partition(':')
+    return namespace if separator else _UNNAMED_NAMESPACE
+
+
+def _sequence_key(items: tuple) -> Hashable:
+    """Frozen sequence, or a (length, digest) stand-in when it is too long to inline."""
+    if len(items) <= _KEY_MAX_INLINE_ITEMS:
+        return items
+    return ('#sequence', len(items), hashlib.blake2b(repr(items).encode(), digest_size=16).hexdigest())
+
+
+def freeze(value: Any, decimals: int) -> Hashable:
+    """
+    Convert a value into a cheap, hashable key part.
+
+    Floats are rounded to decimals so float noise (e.g. from unit
+    conversion) maps to one key; dicts become key-sorted item tuples,
+    sequences become tuples and sets become sorted tuples. Sequences longer
+    than the inline limit are replaced by their length and a digest so keys
+    stay small. Anything else is keyed by its repr.
+
+    Args:
+        value: Argument value
+        decimals: Decimal places kept for floats
+
+    Returns:
+        Hashable representation with a deterministic repr
+    """
+    value_type = type(value)
+    if value_type is float:
+        return round(value, decimals)
+    if value_type in _KEY_SCALAR_TYPES:
+        return value
+    if value_type is dict:
+        try:
+            items = sorted(value.items(), key=_item_key)
+        except TypeError:
+            # Mixed key types
+            items = sorted(value.items(), key=lambda item: repr(item[0]))
+        return tuple([(key, freeze(item, decimals)) for key, item in items])
+    if value_type is list or value_type is tuple:
+        return _sequence_key(tuple([freeze(item, decimals) for item in value]))
+    if isinstance(value, float):
+        return round(float(value), decimals)  # numpy float64
+    if isinstance(value, (str, int)):
+        return value
+    if isinstance(value, dict):
+        return freeze(dict(value), decimals)
+    if isinstance(value, (list, tuple)):
+        return _sequence_key(tuple([freeze(item, decimals) for item in value]))
+    if isinstance(value, (set, frozenset)):
+        return _sequence_key(tuple(sorted((freeze(item, decimals) for item in value), key=repr)))
+    if hasattr(value, 'item') and callable(value.item) and getattr(value, 'ndim', None) == 0:
+        return freeze(value.item(), decimals)  # Other numpy scalars
+    return repr(value)
+
+
+def _to_shared(value: Any) -> Any:
+    """
+    Convert a value into JSON-compatible data for the shared tier.
+
+    Tuples, dicts with non-string keys and numeric numpy arrays are wrapped in
+    one-key tag objects so they round-trip exactly; numpy scalars become
+    Python numbers.
+
+    Args:
+        value: Value to store
+
+    Returns:
+        JSON-compatible data
+
+    Raises:
+        TypeError: If the value holds a type that cannot be stored safely
+    """
+    value_type = type(value)
+    if value_type in _JSON_SCALAR_TYPES:
+        return value
+    if value_type is list:
+        return [_to_shared(item) for item in value]
+    if value_type is tuple:
+        return {_TUPLE_TAG: [_to_shared(item) for item in value]}
+    if value_type is dict:
+        if all(type(key) is str for key in value) and not (len(value) == 1 and next(iter(value)) in _SHARED_TAGS):
+            return {key: _to_shared(item) for key, item in value.items()}
+        return {_ITEMS_TAG: [[_to_shared(key), _to_shared(item)] for key, item in value.items()]}
+    dtype = getattr(value, 'dtype', None)
+    if dtype is not None and getattr(dtype, 'kind', None) in ('b', 'i', 'u', 'f'):
+        if getattr(value, 'ndim', 0) == 0:
+            return value.item()  # numpy scalar
+        return {_ARRAY_TAG: {'dtype': dtype.str, 'shape': list(value.shape), 'data': value.tolist()}}
+    raise TypeError(f"{value_type.__name__} values are not stored in the shared tier")
+
+
+def _from_shared_object(data: Dict[str, Any]) -> Any:
+    """json.loads object hook reversing the tag objects of _to_shared."""
+    if len(data) == 1:
+        tag, payload = next(iter(data.items()))
+        if tag == _TUPLE_TAG:
+            return tuple(payload)
+        if tag == _ITEMS_TAG:
+            return {key: item for key, item in payload}
+        if tag == _ARRAY_TAG:
+            import numpy as np
+            return np.array(payload['data'], dtype=np.dtype(payload['dtype'])).reshape(payload['shape'])
+    return data
+
+
+def _check_private(path: str):
+    """
+    Refuse a path another user could have planted or can modify.
+
+    Raises:
+        PermissionError: If path is a symlink, not owned by this user, or
+            group/world-writable
+    """
+    info = os.lstat(path)
+    if stat.S_ISLNK(info.st_mode) or info.st_uid != os.getuid() or info.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+        raise PermissionError(f"{path} is not private to this user")
+
+
+class SharedCacheStore:
+    """
+    SQLite-backed cache shared by every worker process on the host.
+
+    Values are stored as zlib-compressed JSON (see _to_shared), never as
+    pickles, so reading the store cannot execute code. The database lives in
+    a 0700 directory owned by the app user; a directory or file owned by
+    anyone else, or writable by them, is refused. Connections are opened per
+    thread and per process, so forked workers never share a handle; WAL
+    mode lets readers proceed while another worker writes. Any storage
+    error is logged and treated as a miss - the shared tier never fails a
+    request.
+    """
+
+    def __init__(self, path: str, max_entries: int, prune_interval: int,
+                 busy_timeout: float, compression_level: int):
+        """
+        Args:
+            path: SQLite database file
+            max_entries: Entries kept after pruning
+            prune_interval: Writes between prune passes
+            busy_timeout: Seconds to wait on a locked database
+            compression_level: zlib level for stored values
+        """
+        self.path = path
+        self._prepare_path()
+        self.max_entries = max_entries
+        self.prune_interval = prune_interval
+        self.busy_timeout = busy_timeout
+        self.compression_level = compression_level
+        self._local = threading.local()
+        self._writes = 0
+        self._lock = threading.Lock()
+
+    def _prepare_path(self):
+        """
+        Create the private directory and database file, or verify existing ones.
+
+        Raises:
+            PermissionError: If the directory or file is not private to this user
+        """
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        _check_private(directory)
+        try:
+            # Create the file ourselves so it never takes a permissive umask
+            os.close(os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, 'O_NOFOLLOW', 0), 0o600))
+        except FileExistsError:
+            pass
+        _check_private(self.path)
+
+    def _connection(self) -> sqlite3.Connection:
+        """Connection of the current thread and process."""
+        connection = getattr(self._local, 'connection', None)
+        if connection is None or getattr(self._local, 'pid', None) != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=self.busy_timeout, isolation_level=None)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS brain_cache ('
+                'key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL NOT NULL, created_at REAL NOT NULL)'
+            )
+            connection.execute('CREATE INDEX IF NOT EXISTS brain_cache_expiry ON brain_cache (expires_at)')
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Read an unexpired entry.
+
+        Returns:
+            {'value', 'expires_at', 'created_at'} or None
+        """
+        row = self._connection().execute(
+            'SELECT value, expires_at, created_at FROM brain_cache WHERE key = ? AND expires_at > ?',
+            (key, time.time())
+        ).fetchone()
+        if row is None:
+            return None
+        try:
+            value = json.loads(zlib.decompress(row[0]).decode('utf-8'), object_hook=_from_shared_object)
+        except Exception as e:
+            # Written by an incompatible code version - drop it
+            logger.debug(f"[SHARED CACHE] Dropping unreadable entry {key}: {e}")
+            self.delete(key)
+            return None
+        return {'value': value, 'expires_at': row[1], 'created_at': row[2]}
+
+    def set(self, key: str, value: Any, expires_at: float, created_at: float) -> bool:
+        """
+        Write an entry, pruning every prune_interval writes.
+
+        Returns:
+            True if written, False if the value cannot be stored safely
+        """
+        try:
+            data = json.dumps(_to_shared(value), separators=(',', ':'))
+        except TypeError as e:
+            logger.debug(f"[SHARED CACHE] Not sharing {key}: {e}")
+            return False
+        blob = zlib.compress(data.encode('utf-8'), self.compression_level)
+        self._connection().execute(
+            'INSERT OR REPLACE INTO brain_cache (key, value, expires_at, created_at) VALUES (?, ?, ?, ?)',
+            (key, sqlite3.Binary(blob), expires_at, created_at)
+        )
+        with self._lock:
+            self._writes += 1
+            prune = self._writes % self.prune_interval == 0
+        if prune:
+            self.prune()
+        return True
+
+    def delete(self, key: str):
+        """Remove an entry."""
+        self._connection().execute('DELETE FROM brain_cache WHERE key = ?', (key,))
+
+    def clear(self):
+        """Remove every entry."""
+        self._connection().execute('DELETE FROM brain_cache')
+
+    def prune(self) -> int:
+        """
+        Drop expired entries, then the soonest-expiring beyond max_entries.
+
+        Returns:
+            Number of entries removed
+        """
+        connection = self._connection()
+        removed = connection.execute('DELETE FROM brain_cache WHERE expires_at <= ?', (time.time(),)).rowcount
+        removed += connection.execute(
+            'DELETE FROM brain_cache WHERE key IN (SELECT key FROM brain_cache ORDER BY expires_at DESC '
+            'LIMIT -1 OFFSET ?)', (self.max_entries,)
+        ).rowcount
+        if removed:
+            logger.debug(f"[SHARED CACHE] Pruned {removed} entries")
+        return removed
+
+    def count(self) -> int:
+        """Number of stored entries (including not yet pruned expired ones)."""
+        return self._connection().execute('SELECT COUNT(*) FROM brain_cache').fetchone()[0]
+
+
+class _Flight:
+    """One in-progress computation that concurrent callers wait on."""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.done = False
+        self.value = None
+        self.error: Optional[BaseException] = None
+
 
 class BrainCache:
-    """In-memory cache for Brain calculations"""
-    
-    def __init__(self, max_size: int = None, default_ttl: int = None):
+    """In-memory cache for Brain calculations, backed by the shared host-wide tier"""
+
+    def __init__(self, max_size: int = None, default_ttl: int = None, shared: Optional[bool] = None,
+                 scope: Optional[Callable[[], str]] = None,
+                 background: Optional[Callable[[Callable[[], Any]], Callable[[], Any]]] = None):
         """
         Initialize cache.
-        
+
         Args:
             max_size: Maximum number of cache entries
             default_ttl: Default time-to-live in seconds
+            shared: Use the shared L2 tier (default from config)
+            scope: Returns a prefix for shared keys (e.g. the catalog version)
+                so workers on different catalog loads never share entries
+            background: Wraps a refresh before it leaves the calling thread
+                (e.g. to carry the request's fidelity level)
         """
         self.max_size = max_size or config.get('cache', 'maximum_cache_size_entries')
         self.default_ttl = default_ttl or config.get('cache', 'default_ttl_for_cache_entries_seconds')
+        self.max_bytes = config.get('cache', 'maximum_cache_size_bytes')
+        self.max_entry_bytes = int(self.max_bytes * config.get('cache', 'maximum_entry_size_fraction'))
+        self.sweep_interval = config.get('cache', 'sweep_interval_seconds')
         self._cache = OrderedDict()
+        self._bytes = 0
+        self._namespaces: Dict[str, Dict[str, int]] = {}
+        self._sweeper_pid: Optional[int] = None
+        self._sweeper_stop = threading.Event()
+        self._lock = threading.RLock()
+        self._scope = scope
+        self._background = background
+        self._in_flight: Dict[str, _Flight] = {}
+        self._refresh_executor: Optional[ThreadPoolExecutor] = None
+        self._refresh_executor_pid: Optional[int] = None
+
+        self.stale_while_revalidate = config.get('cache', 'stale_while_revalidate_enabled')
+        self.stale_window_fraction = config.get('cache', 'stale_window_fraction_of_ttl')
+        self.negative_ttl = config.get('cache', 'negative_result_ttl_seconds')
+        self.single_flight_wait = config.get('cache', 'single_flight_wait_seconds')
+        self.refresh_workers = config.get('cache', 'background_refresh_workers')
         self._stats = {
             'hits': 0,
             'misses': 0,
             'evictions': 0,
-            'expirations': 0
+            'expirations': 0,
+            'stale_hits': 0,
+            'refreshes': 0,
+            'refresh_errors': 0,
+            'coalesced': 0,
+            'negative_hits': 0,
+            'negative_sets': 0,
+            'oversize_rejections': 0,
+            'sweeps': 0,
+            'l2_hits': 0,
+            'l2_writes': 0,
+            'l2_errors': 0
         }
-    
-    def get(self, key: str) -> Optional[Any]:
+
+        # L2: shared across workers and worker recycling
+        self._shared = None
+        if shared is None:
+            shared = config.get('cache', 'shared_tier_enabled')
+        if shared:
+            # Default: a per-user private directory, never a shared temp file
+            path = os.environ.get('BRAIN_SHARED_CACHE_PATH') or config.get('cache', 'shared_tier_path') or \
+                os.path.join(tempfile.gettempdir(), f'pump_brain_cache-{os.getuid()}', 'brain_cache.sqlite3')
+            try:
+                self._shared = SharedCacheStore(
+                    path,
+                    config.get('cache', 'shared_tier_maximum_entries'),
+                    config.get('cache', 'shared_tier_prune_interval_writes'),
+                    config.get('cache', 'shared_tier_busy_timeout_seconds'),
+                    config.get('cache', 'shared_tier_compression_level')
+                )
+            except OSError as e:
+                logger.warning(f"[SHARED CACHE] Shared tier disabled, unusable store {path}: {e}")
+
+    def _shared_key(self, key: Hashable) -> str:
+        """Key as stored in the shared tier."""
+        return f"{self._scope()}:{key}" if self._scope else key
+
+    def _shared_call(self, operation: str, *args):
+        """Run a shared-tier operation; failures count as errors and never raise."""
+        try:
+            return getattr(self._shared, operation)(*args)
+        except Exception as e:
+            with self._lock:
+                self._stats['l2_errors'] += 1
+            logger.debug(f"[SHARED CACHE] {operation} failed: {e}")
+            return None
+
+    def _lookup(self, key: Hashable, now: float, allow_stale: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Find an L1 entry (caller holds the lock).
+
+        Expired entries are kept until their stale window closes so that
+        get_or_compute can serve them while refreshing.
+
+        Returns:
+            Fresh entry, stale entry when allow_stale, else None
+        """
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        if now > entry['stale_until']:
+            self._remove(key)
+            self._stats['expirations'] += 1
+            return None
+        if now > entry['expires_at'] and not allow_stale:
+            return None
+        # Move to end (LRU)
+        self._cache.move_to_end(key)
+        return entry
+
+    def _lookup_shared(self, key: Hashable) -> Optional[Dict[str, Any]]:
+        """Fresh L2 entry promoted into L1, or None."""
+        entry = self._shared_call('get', self._shared_key(key))
+        if entry is None:
+            return None
+        entry['stale_until'] = entry['expires_at']
+        entry['negative'] = False
+        entry['size'] = estimate_size(entry['value'])
+        with self._lock:
+            self._store(key, entry)
+            self._record(key, 'hits')
+            self._stats['l2_hits'] += 1
+        return entry
+
+    def get(self, key: Hashable, shared: bool = True) -> Optional[Any]:
         """
         Get value from cache.
-        
+
         Args:
             key: Cache key
-        
+            shared: Fall through to the shared tier on an L1 miss
+
         Returns:
             Cached value or None if not found/expired
         """
-        if key in self._cache:
-            entry = self._cache[key]
-            
-            # Check expiration
-            if time.time() > entry['expires_at']:
-                # Expired
-                del self._cache[key]
-                self._stats['expirations'] += 1
-                self._stats['misses'] += 1
-                return None
-            
-            # Move to end (LRU)
-            self._cache.move_to_end(key)
-            self._stats['hits'] += 1
-            return entry['value']
-        
-        self._stats['misses'] += 1
+        with self._lock:
+            entry = self._lookup(key, time.time())
+            if entry is not None:
+                self._record(key, 'hits')
+                return entry['value']
+
+        # L1 miss: another worker (or a recycled one) may have computed it
+        if shared and self._shared is not None:
+            entry = self._lookup_shared(key)
+            if entry is not None:
+                return entry['value']
+
+        with self._lock:
+            self._record(key, 'misses')
         return None
-    
-    def set(self, key: str, value: Any, ttl: Optional[int] = None):
+
+    def is_negative(self, key: Hashable) -> bool:
         """
-        Set value in cache.
-        
+        Check for a cached negative result (L1 only).
+
         Args:
             key: Cache key
-            value: Value to cache
+
+        Returns:
+            True if a fresh negative entry exists
+        """
+        with self._lock:
+            entry = self._lookup(key, time.time())
+            if entry is not None and entry['negative']:
+                self._stats['negative_hits'] += 1
+                return True
+        return False
+
+    def set_negative(self, key: Hashable, value: Any = None):
+        """
+        Cache a "not found" / "no result" outcome for the short negative TTL.
+
+        Negative entries stay in this worker's L1 and are never served stale.
+
+        Args:
+            key: Cache key
+            value: Negative value to return on hits (e.g. None or [])
+        """
+        now = time.time()
+        size = estimate_size(value)
+        with self._lock:
+            self._store(key, {
+                'value': value,
+                'expires_at': now + self.negative_ttl,
+                'stale_until': now + self.negative_ttl,
+                'created_at': now,
+                'negative': True,
+                'size': size
+            })
+            self._stats['negative_sets'] += 1
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any], ttl: Optional[int] = None,
+                       negative: Optional[Callable[[Any], bool]] = None, shared: bool = True,
+                       cacheable: Optional[Callable[[Any], bool]] = None) -> Any:
+        """
+        Get a cached value, computing it at most once across concurrent callers.
+
+        A fresh entry is returned directly. An expired entry still inside its
+        stale window is returned as-is while one background refresh replaces
+        it. On a miss, the first caller computes and the others wait for its
+        result (single-flight).
+
+        Args:
+            key: Cache key
+            compute: Produces the value on a miss or refresh
             ttl: Time-to-live in seconds (optional)
+            negative: Predicate marking a value as a negative result, cached
+                for the short negative TTL instead of ttl
+            shared: Also use the shared tier for positive results
+            cacheable: Predicate a computed value must pass to be stored
+                (e.g. to keep deadline-truncated results out of the cache)
+
+        Returns:
+            Cached or computed value
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._lookup(key, now, allow_stale=self.stale_while_revalidate)
+            if entry is not None:
+                if entry['negative']:
+                    self._stats['negative_hits'] += 1
+                self._record(key, 'hits')
+                if now > entry['expires_at']:
+                    self._stats['stale_hits'] += 1
+                    self._schedule_refresh(key, compute, ttl, negative, shared, cacheable)
+                return entry['value']
+
+        if shared and self._shared is not None:
+            entry = self._lookup_shared(key)
+            if entry is not None:
+                return entry['value']
+
+        with self._lock:
+            self._record(key, 'misses')
+        return self._compute_once(key, compute, ttl, negative, shared, cacheable)
+
+    def _compute_once(self, key: Hashable, compute: Callable[[], Any], ttl: Optional[int],
+                      negative: Optional[Callable[[Any], bool]], shared: bool,
+                      cacheable: Optional[Callable[[Any], bool]] = None) -> Any:
+        """Run compute as the single flight for key, or wait for the one in progress."""
+        with self._lock:
+            flight = self._in_flight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._in_flight[key] = _Flight()
+            else:
+                self._stats['coalesced'] += 1
+
+        if not leader:
+            if flight.event.wait(self.single_flight_wait) and flight.done:
+                if flight.error is not None:
+                    raise flight.error
+                return flight.value
+            # The leader is taking too long - do not queue behind it forever
+            logger.warning(f"[BRAIN CACHE] Single-flight wait timed out for {key}, computing directly")
+            return compute()
+
+        try:
+            value = compute()
+            if cacheable is not None and not cacheable(value):
+                logger.debug(f"[BRAIN CACHE] Result for {key} not cacheable, returned uncached")
+            elif negative is not None and negative(value):
+                self.set_negative(key, value)
+            else:
+                self.set(key, value, ttl=ttl, shared=shared)
+            flight.value = value
+            return value
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            flight.done = True
+            with self._lock:
+                self._in_flight.pop(key, None)
+            flight.event.set()
+
+    def _schedule_refresh(self, key: Hashable, compute: Callable[[], Any], ttl: Optional[int],
+                          negative: Optional[Callable[[Any], bool]], shared: bool,
+                          cacheable: Optional[Callable[[Any], bool]]):
+        """Refresh a stale entry in the background unless one is already running (caller holds the lock)."""
+        if key in self._in_flight:
+            return
+        if self._refresh_executor is None or self._refresh_executor_pid != os.getpid():
+            # Executor threads do not survive a fork; each worker owns its pool
+            self._refresh_executor = ThreadPoolExecutor(max_workers=self.refresh_workers,
+                                                        thread_name_prefix='brain-cache-refresh')
+            self._refresh_executor_pid = os.getpid()
+        task = self._background(compute) if self._background else compute
+        self._stats['refreshes'] += 1
+
+        def refresh():
+            try:
+                self._compute_once(key, task, ttl, negative, shared, cacheable)
+            except Exception as e:
+                # Keep serving the stale value until its window closes
+                with self._lock:
+                    self._stats['refresh_errors'] += 1
+                logger.warning(f"[BRAIN CACHE] Background refresh failed for {key}: {e}")
+
+        self._refresh_executor.submit(refresh)
+
+    def _namespace_stats(self, key: Hashable) -> Dict[str, int]:
+        """Usage counters of the key's namespace (caller holds the lock)."""
+        namespace = key_namespace(key)
+        usage = self._namespaces.get(namespace)
+        if usage is None:
+            usage = self._namespaces[namespace] = {'entries': 0, 'bytes': 0, 'hits': 0, 'misses': 0, 'evictions': 0}
+        return usage
+
+    def _record(self, key: Hashable, outcome: str):
+        """Count a hit or miss globally and for the key's namespace (caller holds the lock)."""
+        self._stats[outcome] += 1
+        self._namespace_stats(key)[outcome] += 1
+
+    def _remove(self, key: Hashable) -> Dict[str, Any]:
+        """Remove an L1 entry and release its bytes (caller holds the lock)."""
+        entry = self._cache.pop(key)
+        self._bytes -= entry['size']
+        usage = self._namespace_stats(key)
+        usage['entries'] -= 1
+        usage['bytes'] -= entry['size']
+        return entry
+
+    def _store(self, key: Hashable, entry: Dict[str, Any]) -> bool:
         """
-        # Check size limit
-        if len(self._cache) >= self.max_size:
+        Insert an L1 entry, evicting least recently used entries until both the
+        entry and byte limits hold (caller holds the lock).
+
+        Returns:
+            False if the entry alone exceeds the per-entry byte limit
+        """
+        if key in self._cache:
+            self._remove(key)
+        if entry['size'] > self.max_entry_bytes:
+            # One result must not flush the whole cache
+            self._stats['oversize_rejections'] += 1
+            logger.debug(f"[BRAIN CACHE] Not caching {key} in memory: ~{entry['size']} bytes")
+            return False
+        while self._cache and (len(self._cache) >= self.max_size or
+                               self._bytes + entry['size'] > self.max_bytes):
             # Evict oldest (LRU)
             oldest_key = next(iter(self._cache))
-            del self._cache[oldest_key]
+            self._remove(oldest_key)
             self._stats['evictions'] += 1
-        
-        # Store with expiration
+            self._namespace_stats(oldest_key)['evictions'] += 1
+        self._cache[key] = entry
+        self._bytes += entry['size']
+        usage = self._namespace_stats(key)
+        usage['entries'] += 1
+        usage['bytes'] += entry['size']
+        return True
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[int] = None, shared: bool = True):
+        """
+        Set value in cache.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Time-to-live in seconds (optional)
+            shared: Also write the shared tier; pass False for mutable
+                per-process objects that must not be snapshotted
+        """
+        # Store with expiration; past it the entry may still be served stale
         ttl = ttl or self.default_ttl
-        self._cache[key] = {
+        now = time.time()
+        entry = {
             'value': value,
-            'expires_at': time.time() + ttl,
-            'created_at': time.time()
+            'expires_at': now + ttl,
+            'stale_until': now + ttl * (1 + self.stale_window_fraction),
+            'created_at': now,
+            'negative': False,
+            'size': estimate_size(value)
         }
-    
-    def delete(self, key: str) -> bool:
+        with self._lock:
+            self._store(key, entry)
+        self._ensure_sweeper()
+
+        if shared and self._shared is not None:
+            if self._shared_call('set', self._shared_key(key), value, entry['expires_at'], now):
+                with self._lock:
+                    self._stats['l2_writes'] += 1
+
+    def delete(self, key: Hashable) -> bool:
         """
         Delete entry from cache.
-        
+
         Args:
             key: Cache key
-        
+
         Returns:
             True if deleted, False if not found
         """
-        if key in self._cache:
-            del self._cache[key]
-            return True
+        if self._shared is not None:
+            self._shared_call('delete', self._shared_key(key))
+        with self._lock:
+            if key in self._cache:
+                self._remove(key)
+                return True
         return False
-    
+
     def clear(self):
         """Clear all cache entries."""
-        self._cache.clear()
+        with self._lock:
+            self._cache.clear()
+            self._bytes = 0
+            for usage in self._namespaces.values():
+                usage['entries'] = 0
+                usage['bytes'] = 0
+        if self._shared is not None:
+            self._shared_call('clear')
         logger.info("Cache cleared")
-    
+
     def get_stats(self) -> Dict[str, Any]:
         """
         Get cache statistics.
-        
+
         Returns:
             Cache statistics dictionary
         """
-        total_requests = self._stats['hits'] + self._stats['misses']
-        hit_rate = (self._stats['hits'] / total_requests * config.get('cache', 'percentage_conversion_factor_for_hit_rate')) if total_requests > 0 else 0
-        
+        with self._lock:
+            stats = dict(self._stats)
+            size = len(self._cache)
+            size_bytes = self._bytes
+            namespaces = {name: dict(usage) for name, usage in self._namespaces.items()}
+        total_requests = stats['hits'] + stats['misses']
+        hit_rate = (stats['hits'] / total_requests * config.get('cache', 'percentage_conversion_factor_for_hit_rate')) if total_requests > 0 else 0
+
         return {
-            'size': len(self._cache),
+            'size': size,
             'max_size': self.max_size,
-            'hits': self._stats['hits'],
-            'misses': self._stats['misses'],
+            'bytes': size_bytes,
+            'max_bytes': self.max_bytes,
+            'max_entry_bytes': self.max_entry_bytes,
+            'hits': stats['hits'],
+            'misses': stats['misses'],
             'hit_rate': round(hit_rate, config.get('cache', 'decimal_places_for_rounding_hit_rate')),
-            'evictions': self._stats['evictions'],
-            'expirations': self._stats['expirations']
+            'evictions': stats['evictions'],
+            'expirations': stats['expirations'],
+            'stale_hits': stats['stale_hits'],
+            'refreshes': stats['refreshes'],
+            'refresh_errors': stats['refresh_errors'],
+            'coalesced': stats['coalesced'],
+            'negative_hits': stats['negative_hits'],
+            'negative_sets': stats['negative_sets'],
+            'in_flight': len(self._in_flight),
+            'oversize_rejections': stats['oversize_rejections'],
+            'sweeps': stats['sweeps'],
+            'namespaces': namespaces,
+            'shared_tier': {
+                'enabled': self._shared is not None,
+                'path': self._shared.path if self._shared else None,
+                'entries': self._shared_call('count') if self._shared else 0,
+                'hits': stats['l2_hits'],
+                'writes': stats['l2_writes'],
+                'errors': stats['l2_errors']
+            }
         }
-    
+
     def cleanup_expired(self):
         """Remove expired entries."""
         current_time = time.time()
-        expired_keys = []
-        
-        for key, entry in self._cache.items():
-            if current_time > entry['expires_at']:
-                expired_keys.append(key)
-        
-        for key in expired_keys:
-            del self._cache[key]
-            self._stats['expirations'] += 1
-        
+        with self._lock:
+            expired_keys = [key for key, entry in self._cache.items() if current_time > entry['stale_until']]
+            for key in expired_keys:
+                self._remove(key)
+                self._stats['expirations'] += 1
+
+        if self._shared is not None:
+            self._shared_call('prune')
+
         if expired_keys:
             logger.debug(f"Cleaned up {len(expired_keys)} expired cache entries")
-    
+
+    def _ensure_sweeper(self):
+        """Start the sweeper thread of this process if it is not running."""
+        if not self.sweep_interval or self._sweeper_pid == os.getpid():
+            return
+        with self._lock:
+            if self._sweeper_pid == os.getpid():
+                return
+            # Threads do not survive a fork; each worker starts its own sweeper
+            self._sweeper_pid = os.getpid()
+        threading.Thread(target=self._sweep, name='brain-cache-sweeper', daemon=True).start()
+
+    def _sweep(self):
+        """Purge expired entries every sweep_interval seconds until stopped."""
+        while not self._sweeper_stop.wait(self.sweep_interval):
+            try:
+                self.cleanup_expired()
+                with self._lock:
+                    self._stats['sweeps'] += 1
+            except Exception as e:
+                logger.warning(f"[BRAIN CACHE] Sweep failed: {e}")
+
+    def stop_sweeper(self):
+        """Stop the sweeper thread (it exits at its next wake-up)."""
+        self._sweeper_stop.set()
+
     @staticmethod
-    def make_key(*args, **kwargs) -> str:
+    def make_key(*args, **kwargs) -> tuple:
         """
-        Generate cache key from arguments.
-        
+        Generate a typed cache key from arguments.
+
+        The key is a tuple of frozen arguments (see freeze); a leading string
+        argument names the key's namespace for per-namespace statistics.
+        Keyword arguments are appended as one key-sorted item tuple.
+
         Args:
             *args: Positional arguments
             **kwargs: Keyword arguments
-        
+
         Returns:
-            Cache key string
+            Hashable cache key
         """
-        # Create a consistent string representation
-        key_data = {
-            'args': args,
-            'kwargs': kwargs
-        }
-        
-        # Hash for consistent key
-        key_str = json.dumps(key_data, sort_keys=True, default=str)
-        key_hash = hashlib.md5(key_str.encode()).hexdigest()
-        
-        return key_hash
\ No newline at end of file
+        decimals = _KEY_FLOAT_DECIMALS
+        key = tuple([freeze(arg, decimals) for arg in args])
+        if kwargs:
+            key += (freeze(kwargs, decimals),)
+        return key
@@ -8,6 +8,7 @@ import logging
 from typing import Dict, List, Any, Optional, Tuple
 import numpy as np
 from .config_manager import config
+from .request_context import get_request_context
 
 logger = logging.getLogger(__name__)
 
@@ -433,6 +434,7 @@ class ChartIntelligence:
                 logger.warning(f"[CHART DEBUG] {pump_code}: No BEP data available - Flow: {bep_flow}, Head: {bep_head}")
             
             # Process curves - BRAIN HANDLES ALL TRANSFORMATIONS
+            request_context = get_request_context()
             for i, curve in enumerate(curves):
                 # Brain generates intelligent display labels
                 impeller_mm = curve.get('impeller_diameter_mm', 0)
@@ -446,47 +448,17 @@ class ChartIntelligence:
                 elif i == 0:  # Default to first curve if no match
                     is_selected = True
                 
-                # CRITICAL FIX: Extract performance points into separate arrays
-                performance_points = curve.get('performance_points', [])
-                
-                # Initialize arrays for chart data
-                flow_data = []
-                head_data = []
-                efficiency_data = []
-                power_data = []
-                npshr_data = []
-                
-                # Generate power curves using Brain performance analysis
-                # This ensures consistency with pump selection power values
-                for point in performance_points:
-                    flow_m3hr = point.get('flow_m3hr', 0)
-                    head_m = point.get('head_m', 0)
-                    efficiency_pct = point.get('efficiency_pct', 0)
-                    npshr_m = point.get('npshr_m', 0)
-                    
-                    # Skip points with zero flow for better curve quality
-                    if flow_m3hr <= 0:
-                        continue
-                    
-                    # Use Brain's hydraulic power calculation for consistency with pump selection
-                    power_kw = point.get('power_kw')
-                    if power_kw is None and efficiency_pct > 20 and flow_m3hr > 0 and head_m > 0:
-                        # Use same hydraulic calculation as Brain performance analysis
-                        flow_m3s = flow_m3hr / 3600  # Convert to m³/s
-                        rho = 1000  # kg/m³ for water (hardcoded for chart display) 
-                        g = 9.81    # m/s² (hardcoded for chart display)
-                        power_kw = (rho * g * flow_m3s * head_m) / (efficiency_pct / 100 * 1000)
-                        logger.debug(f"Brain hydraulic power for {pump_code} curve {i}: {power_kw:.2f}kW")
-                    elif power_kw is None or power_kw <= 0:
-                        # Skip invalid power points to improve curve quality
-                        continue
-                    
-                    # Only add valid points to all arrays together
-                    flow_data.append(flow_m3hr)
-                    head_data.append(head_m)
-                    efficiency_data.append(efficiency_pct)
-                    npshr_data.append(npshr_m)
-                    power_data.append(power_kw)
+                # Curve series are derived once per request and reused by
+                # every chart/report layer that renders this pump
+                series = request_context.memoize(
+                    'chart_curve_series', (pump_code, i, impeller_mm),
+                    lambda: self._build_curve_series(pump_code, i, curve)
+                )
+                flow_data = series['flow_data']
+                head_data = series['head_data']
+                efficiency_data = series['efficiency_data']
+                power_data = series['power_data']
+                npshr_data = series['npshr_data']
                 
                 chart_data['curves'].append({
                     'curve_index': i,
@@ -556,6 +528,119 @@ class ChartIntelligence:
             logger.error(f"Error in Brain chart payload generation: {str(e)}")
             return {}
     
+    def generate_performance_map_payload(self, pump: Dict[str, Any], flow: Optional[float] = None,
+                                         head: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Generate trimmed-impeller performance map payload for frontend plotting.
+        
+        Args:
+            pump: Complete pump data from repository
+            flow: Optional duty flow in m³/hr to mark on the map
+            head: Optional duty head in meters to mark on the map
+            
+        Returns:
+            Map payload (surfaces, iso-efficiency contours, axis ranges)
+        """
+        try:
+            performance_map = self.brain.performance_map.get_map(pump)
+            if not performance_map:
+                return {}
+            
+            payload = self.brain.performance_map.to_payload(performance_map)
+            
+            heads = performance_map['head_surface_m']
+            flows = performance_map['flow_grid_m3hr']
+            margin = self.margin_percent['web']
+            payload['axis_ranges'] = {
+                'flow': {'min': 0, 'max': self._round_up_nice(float(flows[-1]) * (1 + margin))},
+                'head': {'min': 0, 'max': self._round_up_nice(float(np.nanmax(heads)) * (1 + margin))}
+            }
+            
+            # Duty point read off the cached map surfaces (approximate, no re-evaluation)
+            if flow and head and config.get('performance_map', 'annotate_duty_point_on_map'):
+                payload['duty_point'] = self.brain.performance_map.approximate_at_point(pump, flow, head)
+            
+            logger.info(f"Brain generated performance map payload for {pump.get('pump_code')} "
+                        f"with {len(payload.get('iso_efficiency_contours', []))} contours")
+            return payload
+            
+        except Exception as e:
+            logger.error(f"Error in Brain performance map payload generation: {str(e)}")
+            return {}
+    
+    def _build_curve_series(self, pump_code: str, curve_index: int,
+                            curve: Dict[str, Any]) -> Dict[str, List[float]]:
+        """
+        Extract plot arrays for one curve, deriving missing power values.
+        
+        Args:
+            pump_code: Pump code (for logging)
+            curve_index: Index of the curve within the pump
+            curve: Curve data with performance_points
+            
+        Returns:
+            Dictionary of flow/head/efficiency/power/npshr arrays
+        """
+        i = curve_index
+        # CRITICAL FIX: Extract performance points into separate arrays
+        performance_points = curve.get('performance_points', [])
+        
+        # Initialize arrays for chart data
+        flow_data = []
+        head_data = []
+        efficiency_data = []
+        power_data = []
+        npshr_data = []
+        
+        # Generate power curves using Brain performance analysis
+        # This ensures consistency with pump selection power values
+        for point in performance_points:
+            flow_m3hr = point.get('flow_m3hr', 0)
+            head_m = point.get('head_m', 0)
+            efficiency_pct = point.get('efficiency_pct', 0)
+            npshr_m = point.get('npshr_m', 0)
+            
+            # Skip points with zero flow for better curve quality
+            if flow_m3hr <= 0:
+                continue
+            
+            # Use Brain's hydraulic power calculation for consistency with pump selection
+            power_kw = point.get('power_kw')
+            if power_kw is None and efficiency_pct > 20 and flow_m3hr > 0 and head_m > 0:
+                # Use same hydraulic calculation as Brain performance analysis
+                flow_m3s = flow_m3hr / 3600  # Convert to m³/s
+                rho = 1000  # kg/m³ for water (hardcoded for chart display) 
+                g = 9.81    # m/s² (hardcoded for chart display)
+                power_kw = (rho * g * flow_m3s * head_m) / (efficiency_pct / 100 * 1000)
+                logger.debug(f"Brain hydraulic power for {pump_code} curve {i}: {power_kw:.2f}kW")
+            elif power_kw is None or power_kw <= 0:
+                # Skip invalid power points to improve curve quality
+                continue
+            
+            # Only add valid points to all arrays together
+            flow_data.append(flow_m3hr)
+            head_data.append(head_m)
+            efficiency_data.append(efficiency_pct)
+            npshr_data.append(npshr_m)
+            power_data.append(power_kw)
+        
+        # Chart decimation under reduced fidelity (end points always kept)
+        max_points = self.brain.load_control.setting('chart_max_points')
+        if max_points and len(flow_data) > max_points:
+            keep = np.unique(np.linspace(0, len(flow_data) - 1, max_points).round().astype(int))
+            flow_data, head_data, efficiency_data, npshr_data, power_data = (
+                [series[k] for k in keep]
+                for series in (flow_data, head_data, efficiency_data, npshr_data, power_data)
+            )
+        
+        return {
+            'flow_data': flow_data,
+            'head_data': head_data,
+            'efficiency_data': efficiency_data,
+            'power_data': power_data,
+            'npshr_data': npshr_data
+        }
+    
     def _get_efficiency_zone(self, efficiency: float) -> str:
         """Get efficiency zone description."""
         if efficiency >= 85:
@@ -138,6 +138,69 @@ class ConfigManager:
         # Scoring utils constants (to be added when found)
         self.scoring_utils = self._extract_values('scoring_utils_constants')
 
+        # Analytic curve fit constants
+        self.curve_fits = self._extract_values('curve_fits_constants')
+
+        # Performance map constants
+        self.performance_map = self._extract_values('performance_map_constants')
+
+        # Batched evaluation constants
+        self.batch_evaluator = self._extract_values('batch_evaluator_constants')
+
+        # Duty cycle selection constants
+        self.duty_cycle = self._extract_values('duty_cycle_constants')
+
+        # Energy simulation constants
+        self.energy_simulation = self._extract_values('energy_simulation_constants')
+
+        # Multi-pump configuration constants
+        self.multi_pump = self._extract_values('multi_pump_constants')
+
+        # Combined speed and trim optimizer constants
+        self.speed_trim_optimizer = self._extract_values('speed_trim_optimizer_constants')
+
+        # Stocked impeller diameter constants
+        self.stocked_diameters = self._extract_values('stocked_diameters_constants')
+
+        # Virtual catalog (speed/stage variant) constants
+        self.virtual_catalog = self._extract_values('virtual_catalog_constants')
+
+        # Precomputed hydraulic profile constants
+        self.hydraulic_profile = self._extract_values('hydraulic_profile_constants')
+
+        # Operating envelope polygon constants
+        self.operating_envelope = self._extract_values('operating_envelope_constants')
+
+        # Coverage query constants
+        self.coverage_query = self._extract_values('coverage_query_constants')
+
+        # Pareto selection constants
+        self.pareto_selection = self._extract_values('pareto_selection_constants')
+
+        # Selection session (incremental re-ranking) constants
+        self.selection_session = self._extract_values('selection_session_constants')
+
+        # Warm-started re-selection constants
+        self.warm_start = self._extract_values('warm_start_constants')
+
+        # Family index (series/type pruning) constants
+        self.family_index = self._extract_values('family_index_constants')
+
+        # Duty-point sensitivity analysis constants
+        self.sensitivity_analysis = self._extract_values('sensitivity_analysis_constants')
+
+        # Nearest-feasible duty suggestion constants
+        self.duty_suggestions = self._extract_values('duty_suggestions_constants')
+
+        # Curve-shape similarity constants
+        self.curve_similarity = self._extract_values('curve_similarity_constants')
+
+        # Selection latency budget constants
+        self.selection_deadline = self._extract_values('selection_deadline_constants')
+
+        # Load-aware fidelity control constants
+        self.load_control = self._extract_values('load_control_constants')
+
     def _validate_required_keys(self):
         """Validate that all required configuration keys are present"""
         # Basic validation - check that main sections exist and have some content
@@ -338,6 +401,27 @@ class ConfigManager:
         self.performance_validation = {}
         self.bep_calculator = {}
         self.scoring_utils = {}
+        self.curve_fits = {}
+        self.performance_map = {}
+        self.batch_evaluator = {}
+        self.duty_cycle = {}
+        self.energy_simulation = {}
+        self.multi_pump = {}
+        self.speed_trim_optimizer = {}
+        self.stocked_diameters = {}
+        self.virtual_catalog = {}
+        self.hydraulic_profile = {}
+        self.operating_envelope = {}
+        self.coverage_query = {}
+        self.pareto_selection = {}
+        self.selection_session = {}
+        self.warm_start = {}
+        self.family_index = {}
+        self.sensitivity_analysis = {}
+        self.duty_suggestions = {}
+        self.curve_similarity = {}
+        self.selection_deadline = {}
+        self.load_control = {}
 
     def get(self, section: str, key: str) -> Any:
         """
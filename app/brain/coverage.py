@@ -0,0 +1,292 @@
+"""
+Coverage Module
+===============
+Which pumps can serve a Q-H duty region, answered from envelope polygons
+"""
+
+import math
+import logging
+from typing import Dict, List, Any, Optional, Tuple, Set
+from .operating_envelope import OperatingEnvelope, point_in_polygon
+from .config_manager import config
+
+logger = logging.getLogger(__name__)
+
+# Smallest flow/head placed in the log-spaced index
+_LOG_FLOOR = 1e-3
+
+
+def polygon_area(polygon: List[List[float]]) -> float:
+    """Unsigned shoelace area of a polygon."""
+    area = 0.0
+    n = len(polygon)
+    for i in range(n):
+        x1, y1 = polygon[i]
+        x2, y2 = polygon[(i + 1) % n]
+        area += x1 * y2 - x2 * y1
+    return abs(area) / 2.0
+
+
+def vertical_intervals(polygon: List[List[float]], x: float) -> List[Tuple[float, float]]:
+    """
+    Intervals of y inside a polygon along the vertical line at x.
+
+    Args:
+        polygon: Ring of [x, y] vertices
+        x: Line position
+
+    Returns:
+        Sorted, non-overlapping (y_low, y_high) intervals
+    """
+    ys = []
+    n = len(polygon)
+    for i in range(n):
+        x1, y1 = polygon[i]
+        x2, y2 = polygon[(i + 1) % n]
+        if x1 == x2 or not (min(x1, x2) < x <= max(x1, x2)):
+            continue
+        ys.append(y1 + (x - x1) * (y2 - y1) / (x2 - x1))
+    ys.sort()
+    return [(ys[k], ys[k + 1]) for k in range(0, len(ys) - 1, 2)]
+
+
+def intersection_length(a: List[Tuple[float, float]], b: List[Tuple[float, float]]) -> float:
+    """Total length of the overlap of two sorted interval lists."""
+    i = j = 0
+    total = 0.0
+    while i < len(a) and j < len(b):
+        low = max(a[i][0], b[j][0])
+        high = min(a[i][1], b[j][1])
+        if high > low:
+            total += high - low
+        if a[i][1] < b[j][1]:
+            i += 1
+        else:
+            j += 1
+    return total
+
+
+def polygon_intersection_area(region: List[List[float]], polygon: List[List[float]],
+                              subdivisions: int) -> float:
+    """
+    Area of the intersection of two simple polygons (either may be non-convex).
+
+    The overlap length along a vertical line is piecewise linear between
+    vertex flows, so it is integrated slab by slab with the midpoint rule;
+    sub-slabs absorb edge crossings that fall inside a slab.
+
+    Args:
+        region: Query polygon
+        polygon: Envelope polygon
+        subdivisions: Sub-slabs per slab
+
+    Returns:
+        Intersection area
+    """
+    x_low = max(min(x for x, _ in region), min(x for x, _ in polygon))
+    x_high = min(max(x for x, _ in region), max(x for x, _ in polygon))
+    if x_high <= x_low:
+        return 0.0
+
+    breaks = sorted({x_low, x_high} | {x for x, _ in region + polygon if x_low < x < x_high})
+    area = 0.0
+    for left, right in zip(breaks[:-1], breaks[1:]):
+        width = (right - left) / subdivisions
+        for k in range(subdivisions):
+            x = left + (k + 0.5) * width
+            area += intersection_length(vertical_intervals(region, x), vertical_intervals(polygon, x)) * width
+    return area
+
+
+class EnvelopeIndex:
+    """Uniform grid over log flow / log head bounding boxes of pump envelopes"""
+
+    def __init__(self, cell_width: float):
+        """
+        Args:
+            cell_width: Cell size in decades
+        """
+        self.cell_width = cell_width
+        self.entries: List[Dict[str, Any]] = []
+        self._cells: Dict[Tuple[int, int], List[int]] = {}
+
+    def _cell(self, value: float) -> int:
+        return math.floor(math.log10(max(value, _LOG_FLOOR)) / self.cell_width)
+
+    def add(self, pump: Dict[str, Any], envelope: Dict[str, Any]):
+        """Index one pump envelope by its bounding box."""
+        heads = [h for _, h in envelope['polygon']]
+        bbox = (envelope['flow_min_m3hr'], envelope['flow_max_m3hr'], min(heads), max(heads))
+        index = len(self.entries)
+        self.entries.append({'pump': pump, 'envelope': envelope, 'bbox': bbox})
+        for qi in range(self._cell(bbox[0]), self._cell(bbox[1]) + 1):
+            for hi in range(self._cell(bbox[2]), self._cell(bbox[3]) + 1):
+                self._cells.setdefault((qi, hi), []).append(index)
+
+    def query(self, flow_min: float, flow_max: float, head_min: float, head_max: float) -> Set[int]:
+        """
+        Entries whose bounding box overlaps a rectangle.
+
+        Returns:
+            Set of entry indices
+        """
+        found = set()
+        for qi in range(self._cell(flow_min), self._cell(flow_max) + 1):
+            for hi in range(self._cell(head_min), self._cell(head_max) + 1):
+                found.update(self._cells.get((qi, hi), ()))
+        return {i for i in found
+                if self.entries[i]['bbox'][0] <= flow_max and self.entries[i]['bbox'][1] >= flow_min and
+                self.entries[i]['bbox'][2] <= head_max and self.entries[i]['bbox'][3] >= head_min}
+
+
+class CoverageQuery:
+    """Finds pumps whose trimmed operating envelope covers a duty region"""
+
+    def __init__(self, brain):
+        """
+        Initialize with reference to main Brain.
+
+        Args:
+            brain: Parent PumpBrain instance
+        """
+        self.brain = brain
+        self.cell_width = config.get('coverage_query', 'index_cell_log_width')
+        self.subdivisions = config.get('coverage_query', 'slab_subdivisions')
+        self.full_fraction = config.get('coverage_query', 'full_coverage_fraction')
+        self.default_max_results = config.get('coverage_query', 'default_maximum_results')
+        self.max_vertices = config.get('coverage_query', 'maximum_region_vertices')
+
+        # Spatial index, rebuilt when the catalog version changes
+        self._index: Optional[EnvelopeIndex] = None
+        self._index_version = None
+
+    def get_index(self) -> EnvelopeIndex:
+        """
+        Get the spatial index of catalog envelopes for the loaded catalog.
+
+        Returns:
+            EnvelopeIndex
+        """
+        version = self.brain.get_catalog_version()
+        if self._index is None or version != self._index_version:
+            index = EnvelopeIndex(self.cell_width)
+            for pump in self.brain.repository.get_pump_models():
+                envelope = OperatingEnvelope.get_envelope(pump)
+                if envelope:
+                    index.add(pump, envelope)
+            self._index = index
+            self._index_version = version
+            logger.info(f"[COVERAGE] Indexed {len(index.entries)} envelopes")
+        return self._index
+
+    def normalize_region(self, region: Dict[str, Any]) -> List[List[float]]:
+        """
+        Turn a rectangle or polygon request into a polygon.
+
+        Args:
+            region: {'flow_min', 'flow_max', 'head_min', 'head_max'} or
+                {'polygon': [[flow, head], ...]}
+
+        Returns:
+            Polygon as [[flow, head], ...]
+        """
+        if region.get('polygon'):
+            polygon = [[float(q), float(h)] for q, h in region['polygon']]
+            if not 3 <= len(polygon) <= self.max_vertices:
+                raise ValueError(f"Region polygon needs 3 to {self.max_vertices} vertices")
+        else:
+            try:
+                q1, q2 = float(region['flow_min']), float(region['flow_max'])
+                h1, h2 = float(region['head_min']), float(region['head_max'])
+            except (KeyError, TypeError):
+                raise ValueError("Region requires flow_min, flow_max, head_min and head_max, or a polygon")
+            if not (0 < q1 < q2 and 0 < h1 < h2):
+                raise ValueError("Region bounds must be positive with min < max")
+            polygon = [[q1, h1], [q2, h1], [q2, h2], [q1, h2]]
+
+        if any(q <= 0 or h <= 0 for q, h in polygon):
+            raise ValueError("Region vertices must have positive flow and head")
+        if polygon_area(polygon) <= 0:
+            raise ValueError("Region has zero area")
+        return polygon
+
+    def find_covering_pumps(self, region: Dict[str, Any],
+                            constraints: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Pumps whose envelope covers a duty region fully or partially.
+
+        Args:
+            region: Rectangle or polygon (see normalize_region)
+            constraints: Optional constraints (pump_type, max_results,
+                min_coverage as a fraction)
+
+        Returns:
+            Dictionary with the region, 'pumps' (ordered by coverage, then mean
+            efficiency) and index statistics
+        """
+        constraints = constraints or {}
+        polygon = self.normalize_region(region)
+        region_area = polygon_area(polygon)
+        type_constraint = (constraints.get('pump_type') or 'GENERAL').upper()
+        min_coverage = float(constraints.get('min_coverage', 0.0))
+        max_results = constraints.get('max_results', self.default_max_results)
+
+        flows = [q for q, _ in polygon]
+        heads = [h for _, h in polygon]
+        index = self.get_index()
+        candidates = index.query(min(flows), max(flows), min(heads), max(heads))
+
+        results = []
+        for i in candidates:
+            entry = index.entries[i]
+            pump = entry['pump']
+            if type_constraint != 'GENERAL' and (pump.get('pump_type') or '').upper() != type_constraint:
+                continue
+
+            envelope = entry['envelope']
+            fraction = polygon_intersection_area(polygon, envelope['polygon'], self.subdivisions) / region_area
+            fraction = min(fraction, 1.0)
+            if fraction <= 0 or fraction < min_coverage:
+                continue
+
+            # Tested points lying in both the region and the envelope
+            efficiencies = [eta for q, h, eta in envelope.get('efficiency_points', [])
+                            if point_in_polygon(polygon, q, h)]
+            specs = pump.get('specifications', {})
+            bep_flow, bep_head = specs.get('bep_flow_m3hr') or 0, specs.get('bep_head_m') or 0
+
+            results.append({
+                'pump_code': pump.get('pump_code'),
+                'pump_type': pump.get('pump_type'),
+                'coverage': 'full' if fraction >= self.full_fraction else 'partial',
+                'coverage_fraction': fraction,
+                'covered_area': fraction * region_area,
+                'efficiency_stats': {
+                    'sample_count': len(efficiencies),
+                    'min_pct': min(efficiencies) if efficiencies else None,
+                    'max_pct': max(efficiencies) if efficiencies else None,
+                    'mean_pct': sum(efficiencies) / len(efficiencies) if efficiencies else None
+                },
+                'bep_in_region': bool(bep_flow and bep_head and point_in_polygon(polygon, bep_flow, bep_head)),
+                'envelope_bounds': {
+                    'flow_min_m3hr': entry['bbox'][0],
+                    'flow_max_m3hr': entry['bbox'][1],
+                    'head_min_m': entry['bbox'][2],
+                    'head_max_m': entry['bbox'][3]
+                }
+            })
+
+        results.sort(key=lambda r: (-r['coverage_fraction'], -(r['efficiency_stats']['mean_pct'] or 0)))
+        logger.info(f"[COVERAGE] {len(candidates)} index candidates of {len(index.entries)} -> "
+                    f"{len(results)} covering pumps")
+
+        return {
+            'region': polygon,
+            'region_area': region_area,
+            'pumps': results[:max_results],
+            'total_matches': len(results),
+            'full_coverage_count': sum(1 for r in results if r['coverage'] == 'full'),
+            'index_candidates': len(candidates),
+            'indexed_pumps': len(index.entries),
+            'catalog_version': self.brain.get_catalog_version()
+        }
@@ -0,0 +1,311 @@
+"""
+Curve Fits Module
+=================
+Analytic (PCHIP + polynomial) representation of pump performance curves
+"""
+
+import logging
+from typing import Dict, List, Any, Optional, Tuple
+import numpy as np
+from scipy import interpolate
+from .config_manager import config
+
+logger = logging.getLogger(__name__)
+
+# Quantities fitted per curve: name -> performance point field
+FITTED_QUANTITIES = {
+    'head': 'head_m',
+    'efficiency': 'efficiency_pct',
+    'npshr': 'npshr_m'
+}
+
+# Raw-point interpolation is the reference mode; analytic mode is opt-in
+EVALUATION_MODE_INTERPOLATION = 'interpolation'
+EVALUATION_MODE_ANALYTIC = 'analytic'
+
+# Compiled PPoly models keyed by (curve_id, catalog_version)
+_compiled_models: Dict[Tuple[str, str], 'CurveFitModel'] = {}
+
+
+class CurveFitModel:
+    """Compiled analytic model of one curve, built from stored coefficients"""
+
+    def __init__(self, fit: Dict[str, Any]):
+        """
+        Build piecewise polynomials from a stored fit.
+
+        Args:
+            fit: Fit dictionary produced by CurveFitter.fit_curve
+        """
+        self.curve_id = fit.get('curve_id')
+        self.flow_min = fit['flow_min']
+        self.flow_max = fit['flow_max']
+        self._splines: Dict[str, interpolate.PPoly] = {}
+
+        for quantity in FITTED_QUANTITIES:
+            quantity_fit = fit.get(quantity)
+            if not quantity_fit:
+                continue
+            spline = interpolate.PPoly(
+                np.asarray(quantity_fit['coefficients'], dtype=float),
+                np.asarray(quantity_fit['breakpoints'], dtype=float),
+                extrapolate=False
+            )
+            self._splines[quantity] = spline
+
+    def has(self, quantity: str) -> bool:
+        """Check whether a quantity was fitted for this curve."""
+        return quantity in self._splines
+
+    def evaluate(self, quantity: str, flow):
+        """
+        Evaluate a fitted quantity at one or many flows.
+
+        Outside the fitted flow range NaN is returned, matching the
+        interp1d(bounds_error=False) behaviour of the reference mode.
+
+        Args:
+            quantity: 'head', 'efficiency' or 'npshr'
+            flow: Flow rate (scalar or array) in m³/hr
+
+        Returns:
+            Float for scalar input, numpy array otherwise
+        """
+        values = self._splines[quantity](flow)
+        return float(values) if np.ndim(values) == 0 else values
+
+    def invert(self, quantity: str, value: float, quadratic: float = 0.0) -> List[float]:
+        """
+        Solve Quantity(Q) - quadratic * Q² = value analytically on each cubic piece.
+
+        With quadratic=0 this is a plain inversion; a positive quadratic
+        intersects the curve with a parabola such as a system curve or an
+        affinity (homologous) parabola.
+
+        Args:
+            quantity: Fitted quantity name
+            value: Target value (constant term of the parabola)
+            quadratic: Coefficient of Q² subtracted from the curve
+
+        Returns:
+            Sorted list of flows within the fitted range
+        """
+        spline = self._splines[quantity]
+        if quadratic:
+            # Subtract k * (x_i + t)² in each piece's local coordinate t
+            coefficients = np.array(spline.c, dtype=float)
+            if coefficients.shape[0] < 3:
+                padding = np.zeros((3 - coefficients.shape[0], coefficients.shape[1]))
+                coefficients = np.vstack([padding, coefficients])
+            starts = spline.x[:-1]
+            coefficients[-3] -= quadratic
+            coefficients[-2] -= 2.0 * quadratic * starts
+            coefficients[-1] -= quadratic * starts ** 2
+            spline = interpolate.PPoly(coefficients, spline.x, extrapolate=False)
+        roots = spline.solve(value, discontinuity=False, extrapolate=False)
+        roots = [float(r) for r in roots if np.isfinite(r)]
+        return sorted(roots)
+
+    def flow_at_head(self, head: float, system_k: float = 0.0) -> Optional[float]:
+        """
+        Flow where the curve meets H = head + system_k * Q².
+
+        The largest root is returned - on a drooping curve it is the
+        stable operating point to the right of shut-off.
+
+        Args:
+            head: Target head (or static head when system_k is set) in meters
+            system_k: Quadratic coefficient of the system/affinity parabola
+
+        Returns:
+            Flow in m³/hr or None if the head is never reached
+        """
+        roots = self.invert('head', head, quadratic=system_k)
+        return roots[-1] if roots else None
+
+
+class CurveFitter:
+    """Fits and serves analytic curve representations"""
+
+    @staticmethod
+    def get_evaluation_mode() -> str:
+        """
+        Get configured curve evaluation mode.
+
+        Returns:
+            'interpolation' (reference) or 'analytic'
+        """
+        return config.get_safe('curve_fits', 'curve_evaluation_mode', EVALUATION_MODE_INTERPOLATION)
+
+    @staticmethod
+    def is_analytic_mode() -> bool:
+        """Check whether physics should evaluate curves analytically."""
+        return CurveFitter.get_evaluation_mode() == EVALUATION_MODE_ANALYTIC
+
+    @staticmethod
+    def _unique_sorted(flows: np.ndarray, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Sort by flow and average duplicate flows (PCHIP needs strictly increasing x)."""
+        unique_flows, inverse = np.unique(flows, return_inverse=True)
+        counts = np.bincount(inverse)
+        averaged = np.bincount(inverse, weights=values) / counts
+        return unique_flows, averaged
+
+    @staticmethod
+    def _fit_quantity(flows: np.ndarray, values: np.ndarray, degree: int) -> Optional[Dict[str, Any]]:
+        """
+        Fit one quantity with PCHIP plus a least-squares polynomial.
+
+        Args:
+            flows: Strictly increasing flow array
+            values: Values at those flows
+            degree: Polynomial degree for the closed-form summary fit
+
+        Returns:
+            JSON-serializable fit dictionary with quality metrics
+        """
+        spline = interpolate.PchipInterpolator(flows, values, extrapolate=False)
+
+        # PCHIP passes through every point; report how far it departs from
+        # the linear reference between points
+        midpoints = (flows[:-1] + flows[1:]) / 2
+        deviation = np.abs(spline(midpoints) - np.interp(midpoints, flows, values))
+
+        fit = {
+            'method': 'pchip',
+            'breakpoints': spline.x.tolist(),
+            'coefficients': spline.c.tolist(),
+            'max_deviation_vs_linear': float(np.max(deviation)) if deviation.size else 0.0,
+            'polynomial': None
+        }
+
+        if len(flows) > degree:
+            poly = np.polyfit(flows, values, degree)
+            residuals = values - np.polyval(poly, flows)
+            ss_res = float(np.sum(residuals ** 2))
+            ss_tot = float(np.sum((values - np.mean(values)) ** 2))
+            fit['polynomial'] = {
+                'degree': degree,
+                'coefficients': poly.tolist(),
+                'rmse': float(np.sqrt(ss_res / len(flows))),
+                'max_abs_error': float(np.max(np.abs(residuals))),
+                'r_squared': 1.0 - ss_res / ss_tot if ss_tot > 0 else 1.0
+            }
+
+        return fit
+
+    @staticmethod
+    def fit_curve(curve: Dict[str, Any], catalog_version: str = '') -> Optional[Dict[str, Any]]:
+        """
+        Fit H(Q), η(Q) and NPSHr(Q) for a single curve.
+
+        Args:
+            curve: Curve dictionary with performance_points
+            catalog_version: Catalog build stamp the fit belongs to
+
+        Returns:
+            Fit dictionary or None if the curve has too few points
+        """
+        min_points = config.get('curve_fits', 'minimum_points_for_curve_fit')
+        degrees = {
+            'head': config.get('curve_fits', 'head_polynomial_degree'),
+            'efficiency': config.get('curve_fits', 'efficiency_polynomial_degree'),
+            'npshr': config.get('curve_fits', 'npshr_polynomial_degree')
+        }
+
+        points = [p for p in curve.get('performance_points', []) if p.get('flow_m3hr') is not None]
+        if len(points) < min_points:
+            return None
+
+        fit = {
+            'curve_id': curve.get('curve_id'),
+            'catalog_version': catalog_version
+        }
+
+        for quantity, field in FITTED_QUANTITIES.items():
+            quantity_points = [p for p in points if p.get(field) is not None]
+            if len(quantity_points) < min_points:
+                fit[quantity] = None
+                continue
+
+            flows, values = CurveFitter._unique_sorted(
+                np.array([p['flow_m3hr'] for p in quantity_points], dtype=float),
+                np.array([p[field] for p in quantity_points], dtype=float)
+            )
+            if len(flows) < min_points:
+                fit[quantity] = None
+                continue
+
+            fit[quantity] = CurveFitter._fit_quantity(flows, values, degrees[quantity])
+
+        if not fit.get('head'):
+            return None
+
+        fit['flow_min'] = fit['head']['breakpoints'][0]
+        fit['flow_max'] = fit['head']['breakpoints'][-1]
+        return fit
+
+    @staticmethod
+    def fit_catalog(pump_models: List[Dict[str, Any]], catalog_version: str) -> Dict[str, Any]:
+        """
+        Fit every curve in the catalog and attach the result as
+        curve['analytic_fit'].
+
+        Args:
+            pump_models: Loaded pump models
+            catalog_version: Catalog build stamp
+
+        Returns:
+            Summary statistics for catalog metadata
+        """
+        _compiled_models.clear()
+
+        fitted = 0
+        skipped = 0
+        head_rmse = []
+
+        for pump in pump_models:
+            for curve in pump.get('curves', []):
+                try:
+                    fit = CurveFitter.fit_curve(curve, catalog_version)
+                except Exception as e:
+                    logger.warning(f"[CURVE FIT] {curve.get('curve_id')}: fit failed - {e}")
+                    fit = None
+
+                curve['analytic_fit'] = fit
+                if fit:
+                    fitted += 1
+                    if fit['head'].get('polynomial'):
+                        head_rmse.append(fit['head']['polynomial']['rmse'])
+                else:
+                    skipped += 1
+
+        summary = {
+            'fitted_curves': fitted,
+            'skipped_curves': skipped,
+            'mean_head_polynomial_rmse_m': round(float(np.mean(head_rmse)), 4) if head_rmse else None,
+            'evaluation_mode': CurveFitter.get_evaluation_mode()
+        }
+        logger.info(f"[CURVE FIT] Fitted {fitted} curves ({skipped} skipped), mode={summary['evaluation_mode']}")
+        return summary
+
+    @staticmethod
+    def get_model(curve: Dict[str, Any]) -> Optional[CurveFitModel]:
+        """
+        Get the compiled analytic model for a curve.
+
+        Args:
+            curve: Curve dictionary (must carry analytic_fit)
+
+        Returns:
+            CurveFitModel or None if the curve was not fitted
+        """
+        fit = curve.get('analytic_fit')
+        if not fit:
+            return None
+
+        key = (fit.get('curve_id'), fit.get('catalog_version'))
+        model = _compiled_models.get(key)
+        if model is None:
+            model = CurveFitModel(fit)
+            _compiled_models[key] = model
+        return model
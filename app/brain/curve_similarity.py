@@ -0,0 +1,353 @@
+"""
+Curve Similarity Module
+=======================
+Dimensionless curve-shape fingerprints with a nearest-neighbour index
+"""
+
+import logging
+from typing import Dict, List, Any, Optional, Tuple
+import numpy as np
+from scipy.spatial import cKDTree
+from .config_manager import config
+
+logger = logging.getLogger(__name__)
+
+# Fingerprint indexes by catalog version
+_fingerprint_indexes: Dict[str, 'CurveFingerprintIndex'] = {}
+
+
+def flow_ratio_grid() -> np.ndarray:
+    """Q/Q_bep sample points shared by every fingerprint."""
+    return np.linspace(config.get('curve_similarity', 'flow_ratio_grid_minimum'),
+                       config.get('curve_similarity', 'flow_ratio_grid_maximum'),
+                       config.get('curve_similarity', 'flow_ratio_grid_points'))
+
+
+def build_fingerprint(pump: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Fingerprint of a pump's largest-diameter curve.
+
+    The curve is normalized to its own best-efficiency point and resampled
+    at fixed Q/Q_bep ratios, giving H/H_bep and η/η_bep vectors that match
+    for the same hydraulic at any size. BEP flow and head are kept
+    separately so size can be matched on demand.
+
+    Args:
+        pump: Pump model
+
+    Returns:
+        JSON-safe fingerprint dictionary, or None without a usable curve
+    """
+    min_points = config.get('physical_validator', 'minimum_curve_points_required_for_validation')
+    curves = [c for c in pump.get('curves', []) if len(c.get('performance_points', [])) >= min_points]
+    if not curves:
+        return None
+    curve = max(curves, key=lambda c: c.get('impeller_diameter_mm', 0) or 0)
+
+    points = sorted((p.get('flow_m3hr') or 0, p.get('head_m') or 0, p.get('efficiency_pct') or 0)
+                    for p in curve['performance_points'])
+    flows = np.array([p[0] for p in points], dtype=float)
+    heads = np.array([p[1] for p in points], dtype=float)
+    efficiencies = np.array([p[2] for p in points], dtype=float)
+    if not (efficiencies > 0).any():
+        return None
+
+    best = int(np.argmax(efficiencies))
+    bep_flow, bep_head, bep_efficiency = flows[best], heads[best], efficiencies[best]
+    if bep_flow <= 0 or bep_head <= 0:
+        return None
+
+    grid = flow_ratio_grid()
+    head_shape = np.interp(grid, flows / bep_flow, heads / bep_head)
+    efficiency_shape = np.interp(grid, flows / bep_flow, efficiencies / bep_efficiency)
+    weight = config.get('curve_similarity', 'efficiency_shape_weight')
+    return {
+        'vector': np.concatenate([head_shape, efficiency_shape * weight]).tolist(),
+        'bep_flow_m3hr': float(bep_flow),
+        'bep_head_m': float(bep_head),
+        'bep_efficiency_pct': float(bep_efficiency),
+        'reference_diameter_mm': curve.get('impeller_diameter_mm', 0),
+        'coverage': [float(flows[0] / bep_flow), float(flows[-1] / bep_flow)]
+    }
+
+
+def get_fingerprint(pump: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Get the stored fingerprint of a pump, building it once if missing.
+
+    Args:
+        pump: Pump data
+
+    Returns:
+        Fingerprint dictionary or None
+    """
+    if 'curve_fingerprint' not in pump:
+        pump['curve_fingerprint'] = build_fingerprint(pump)
+    return pump['curve_fingerprint']
+
+
+class CurveFingerprintIndex:
+    """KD-trees over the fingerprints of one catalog"""
+
+    def __init__(self, pump_models: List[Dict[str, Any]], catalog_version: str):
+        """
+        Args:
+            pump_models: Catalog pump list
+            catalog_version: Catalog build stamp
+        """
+        self.catalog_version = catalog_version
+        self.pump_count = len(pump_models)
+        self.pumps: List[Dict[str, Any]] = []
+        vectors, sizes = [], []
+        for pump in pump_models:
+            fingerprint = get_fingerprint(pump)
+            if fingerprint:
+                self.pumps.append(pump)
+                vectors.append(fingerprint['vector'])
+                sizes.append([fingerprint['bep_flow_m3hr'], fingerprint['bep_head_m']])
+
+        self.positions = {p.get('pump_code'): i for i, p in enumerate(self.pumps)}
+        self.shapes = np.array(vectors, dtype=float).reshape(len(vectors), -1)
+        self.log_sizes = np.log(np.array(sizes, dtype=float).reshape(-1, 2))
+        self.size_weight = config.get('curve_similarity', 'size_mismatch_weight')
+        self.shape_tree = cKDTree(self.shapes) if len(self.pumps) else None
+        self.sized_tree = cKDTree(self._sized(self.shapes, self.log_sizes, self.size_weight)) \
+            if len(self.pumps) else None
+
+    @staticmethod
+    def _sized(shapes: np.ndarray, log_sizes: np.ndarray, weight: float) -> np.ndarray:
+        """Shape vectors extended with weighted log BEP flow and head."""
+        return np.hstack([shapes, log_sizes * weight])
+
+    @staticmethod
+    def precompute_catalog(pump_models: List[Dict[str, Any]], catalog_version: str) -> Dict[str, Any]:
+        """
+        Fingerprint every pump of a freshly loaded catalog and build the index.
+
+        Args:
+            pump_models: Loaded pump models
+            catalog_version: Catalog build stamp
+
+        Returns:
+            Summary statistics for catalog metadata
+        """
+        for pump in pump_models:
+            pump['curve_fingerprint'] = build_fingerprint(pump)
+        _fingerprint_indexes.clear()
+        index = CurveFingerprintIndex(pump_models, catalog_version)
+        _fingerprint_indexes[catalog_version] = index
+        logger.info(f"[CURVE SIMILARITY] {len(index.pumps)} of {len(pump_models)} pumps fingerprinted")
+        return {'pumps_fingerprinted': len(index.pumps), 'catalog_version': catalog_version}
+
+    @staticmethod
+    def get_index(pump_models: List[Dict[str, Any]], catalog_version: str) -> 'CurveFingerprintIndex':
+        """
+        Get the fingerprint index of the loaded catalog, building it on demand.
+
+        Args:
+            pump_models: Catalog pump list
+            catalog_version: Catalog build stamp
+
+        Returns:
+            CurveFingerprintIndex
+        """
+        index = _fingerprint_indexes.get(catalog_version)
+        if index is None or index.pump_count != len(pump_models):
+            _fingerprint_indexes.clear()
+            index = CurveFingerprintIndex(pump_models, catalog_version)
+            _fingerprint_indexes[catalog_version] = index
+        return index
+
+    def nearest(self, fingerprint: Dict[str, Any], count: int, match_size: bool) -> List[Tuple[float, int]]:
+        """
+        Nearest indexed pumps to a fingerprint.
+
+        Args:
+            fingerprint: Query fingerprint
+            count: Neighbours to return
+            match_size: Use the size-extended tree instead of shape alone
+
+        Returns:
+            (distance, position) pairs, nearest first
+        """
+        if not self.pumps or count <= 0:
+            return []
+        vector = np.array(fingerprint['vector'], dtype=float)
+        if match_size:
+            log_size = np.log([fingerprint['bep_flow_m3hr'], fingerprint['bep_head_m']])
+            distances, positions = self.sized_tree.query(
+                self._sized(vector[np.newaxis, :], log_size[np.newaxis, :], self.size_weight)[0],
+                k=min(count, len(self.pumps)))
+        else:
+            distances, positions = self.shape_tree.query(vector, k=min(count, len(self.pumps)))
+        return list(zip(np.atleast_1d(distances).tolist(), np.atleast_1d(positions).tolist()))
+
+    def near_duplicate_pairs(self, shape_radius: float, size_tolerance: float) -> List[Tuple[int, int, float]]:
+        """
+        Pairs with nearly identical shape and BEP size.
+
+        A temporary tree scales log sizes so the size tolerance maps onto the
+        shape radius; its pairs within sqrt(3)·radius are a superset of the
+        qualifying pairs, which are then checked exactly.
+
+        Args:
+            shape_radius: Maximum fingerprint distance
+            size_tolerance: Maximum relative BEP flow and head difference
+
+        Returns:
+            (position, position, shape distance) triples
+        """
+        if len(self.pumps) < 2:
+            return []
+        log_tolerance = np.log1p(size_tolerance)
+        weight = shape_radius / log_tolerance if log_tolerance > 0 else 0.0
+        tree = cKDTree(self._sized(self.shapes, self.log_sizes, weight))
+        candidates = tree.query_pairs(shape_radius * np.sqrt(3), output_type='ndarray')
+        if not len(candidates):
+            return []
+        i, j = candidates[:, 0], candidates[:, 1]
+        shape_distance = np.linalg.norm(self.shapes[i] - self.shapes[j], axis=1)
+        size_ok = (np.abs(self.log_sizes[i] - self.log_sizes[j]) <= log_tolerance + 1e-12).all(axis=1)
+        keep = (shape_distance <= shape_radius) & size_ok
+        return list(zip(i[keep].tolist(), j[keep].tolist(), shape_distance[keep].tolist()))
+
+
+class CurveSimilarity:
+    """Alternatives and near-duplicate queries over the catalog fingerprint index"""
+
+    def __init__(self, brain):
+        """
+        Initialize with reference to main Brain.
+
+        Args:
+            brain: Parent PumpBrain instance
+        """
+        self.brain = brain
+        self.default_max_results = config.get('curve_similarity', 'default_maximum_alternatives')
+        self.duplicate_shape_radius = config.get('curve_similarity', 'duplicate_shape_distance')
+        self.duplicate_size_tolerance = config.get('curve_similarity', 'duplicate_size_tolerance_fraction')
+
+    def _index(self) -> CurveFingerprintIndex:
+        return CurveFingerprintIndex.get_index(self.brain.repository.get_pump_models(),
+                                               self.brain.get_catalog_version())
+
+    def find_alternatives(self, pump_data: Dict[str, Any],
+                          constraints: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Pumps whose curves look like this one.
+
+        Args:
+            pump_data: Reference pump
+            constraints: Optional constraints (max_results, match_size,
+                pump_type, exclude_manufacturer)
+
+        Returns:
+            Dictionary with the reference fingerprint summary and ranked
+            'alternatives' (pump_code, shape_distance, BEP size ratios)
+        """
+        constraints = constraints or {}
+        max_results = constraints.get('max_results', self.default_max_results)
+        match_size = constraints.get('match_size', True)
+        type_constraint = (constraints.get('pump_type') or 'GENERAL').upper()
+        excluded_manufacturer = constraints.get('exclude_manufacturer')
+
+        fingerprint = get_fingerprint(pump_data)
+        code = pump_data.get('pump_code')
+        result = {'pump_code': code, 'match_size': match_size, 'alternatives': []}
+        if not fingerprint:
+            return result
+
+        index = self._index()
+        vector = np.array(fingerprint['vector'], dtype=float)
+
+        # Filters can reject neighbours, so widen the query until enough remain
+        count = max_results + 1
+        while True:
+            neighbours = index.nearest(fingerprint, count, match_size)
+            alternatives = []
+            for _, position in neighbours:
+                pump = index.pumps[position]
+                if pump.get('pump_code') == code:
+                    continue
+                if type_constraint != 'GENERAL' and (pump.get('pump_type') or '').upper() != type_constraint:
+                    continue
+                if excluded_manufacturer and pump.get('manufacturer') == excluded_manufacturer:
+                    continue
+                other = pump['curve_fingerprint']
+                alternatives.append({
+                    'pump_code': pump.get('pump_code'),
+                    'manufacturer': pump.get('manufacturer'),
+                    'shape_distance': float(np.linalg.norm(index.shapes[position] - vector)),
+                    'bep_flow_ratio': other['bep_flow_m3hr'] / fingerprint['bep_flow_m3hr'],
+                    'bep_head_ratio': other['bep_head_m'] / fingerprint['bep_head_m'],
+                    'bep_efficiency_pct': other['bep_efficiency_pct']
+                })
+                if len(alternatives) >= max_results:
+                    break
+            if len(alternatives) >= max_results or count >= len(index.pumps):
+                break
+            count *= 4
+
+        result['reference'] = {k: fingerprint[k] for k in
+                               ('bep_flow_m3hr', 'bep_head_m', 'bep_efficiency_pct', 'reference_diameter_mm')}
+        result['alternatives'] = alternatives
+        return result
+
+    def duplicate_report(self, shape_radius: Optional[float] = None,
+                         size_tolerance: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Groups of catalog pumps that are likely the same hydraulic.
+
+        Args:
+            shape_radius: Fingerprint distance limit (default from config)
+            size_tolerance: Relative BEP flow/head limit (default from config)
+
+        Returns:
+            Dictionary with 'groups' (connected near-duplicate pairs, largest
+            first) and the thresholds used
+        """
+        shape_radius = self.duplicate_shape_radius if shape_radius is None else shape_radius
+        size_tolerance = self.duplicate_size_tolerance if size_tolerance is None else size_tolerance
+        index = self._index()
+        pairs = index.near_duplicate_pairs(shape_radius, size_tolerance)
+
+        # Union-find over pairs so re-badged families form one group
+        parent = list(range(len(index.pumps)))
+
+        def root(k):
+            while parent[k] != k:
+                parent[k] = parent[parent[k]]
+                k = parent[k]
+            return k
+
+        for i, j, _ in pairs:
+            parent[root(i)] = root(j)
+
+        members: Dict[int, List[int]] = {}
+        for i, j, _ in pairs:
+            for k in (i, j):
+                members.setdefault(root(k), [])
+        for k in range(len(index.pumps)):
+            if root(k) in members:
+                members[root(k)].append(k)
+
+        max_distance: Dict[int, float] = {}
+        for i, j, distance in pairs:
+            max_distance[root(i)] = max(max_distance.get(root(i), 0.0), distance)
+
+        groups = [{
+            'pump_codes': [index.pumps[k].get('pump_code') for k in positions],
+            'manufacturers': sorted({str(index.pumps[k].get('manufacturer') or '') for k in positions}),
+            'max_shape_distance': max_distance.get(group, 0.0)
+        } for group, positions in members.items()]
+        groups.sort(key=lambda g: (-len(g['pump_codes']), g['max_shape_distance']))
+
+        logger.info(f"[CURVE SIMILARITY] {len(pairs)} near-duplicate pairs in {len(groups)} groups")
+        return {
+            'catalog_version': index.catalog_version,
+            'pumps_indexed': len(index.pumps),
+            'shape_distance_limit': shape_radius,
+            'size_tolerance_fraction': size_tolerance,
+            'pair_count': len(pairs),
+            'groups': groups
+        }
@@ -0,0 +1,218 @@
+"""
+Duty Cycle Module
+=================
+Weighted multi-point pump selection over a load profile
+"""
+
+import logging
+from typing import Dict, List, Any, Optional
+import numpy as np
+from .config_manager import config
+
+logger = logging.getLogger(__name__)
+
+
+class DutyCycleSelector:
+    """Ranks pumps on a weighted set of operating points using the batched evaluator"""
+
+    def __init__(self, brain):
+        """
+        Initialize with reference to main Brain.
+
+        Args:
+            brain: Parent PumpBrain instance
+        """
+        self.brain = brain
+        self.annual_hours = config.get('duty_cycle', 'annual_operating_hours')
+        self.flow_min_range = config.get('duty_cycle', 'flow_prefiltering_minimum_range')
+        self.flow_max_range = config.get('duty_cycle', 'flow_prefiltering_maximum_range')
+        self.max_points = config.get('duty_cycle', 'maximum_duty_points')
+        self.default_max_results = config.get('selection_core', 'default_maximum_results_to_return')
+
+    @staticmethod
+    def parse_duty_profile(profile: str, design_flow: float, design_head: float,
+                           h_static_ratio: Optional[float] = None) -> List[Dict[str, float]]:
+        """
+        Parse a compact profile string into operating points.
+
+        Format is "flow_pct:weight,..." (e.g. "60:20,100:50,110:30"). Heads at
+        part flows follow the system curve H = H_static + k·Q² through the
+        design point.
+
+        Args:
+            profile: Profile string
+            design_flow: Design flow in m³/hr
+            design_head: Design head in meters
+            h_static_ratio: Static head fraction (defaults to performance_vfd setting)
+
+        Returns:
+            List of {'flow_m3hr', 'head_m', 'weight'} points
+        """
+        if h_static_ratio is None:
+            h_static_ratio = config.get('performance_vfd', 'default_static_head_ratio_for_system_curves')
+
+        h_static = design_head * h_static_ratio
+        k_system = (design_head - h_static) / (design_flow ** 2)
+
+        points = []
+        for item in profile.split(','):
+            if not item.strip():
+                continue
+            flow_pct, weight = item.split(':')
+            flow = design_flow * float(flow_pct) / 100.0
+            points.append({
+                'flow_m3hr': flow,
+                'head_m': h_static + k_system * flow ** 2,
+                'weight': float(weight)
+            })
+        return points
+
+    def _validate_points(self, operating_points: List[Dict[str, Any]]) -> List[Dict[str, float]]:
+        """Check and normalize operating points; weights are scaled to sum to 1."""
+        if not operating_points:
+            raise ValueError("At least one operating point is required")
+        if len(operating_points) > self.max_points:
+            raise ValueError(f"Too many operating points ({len(operating_points)} > {self.max_points})")
+
+        points = []
+        for point in operating_points:
+            flow = float(point.get('flow_m3hr', 0))
+            head = float(point.get('head_m', 0))
+            weight = float(point.get('weight', 1.0))
+            if flow <= 0 or head <= 0 or weight < 0:
+                raise ValueError(f"Invalid operating point: {point}")
+            points.append({'flow_m3hr': flow, 'head_m': head, 'weight': weight})
+
+        total_weight = sum(p['weight'] for p in points)
+        if total_weight <= 0:
+            raise ValueError("Operating point weights must not all be zero")
+        for p in points:
+            p['weight'] /= total_weight
+        return points
+
+    def _get_candidates(self, flows: np.ndarray, constraints: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Pre-filter catalog on BEP flow across the whole profile and on pump type."""
+        min_bep_flow = flows.min() * self.flow_min_range
+        max_bep_flow = flows.max() * self.flow_max_range
+        type_constraint = (constraints.get('pump_type') or 'GENERAL').upper()
+
+        candidates = []
+        for pump in self.brain.repository.get_pump_models():
+            bep_flow = pump.get('specifications', {}).get('bep_flow_m3hr') or 0
+            if not (bep_flow > 0 and min_bep_flow <= bep_flow <= max_bep_flow):
+                continue
+            if type_constraint != 'GENERAL' and (pump.get('pump_type') or '').upper() != type_constraint:
+                continue
+            candidates.append(pump)
+        return candidates
+
+    def find_best_pumps(self, operating_points: List[Dict[str, Any]],
+                        constraints: Optional[Dict[str, Any]] = None,
+                        include_exclusions: bool = False) -> Dict[str, Any]:
+        """
+        Rank pumps on a weighted duty cycle.
+
+        Args:
+            operating_points: List of {'flow_m3hr', 'head_m', 'weight'}
+            constraints: Optional constraints (pump_type, max_results,
+                rank_by: 'score' | 'efficiency' | 'energy', operating_hours)
+            include_exclusions: If True, return exclusion details
+
+        Returns:
+            Dictionary with 'ranked_pumps' (PumpEvaluator-shaped entries with a
+            'duty_cycle' breakdown) and optionally 'exclusion_details'
+        """
+        constraints = constraints or {}
+        points = self._validate_points(operating_points)
+        flows = np.array([p['flow_m3hr'] for p in points])
+        heads = np.array([p['head_m'] for p in points])
+        weights = np.array([p['weight'] for p in points])
+        operating_hours = constraints.get('operating_hours', self.annual_hours)
+
+        candidates = self._get_candidates(flows, constraints)
+        batch = self.brain.batch_evaluator.evaluate(candidates, flows, heads)
+        rows = batch['rows']
+        logger.info(f"[DUTY CYCLE] {len(points)} points x {len(rows)} pumps evaluated in one batch")
+
+        if not rows:
+            return {'ranked_pumps': [], 'exclusion_details': None}
+
+        feasible = batch['feasible']
+        all_feasible = feasible.all(axis=1)
+
+        # Weighted metrics across points (P,)
+        efficiency = np.where(feasible, batch['efficiency_pct'], 0.0)
+        power = np.where(feasible, batch['power_kw'], 0.0)
+        weighted_efficiency = efficiency @ weights
+        weighted_power = power @ weights
+        annual_energy = weighted_power * operating_hours
+        weighted_score = np.where(feasible, batch['total_score'], 0.0) @ weights
+
+        rank_by = constraints.get('rank_by', 'score')
+        if rank_by == 'efficiency':
+            order = np.lexsort((weighted_power, -weighted_efficiency))
+        elif rank_by == 'energy':
+            order = np.lexsort((-weighted_score, annual_energy))
+        else:
+            order = np.lexsort((weighted_power, -weighted_score))
+
+        design_index = int(np.argmax(weights))
+        max_results = constraints.get('max_results', self.default_max_results)
+
+        ranked_pumps = []
+        excluded_pumps = []
+        exclusion_summary = {}
+
+        for i in order:
+            if not all_feasible[i]:
+                if include_exclusions:
+                    reason = f"Infeasible at {int((~feasible[i]).sum())} of {len(points)} duty points"
+                    excluded_pumps.append({
+                        'pump_code': rows[i]['pump_code'],
+                        'exclusion_reasons': [reason],
+                        'score_components': {}
+                    })
+                    exclusion_summary['Infeasible at one or more duty points'] = \
+                        exclusion_summary.get('Infeasible at one or more duty points', 0) + 1
+                continue
+
+            if len(ranked_pumps) >= max_results:
+                continue
+
+            evaluation = self.brain.batch_evaluator.to_evaluation(batch, i, design_index)
+            evaluation['total_score'] = float(weighted_score[i])
+            evaluation['duty_cycle'] = {
+                'weighted_efficiency_pct': float(weighted_efficiency[i]),
+                'weighted_power_kw': float(weighted_power[i]),
+                'annual_energy_kwh': float(annual_energy[i]),
+                'operating_hours': operating_hours,
+                'design_point_index': design_index,
+                'points': [
+                    {
+                        'flow_m3hr': points[j]['flow_m3hr'],
+                        'head_m': points[j]['head_m'],
+                        'weight': points[j]['weight'],
+                        'feasible': bool(feasible[i, j]),
+                        'efficiency_pct': float(batch['efficiency_pct'][i, j]),
+                        'power_kw': float(batch['power_kw'][i, j]),
+                        'qbp_percent': float(batch['qbp_percent'][i, j]),
+                        'trim_percent': float(batch['trim_percent'][i, j]),
+                        'total_score': float(batch['total_score'][i, j])
+                    }
+                    for j in range(len(points))
+                ]
+            }
+            ranked_pumps.append(evaluation)
+
+        result = {'ranked_pumps': ranked_pumps}
+        if include_exclusions:
+            result['exclusion_details'] = {
+                'excluded_pumps': excluded_pumps,
+                'exclusion_summary': exclusion_summary,
+                'total_evaluated': len(rows),
+                'feasible_count': int(all_feasible.sum()),
+                'excluded_count': len(excluded_pumps)
+            }
+        else:
+            result['exclusion_details'] = None
+        return result
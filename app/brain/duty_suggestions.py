@@ -0,0 +1,302 @@
+"""
+Duty Suggestions Module
+=======================
+Nearest feasible duty points from envelope geometry when no pump qualifies
+"""
+
+import heapq
+import logging
+from typing import Dict, List, Any, Optional, Tuple
+import numpy as np
+from .operating_envelope import OperatingEnvelope, point_in_polygon
+from .config_manager import config
+
+logger = logging.getLogger(__name__)
+
+# QBP band keys (lower, upper) that bound each accepted tier
+_TIER_BANDS = {
+    1: ('preferred_operating_zone_minimum_qbp_percentage', 'preferred_operating_zone_maximum_qbp_percentage'),
+    2: ('qbp_lower_threshold_for_allowable_range', 'qbp_upper_threshold_for_allowable_range'),
+    3: ('qbp_lower_threshold_for_acceptable_range', 'qbp_upper_threshold_for_acceptable_range')
+}
+
+
+def clip_to_flow_band(polygon: np.ndarray, x_low: float, x_high: float) -> np.ndarray:
+    """
+    Clip a polygon to a vertical strip (Sutherland-Hodgman on two edges).
+
+    Args:
+        polygon: (V, 2) ring of [x, y] vertices
+        x_low: Strip left edge
+        x_high: Strip right edge
+
+    Returns:
+        (V', 2) clipped ring, empty if nothing remains
+    """
+    def clip(points, inside, cross_x):
+        clipped = []
+        for k in range(len(points)):
+            current, previous = points[k], points[k - 1]
+            if inside(current):
+                if not inside(previous):
+                    clipped.append(intersect(previous, current, cross_x))
+                clipped.append(current)
+            elif inside(previous):
+                clipped.append(intersect(previous, current, cross_x))
+        return clipped
+
+    def intersect(a, b, x):
+        t = (x - a[0]) / (b[0] - a[0])
+        return (x, a[1] + t * (b[1] - a[1]))
+
+    points = [tuple(p) for p in polygon]
+    points = clip(points, lambda p: p[0] >= x_low, x_low)
+    if points:
+        points = clip(points, lambda p: p[0] <= x_high, x_high)
+    return np.array(points, dtype=float).reshape(-1, 2)
+
+
+def nearest_on_line(ring: np.ndarray, axis: int, position: float, target: float) -> Optional[float]:
+    """
+    Nearest value to target inside the polygon along an axis-parallel line.
+
+    Args:
+        ring: (V, 2) polygon ring
+        axis: 0 for a vertical line x = position (returns y), 1 for y = position (returns x)
+        position: Line coordinate
+        target: Value to approach
+
+    Returns:
+        Nearest boundary value, or None if the line misses the polygon
+    """
+    a, b = ring, np.roll(ring, -1, axis=0)
+    fixed, free = axis, 1 - axis
+    spans = (a[:, fixed] > position) != (b[:, fixed] > position)
+    if not spans.any():
+        return None
+    a, b = a[spans], b[spans]
+    t = (position - a[:, fixed]) / (b[:, fixed] - a[:, fixed])
+    crossings = np.sort(a[:, free] + t * (b[:, free] - a[:, free]))
+    # Even-odd pairs of crossings bound the inside intervals
+    intervals = crossings[:len(crossings) // 2 * 2].reshape(-1, 2)
+    if not len(intervals):
+        return None
+    candidates = np.clip(target, intervals[:, 0], intervals[:, 1])
+    return float(candidates[np.argmin(np.abs(candidates - target))])
+
+
+def nearest_on_boundary(ring: np.ndarray, point: Tuple[float, float]) -> Tuple[float, np.ndarray]:
+    """
+    Closest point of a polygon boundary.
+
+    Args:
+        ring: (V, 2) polygon ring
+        point: (x, y)
+
+    Returns:
+        (distance, nearest [x, y])
+    """
+    p = np.asarray(point, dtype=float)
+    a, b = ring, np.roll(ring, -1, axis=0)
+    edge = b - a
+    length_sq = (edge ** 2).sum(axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t = np.clip(np.where(length_sq > 0, ((p - a) * edge).sum(axis=1) / length_sq, 0.0), 0.0, 1.0)
+    nearest = a + t[:, np.newaxis] * edge
+    distances = np.hypot(*(nearest - p).T)
+    k = int(np.argmin(distances))
+    return float(distances[k]), nearest[k]
+
+
+class DutySuggester:
+    """Suggests the smallest flow/head changes that make the closest pumps feasible"""
+
+    def __init__(self, brain):
+        """
+        Initialize with reference to main Brain.
+
+        Args:
+            brain: Parent PumpBrain instance
+        """
+        self.brain = brain
+        self.enabled = config.get('duty_suggestions', 'suggest_when_no_pump_found')
+        self.max_tier = config.get('duty_suggestions', 'maximum_accepted_tier')
+        self.max_suggestions = config.get('duty_suggestions', 'maximum_suggested_pumps')
+        self.margin = config.get('duty_suggestions', 'boundary_margin_fraction')
+        self.max_change = config.get('duty_suggestions', 'maximum_relative_duty_change')
+        self.head_tolerance = config.get('physical_validator', 'head_tolerance_for_capability_validation_2')
+
+    def _flow_band(self, pump: Dict[str, Any], max_tier: int) -> Optional[Tuple[float, float]]:
+        """Flow range (m³/hr) whose QBP falls within the accepted tiers, or None without BEP data."""
+        bep_flow = pump.get('specifications', {}).get('bep_flow_m3hr', 0) or 0
+        if bep_flow <= 0:
+            return None
+        low_key, high_key = _TIER_BANDS[max_tier]
+        return (bep_flow * config.get('pump_evaluator', low_key) / 100.0,
+                bep_flow * config.get('pump_evaluator', high_key) / 100.0)
+
+    def _feasible_region(self, pump: Dict[str, Any], flow: float, head: float,
+                         max_tier: int) -> Optional[Tuple[np.ndarray, float]]:
+        """
+        Envelope polygon clipped to the tier band, in duty coordinates scaled by the request.
+
+        Polygon heads are the head the pump must reach, so they are divided by
+        (1 - tolerance) to give the largest duty head the validator accepts.
+
+        Returns:
+            (scaled ring, lower bound on the scaled distance), or None
+        """
+        envelope = OperatingEnvelope.get_envelope(pump)
+        band = self._flow_band(pump, max_tier)
+        if not envelope or not band:
+            return None
+
+        flow_low = max(band[0], envelope['flow_min_m3hr'])
+        flow_high = min(band[1], envelope['flow_max_m3hr'])
+        if flow_low >= flow_high:
+            return None
+        head_high = envelope['head_max_m'] / (1 - self.head_tolerance) / head
+
+        # Distance from the request (1, 1) to the region's bounding box
+        dx = max(flow_low / flow - 1.0, 0.0, 1.0 - flow_high / flow)
+        dy = max(1.0 - head_high, 0.0)
+        lower_bound = float(np.hypot(dx, dy))
+
+        polygon = np.array(envelope['polygon'], dtype=float)
+        polygon[:, 0] /= flow
+        polygon[:, 1] /= (1 - self.head_tolerance) * head
+        ring = clip_to_flow_band(polygon, flow_low / flow, flow_high / flow)
+        if len(ring) < 3:
+            return None
+        return ring, lower_bound
+
+    def _candidate_points(self, ring: np.ndarray) -> List[Tuple[str, float, float]]:
+        """Head-only, flow-only and combined moves into the ring, nudged past the boundary."""
+        points = []
+        head_target = nearest_on_line(ring, 0, 1.0, 1.0)
+        if head_target is not None:
+            points.append(('head', 1.0, head_target + np.sign(head_target - 1.0) * self.margin))
+        flow_target = nearest_on_line(ring, 1, 1.0, 1.0)
+        if flow_target is not None:
+            points.append(('flow', flow_target + np.sign(flow_target - 1.0) * self.margin, 1.0))
+        distance, nearest = nearest_on_boundary(ring, (1.0, 1.0))
+        if distance > 0:
+            direction = (nearest - 1.0) / distance
+            x, y = nearest + direction * self.margin
+            points.append(('flow_and_head', float(x), float(y)))
+        return [p for p in points if abs(p[1] - 1.0) <= self.max_change and abs(p[2] - 1.0) <= self.max_change]
+
+    @staticmethod
+    def _message(pump_code: str, change: str, flow: float, head: float,
+                 new_flow: float, new_head: float) -> str:
+        """Human-readable suggestion."""
+        if change == 'head':
+            return f"{pump_code} works if head {'≤' if new_head < head else '≥'} {new_head:.1f} m"
+        if change == 'flow':
+            return f"{pump_code} works if flow {'≤' if new_flow < flow else '≥'} {new_flow:.1f} m³/hr"
+        return f"{pump_code} works at {new_flow:.1f} m³/hr @ {new_head:.1f} m"
+
+    def suggest(self, flow: float, head: float, constraints: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Rank the closest pumps by the smallest duty change that makes them feasible.
+
+        Distances are measured on envelope polygons clipped to the accepted
+        QBP band (relative change, sqrt(dQ/Q² + dH/H²)); pumps are visited in
+        bounding-box order and the search stops once no remaining box can beat
+        the current shortlist. Every suggested point is then confirmed in one
+        batched evaluation.
+
+        Args:
+            flow: Requested flow in m³/hr
+            head: Requested head in meters
+            constraints: Optional constraints (pump_type, max_tier, max_results)
+
+        Returns:
+            Dictionary with ranked 'suggestions' (pump_code, distance and
+            per-move options with messages) and search statistics
+        """
+        constraints = constraints or {}
+        max_tier = min(max(int(constraints.get('max_tier', self.max_tier)), 1), 3)
+        max_results = constraints.get('max_results', self.max_suggestions)
+        type_constraint = (constraints.get('pump_type') or 'GENERAL').upper()
+
+        regions = []
+        for pump in self.brain.repository.get_pump_models():
+            if type_constraint != 'GENERAL' and (pump.get('pump_type') or '').upper() != type_constraint:
+                continue
+            region = self._feasible_region(pump, flow, head, max_tier)
+            if region:
+                regions.append((region[1], len(regions), pump, region[0]))
+        regions.sort(key=lambda r: (r[0], r[1]))
+
+        # Exact shortlist: stop once a box lower bound exceeds the k-th best distance
+        shortlist: List[Tuple[float, int, Dict[str, Any], List[Tuple[str, float, float]]]] = []
+        worst: List[float] = []
+        measured = 0
+        for lower_bound, order, pump, ring in regions:
+            if len(worst) >= max_results and lower_bound > -worst[0]:
+                break
+            measured += 1
+            if point_in_polygon(ring.tolist(), 1.0, 1.0):
+                continue  # Geometrically feasible already; excluded for other reasons
+            points = self._candidate_points(ring)
+            if not points:
+                continue
+            distance = min(np.hypot(x - 1.0, y - 1.0) for _, x, y in points)
+            shortlist.append((distance, order, pump, points))
+            heapq.heappush(worst, -distance)
+            if len(worst) > max_results:
+                heapq.heappop(worst)
+        shortlist.sort(key=lambda s: (s[0], s[1]))
+        shortlist = shortlist[:max_results]
+
+        result = {
+            'flow_m3hr': flow,
+            'head_m': head,
+            'max_tier': max_tier,
+            'suggestions': [],
+            'pumps_considered': len(regions),
+            'pumps_measured': measured
+        }
+        if not shortlist:
+            return result
+
+        # Confirm every suggested point in one batch (each pump read at its own points)
+        pumps = [s[2] for s in shortlist]
+        flows = [x * flow for s in shortlist for _, x, _ in s[3]]
+        heads = [y * head for s in shortlist for _, _, y in s[3]]
+        batch = self.brain.batch_evaluator.evaluate(pumps, flows, heads)
+        row_index = {row['pump_code']: i for i, row in enumerate(batch['rows'])}
+
+        column = 0
+        for distance, _, pump, points in shortlist:
+            pump_code = pump.get('pump_code')
+            i = row_index.get(pump_code)
+            options = []
+            for change, x, y in points:
+                j = column
+                column += 1
+                if i is None or not batch['feasible'][i, j] or int(batch['tier'][i, j]) > max_tier:
+                    continue
+                new_flow, new_head = x * flow, y * head
+                options.append({
+                    'change': change,
+                    'flow_m3hr': new_flow,
+                    'head_m': new_head,
+                    'flow_change_pct': (x - 1.0) * 100.0,
+                    'head_change_pct': (y - 1.0) * 100.0,
+                    'tier': int(batch['tier'][i, j]),
+                    'efficiency_pct': float(batch['efficiency_pct'][i, j]),
+                    'message': self._message(pump_code, change, flow, head, new_flow, new_head)
+                })
+            if options:
+                options.sort(key=lambda o: np.hypot(o['flow_change_pct'], o['head_change_pct']))
+                result['suggestions'].append({
+                    'pump_code': pump_code,
+                    'relative_distance': distance,
+                    'options': options
+                })
+
+        logger.info(f"[DUTY SUGGESTIONS] {len(result['suggestions'])} pumps within reach of "
+                    f"{flow:.1f} m³/hr @ {head:.1f} m ({measured} of {len(regions)} envelopes measured)")
+        return result
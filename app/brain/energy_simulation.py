@@ -0,0 +1,216 @@
+"""
+Energy Simulation Module
+========================
+Vectorized 8760-hour VFD energy simulation on a system curve
+"""
+
+import logging
+from typing import Dict, List, Any, Optional, Sequence
+import numpy as np
+from .batch_evaluator import batched_interp
+from .config_manager import config
+
+logger = logging.getLogger(__name__)
+
+
+class EnergySimulator:
+    """Simulates a year of variable-speed operation against an hourly demand profile"""
+
+    def __init__(self, brain):
+        """
+        Initialize with reference to main Brain.
+
+        Args:
+            brain: Parent PumpBrain instance
+        """
+        self.brain = brain
+
+        self.hours_per_year = config.get('energy_simulation', 'hours_per_year')
+        self.electricity_rate = config.get('energy_simulation', 'electricity_rate_per_kwh')
+        self.motor_efficiency = config.get('energy_simulation', 'motor_efficiency_pct') / 100.0
+        self.vfd_efficiency = config.get('energy_simulation', 'vfd_efficiency_pct') / 100.0
+        self.emission_factor = config.get('energy_simulation', 'grid_emission_factor_kg_co2_per_kwh')
+        self.profile_flow_pct = config.get('energy_simulation', 'default_load_profile_flow_percentages')
+        self.profile_fractions = config.get('energy_simulation', 'default_load_profile_time_fractions')
+        self.default_top_n = config.get('energy_simulation', 'default_top_n_pumps')
+        self.water_density = config.get('energy_simulation', 'water_density_kg_m3')
+        self.gravity = config.get('energy_simulation', 'gravitational_acceleration_m_s2')
+        self.seconds_per_hour = config.get('energy_simulation', 'seconds_per_hour')
+
+    def build_demand_profile(self, design_flow: float,
+                             hourly_flows: Optional[Sequence[float]] = None) -> np.ndarray:
+        """
+        Build the hourly flow demand for one year.
+
+        Args:
+            design_flow: Design flow in m³/hr
+            hourly_flows: Optional explicit demand (one value per hour)
+
+        Returns:
+            Array of hours_per_year flows in m³/hr
+        """
+        if hourly_flows is not None:
+            demand = np.asarray(hourly_flows, dtype=float)
+            if demand.shape != (self.hours_per_year,):
+                raise ValueError(f"Hourly demand must have {self.hours_per_year} values, got {demand.size}")
+            if not np.isfinite(demand).all() or (demand < 0).any():
+                raise ValueError("Hourly demand must be finite and non-negative")
+            return demand
+
+        # Default load-duration profile: blocks of hours at each demand level
+        hours = np.round(np.asarray(self.profile_fractions, dtype=float) * self.hours_per_year).astype(int)
+        hours[-1] += self.hours_per_year - hours.sum()
+        levels = design_flow * np.asarray(self.profile_flow_pct, dtype=float) / 100.0
+        return np.repeat(levels, hours)
+
+    def simulate(self, pump_data: Dict[str, Any], design_flow: float, design_head: float,
+                 hourly_flows: Optional[Sequence[float]] = None,
+                 h_static_ratio: Optional[float] = None,
+                 electricity_rate: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Simulate a year of VFD operation for one pump.
+
+        The system curve H = H_static + k·Q² passes through the design point.
+        Each distinct hourly demand is solved once for speed ratio, efficiency
+        and input power (Q = s·Q1, H = s²·H1 on the full-diameter curve);
+        annual totals are hour-weighted sums over the distinct levels. Hours
+        the pump cannot meet within its speed range are reported as unmet and
+        carry no energy.
+
+        Args:
+            pump_data: Pump data from repository
+            design_flow: Design flow in m³/hr
+            design_head: Design head in meters
+            hourly_flows: Optional explicit hourly demand
+            h_static_ratio: Static head fraction (defaults to performance_vfd setting)
+            electricity_rate: Tariff per kWh (defaults to config)
+
+        Returns:
+            Energy and cost summary, or None if the pump is not variable speed
+        """
+        pump_code = pump_data.get('pump_code', '')
+        if not pump_data.get('specifications', {}).get('variable_speed', False):
+            logger.info(f"[ENERGY SIM] {pump_code}: Not variable speed - skipping simulation")
+            return None
+
+        batch = self.brain.batch_evaluator
+        row = batch.compile_pump(pump_data)
+        if row is None:
+            logger.warning(f"[ENERGY SIM] {pump_code}: No usable reference curve")
+            return None
+
+        if h_static_ratio is None:
+            h_static_ratio = config.get('performance_vfd', 'default_static_head_ratio_for_system_curves')
+        if electricity_rate is None:
+            electricity_rate = self.electricity_rate
+
+        demand = self.build_demand_profile(design_flow, hourly_flows)
+
+        # Solve each distinct demand level once
+        levels, inverse = np.unique(demand, return_inverse=True)
+        hours = np.bincount(inverse).astype(float)
+
+        h_static = design_head * h_static_ratio
+        k_system = (design_head - h_static) / design_flow ** 2
+        required_head = h_static + k_system * levels ** 2
+
+        s = batch.stack([row])
+        Q = levels[np.newaxis, :]
+        H = required_head[np.newaxis, :]
+        speed_ratio, _, efficiency, _, feasible = batch.solve_speed(s, Q, H)
+
+        drive_efficiency = self.motor_efficiency * self.vfd_efficiency
+        running = levels > 0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            hydraulic_kw = (self.water_density * self.gravity * Q * H) / (self.seconds_per_hour * 1000.0)
+            input_kw = hydraulic_kw / (efficiency / 100.0) / drive_efficiency
+
+            # Fixed-speed baseline: full speed, throttled to the same flow
+            full_head = batched_interp(s['flows'], s['heads'], Q)
+            full_eff = batched_interp(s['flows'], s['effs'], Q)
+            baseline_kw = (self.water_density * self.gravity * Q * full_head) / \
+                (self.seconds_per_hour * 1000.0 * full_eff / 100.0) / self.motor_efficiency
+
+        served = (feasible[0] & running)
+        input_kw = np.where(served, input_kw[0], 0.0)
+        baseline_ok = running & np.isfinite(baseline_kw[0])
+        baseline_kw = np.where(baseline_ok, baseline_kw[0], 0.0)
+
+        annual_kwh = float(np.dot(input_kw, hours))
+        baseline_kwh = float(np.dot(baseline_kw, hours))
+        served_hours = float(hours[served].sum())
+        unmet_hours = float(hours[running & ~served].sum())
+        delivered_m3 = float(np.dot(levels * served, hours))
+        hydraulic_kwh = float(np.dot(np.where(served, hydraulic_kw[0], 0.0), hours))
+        savings_kwh = baseline_kwh - annual_kwh if baseline_ok[served].all() else None
+
+        summary = {
+            'pump_code': pump_code,
+            'design_flow_m3hr': design_flow,
+            'design_head_m': design_head,
+            'static_head_m': h_static,
+            'static_head_ratio': h_static_ratio,
+            'electricity_rate_per_kwh': electricity_rate,
+            'annual_energy_kwh': annual_kwh,
+            'annual_energy_cost': annual_kwh * electricity_rate,
+            'annual_co2_kg': annual_kwh * self.emission_factor,
+            'running_hours': served_hours,
+            'unmet_demand_hours': unmet_hours,
+            'delivered_volume_m3': delivered_m3,
+            'specific_energy_kwh_per_m3': annual_kwh / delivered_m3 if delivered_m3 > 0 else None,
+            'average_input_power_kw': annual_kwh / served_hours if served_hours > 0 else 0.0,
+            'peak_input_power_kw': float(input_kw.max()) if input_kw.size else 0.0,
+            'wire_to_water_efficiency_pct': hydraulic_kwh / annual_kwh * 100.0 if annual_kwh > 0 else None,
+            'speed_ratio_range': [float(speed_ratio[0][served].min()), float(speed_ratio[0][served].max())]
+            if served.any() else None,
+            'fixed_speed_baseline_kwh': baseline_kwh,
+            'annual_savings_kwh': savings_kwh,
+            'annual_savings_cost': savings_kwh * electricity_rate if savings_kwh is not None else None,
+            'savings_percent': savings_kwh / baseline_kwh * 100.0 if savings_kwh is not None and baseline_kwh > 0 else None,
+            'load_levels': [
+                {
+                    'flow_m3hr': float(levels[i]),
+                    'head_m': float(required_head[i]),
+                    'hours': float(hours[i]),
+                    'served': bool(served[i]),
+                    'speed_percent': float(speed_ratio[0, i] * 100.0) if served[i] else None,
+                    'efficiency_pct': float(efficiency[0, i]) if served[i] else None,
+                    'input_power_kw': float(input_kw[i])
+                }
+                for i in range(len(levels))
+            ]
+        }
+
+        if unmet_hours:
+            logger.warning(f"[ENERGY SIM] {pump_code}: {unmet_hours:.0f} h of demand outside speed range")
+        logger.debug(f"[ENERGY SIM] {pump_code}: {annual_kwh:,.0f} kWh/yr over {len(levels)} demand levels")
+        return summary
+
+    def simulate_selection(self, ranked_pumps: List[Dict[str, Any]], design_flow: float,
+                           design_head: float, top_n: Optional[int] = None,
+                           **kwargs) -> List[Dict[str, Any]]:
+        """
+        Simulate the top-N variable-speed pumps of a selection result.
+
+        Args:
+            ranked_pumps: 'ranked_pumps' list from find_best_pumps
+            design_flow: Design flow in m³/hr
+            design_head: Design head in meters
+            top_n: Number of pumps to simulate (defaults to config)
+            **kwargs: Passed through to simulate
+
+        Returns:
+            Summaries ordered as in the selection (pumps without VFD capability are skipped)
+        """
+        top_n = top_n or self.default_top_n
+        summaries = []
+        for evaluation in ranked_pumps:
+            if len(summaries) >= top_n:
+                break
+            pump_data = self.brain.get_pump(evaluation.get('pump_code', ''))
+            if not pump_data:
+                continue
+            summary = self.simulate(pump_data, design_flow, design_head, **kwargs)
+            if summary:
+                summaries.append(summary)
+        return summaries
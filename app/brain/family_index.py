@@ -0,0 +1,228 @@
+"""
+Family Index Module
+===================
+Load-time grouping of pumps by manufacturer, series and type with aggregate bounds
+"""
+
+import logging
+from typing import Dict, List, Any, Optional, Tuple
+from .operating_envelope import OperatingEnvelope
+
+logger = logging.getLogger(__name__)
+
+# Family indexes by catalog version
+_family_indexes: Dict[str, 'FamilyIndex'] = {}
+
+
+def family_key(pump: Dict[str, Any]) -> Tuple[str, str, str]:
+    """
+    Group key of a pump: (manufacturer, series, pump type).
+
+    Series is the catalogue 'model_series', else the first token of the pump
+    code (the same split the selection log uses for its series breakdown).
+    Pump type is upper-cased exactly as the selection type filter compares it.
+    """
+    code = str(pump.get('pump_code', ''))
+    series = pump.get('model_series') or (code.split()[0] if code.split() else '')
+    return (
+        str(pump.get('manufacturer') or ''),
+        str(series),
+        str(pump.get('pump_type') or '').upper()
+    )
+
+
+class PumpFamily:
+    """Members of one family and their aggregate bounds"""
+
+    def __init__(self, key: Tuple[str, str, str]):
+        """
+        Args:
+            key: Family key from family_key()
+        """
+        self.key = key
+        self.positions: List[int] = []
+
+        # BEP ranges over members with positive BEP data (drive pre-filter pruning)
+        self.bep_flow_min = float('inf')
+        self.bep_flow_max = float('-inf')
+        self.bep_head_min = float('inf')
+        self.bep_head_max = float('-inf')
+        self.all_bep_heads_positive = True
+
+        # Union of member operating envelopes
+        self.envelope_flow_min = float('inf')
+        self.envelope_flow_max = float('-inf')
+        self.envelope_head_min = float('inf')
+        self.envelope_head_max = float('-inf')
+
+        # Best-efficiency bounds over tested points and catalogue BEP values
+        self.efficiency_min_pct = float('inf')
+        self.efficiency_max_pct = float('-inf')
+        self.any_variable_speed = False
+
+    def add(self, position: int, pump: Dict[str, Any]):
+        """Add one catalog pump to the family."""
+        self.positions.append(position)
+        specs = pump.get('specifications', {})
+
+        bep_flow = specs.get('bep_flow_m3hr', 0) or 0
+        bep_head = specs.get('bep_head_m', 0) or 0
+        if bep_flow > 0:
+            self.bep_flow_min = min(self.bep_flow_min, bep_flow)
+            self.bep_flow_max = max(self.bep_flow_max, bep_flow)
+        if bep_head > 0:
+            self.bep_head_min = min(self.bep_head_min, bep_head)
+            self.bep_head_max = max(self.bep_head_max, bep_head)
+        else:
+            self.all_bep_heads_positive = False
+
+        envelope = OperatingEnvelope.get_envelope(pump)
+        if envelope:
+            heads = [h for _, h in envelope['polygon']]
+            self.envelope_flow_min = min(self.envelope_flow_min, envelope['flow_min_m3hr'])
+            self.envelope_flow_max = max(self.envelope_flow_max, envelope['flow_max_m3hr'])
+            self.envelope_head_min = min(self.envelope_head_min, min(heads))
+            self.envelope_head_max = max(self.envelope_head_max, envelope['head_max_m'])
+
+        efficiencies = [p.get('efficiency_pct') for curve in pump.get('curves', [])
+                        for p in curve.get('performance_points', []) if p.get('efficiency_pct')]
+        efficiencies += [e for e in (specs.get('bep_efficiency'), specs.get('bep_efficiency_pct')) if e]
+        if efficiencies:
+            self.efficiency_min_pct = min(self.efficiency_min_pct, min(efficiencies))
+            self.efficiency_max_pct = max(self.efficiency_max_pct, max(efficiencies))
+        self.any_variable_speed = self.any_variable_speed or bool(specs.get('variable_speed', False))
+
+    def fails_prefilter(self, flow_range: Tuple[float, float], head_range: Tuple[float, float]) -> Optional[str]:
+        """
+        Whether every member fails the selection BEP pre-filter.
+
+        A member passes only with 0 < BEP flow inside flow_range, and fails the
+        head check only with 0 < BEP head outside head_range; the family
+        bounds decide both for all members at once.
+
+        Args:
+            flow_range: (minimum, maximum) BEP flow thresholds in m³/hr
+            head_range: (minimum, maximum) BEP head thresholds in meters
+
+        Returns:
+            'flow' or 'head' if the whole family fails, else None
+        """
+        if self.bep_flow_max < flow_range[0] or self.bep_flow_min > flow_range[1]:
+            return 'flow'  # Also covers families with no positive BEP flow
+        if self.all_bep_heads_positive and (self.bep_head_max < head_range[0] or self.bep_head_min > head_range[1]):
+            return 'head'
+        return None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-safe summary of the family."""
+        def bound(value):
+            return value if value not in (float('inf'), float('-inf')) else None
+
+        return {
+            'manufacturer': self.key[0],
+            'series': self.key[1],
+            'pump_type': self.key[2],
+            'member_count': len(self.positions),
+            'bep_flow_range_m3hr': [bound(self.bep_flow_min), bound(self.bep_flow_max)],
+            'bep_head_range_m': [bound(self.bep_head_min), bound(self.bep_head_max)],
+            'envelope_flow_range_m3hr': [bound(self.envelope_flow_min), bound(self.envelope_flow_max)],
+            'envelope_head_range_m': [bound(self.envelope_head_min), bound(self.envelope_head_max)],
+            'efficiency_range_pct': [bound(self.efficiency_min_pct), bound(self.efficiency_max_pct)],
+            'any_variable_speed': self.any_variable_speed
+        }
+
+
+class FamilyIndex:
+    """Families of one catalog, used to prune whole groups before per-pump work"""
+
+    def __init__(self, pump_models: List[Dict[str, Any]], catalog_version: str):
+        """
+        Args:
+            pump_models: Catalog pump list (positions refer to this list)
+            catalog_version: Catalog build stamp
+        """
+        self.catalog_version = catalog_version
+        self.pump_count = len(pump_models)
+        families: Dict[Tuple[str, str, str], PumpFamily] = {}
+        for position, pump in enumerate(pump_models):
+            key = family_key(pump)
+            if key not in families:
+                families[key] = PumpFamily(key)
+            families[key].add(position, pump)
+        self.families = list(families.values())
+
+    @staticmethod
+    def precompute_catalog(pump_models: List[Dict[str, Any]], catalog_version: str) -> Dict[str, Any]:
+        """
+        Build the family index of a freshly loaded catalog.
+
+        Args:
+            pump_models: Loaded pump models
+            catalog_version: Catalog build stamp
+
+        Returns:
+            Summary statistics for catalog metadata
+        """
+        _family_indexes.clear()
+        index = FamilyIndex(pump_models, catalog_version)
+        _family_indexes[catalog_version] = index
+        sizes = [len(f.positions) for f in index.families]
+        logger.info(f"[FAMILY INDEX] {len(pump_models)} pumps in {len(sizes)} families")
+        return {
+            'families': len(sizes),
+            'largest_family': max(sizes) if sizes else 0,
+            'single_pump_families': sum(1 for s in sizes if s == 1)
+        }
+
+    @staticmethod
+    def get_index(pump_models: List[Dict[str, Any]], catalog_version: str) -> 'FamilyIndex':
+        """
+        Get the family index of the loaded catalog, building it on demand.
+
+        Args:
+            pump_models: Catalog pump list
+            catalog_version: Catalog build stamp
+
+        Returns:
+            FamilyIndex
+        """
+        index = _family_indexes.get(catalog_version)
+        if index is None or index.pump_count != len(pump_models):
+            _family_indexes.clear()
+            index = FamilyIndex(pump_models, catalog_version)
+            _family_indexes[catalog_version] = index
+        return index
+
+    def prune(self, pump_models: List[Dict[str, Any]], flow_range: Tuple[float, float],
+              head_range: Tuple[float, float], type_constraint: Optional[str] = None) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+        """
+        Drop whole families that cannot pass the selection pre-filter.
+
+        Survivors keep catalog order so downstream ranking ties break
+        exactly as in an unpruned run.
+
+        Args:
+            pump_models: Catalog pump list the index was built from
+            flow_range: BEP flow pre-filter thresholds
+            head_range: BEP head pre-filter thresholds
+            type_constraint: Upper-case pump type to keep, or None for all
+
+        Returns:
+            (surviving pumps, statistics)
+        """
+        stats = {'families': len(self.families), 'flow_pruned': 0, 'head_pruned': 0,
+                 'type_pruned': 0, 'pumps_pruned': 0}
+        positions = []
+        for family in self.families:
+            reason = None
+            if type_constraint and family.key[2] != type_constraint:
+                reason = 'type'
+            else:
+                reason = family.fails_prefilter(flow_range, head_range)
+            if reason:
+                stats[f'{reason}_pruned'] += 1
+                stats['pumps_pruned'] += len(family.positions)
+            else:
+                positions.extend(family.positions)
+        positions.sort()
+        return [pump_models[i] for i in positions], stats
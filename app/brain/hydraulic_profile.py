@@ -0,0 +1,138 @@
+"""
+Hydraulic Profile Module
+========================
+Catalog-time specific speed, hydraulic class and physics exponents per pump
+"""
+
+import logging
+import math
+from typing import Dict, List, Any
+from .hydraulic_classifier import HydraulicClassifier
+from .physics_models import get_exponents_for_pump_type, normalize_pump_type
+from .config_manager import config
+
+logger = logging.getLogger(__name__)
+
+
+class HydraulicProfiler:
+    """Computes per-pump hydraulic data that depends only on catalog data"""
+
+    @staticmethod
+    def build_profile(pump: Dict[str, Any], catalog_version: str = '') -> Dict[str, Any]:
+        """
+        Build the hydraulic profile of one pump.
+
+        Specific speed uses the same speed rule as the proximity search
+        (specifications 'speed_rpm', else the 2-pole 50 Hz default), so the
+        stored class matches what was previously computed per request.
+
+        Args:
+            pump: Pump model
+            catalog_version: Catalog build stamp
+
+        Returns:
+            Profile dictionary
+        """
+        specs = pump.get('specifications', {})
+        pump_type = pump.get('pump_type', '')
+        bep_flow = specs.get('bep_flow_m3hr') or 0
+        bep_head = specs.get('bep_head_m') or 0
+        npshr_at_bep = specs.get('npshr_at_bep') or 0
+
+        speed_rpm = specs.get('speed_rpm', config.get('proximity_searcher', 'default_2pole_motor_speed_at_50hz_rpm'))
+        has_bep = bep_flow > 0 and bep_head > 0
+
+        specific_speed = HydraulicClassifier.calculate_specific_speed(bep_flow, bep_head, speed_rpm) if has_bep else 0
+
+        # Suction specific speed: Nss = N√Q / NPSHr^(3/4) at BEP
+        suction_specific_speed = None
+        if bep_flow > 0 and npshr_at_bep > 0:
+            flow_m3s = bep_flow / config.get('hydraulic_profile', 'seconds_per_hour')
+            exponent = config.get('hydraulic_classifier', 'head_exponent_for_specific_speed_calculation')
+            suction_specific_speed = speed_rpm * math.sqrt(flow_m3s) / npshr_at_bep ** exponent
+
+        if specific_speed < config.get('proximity_searcher', 'specific_speed_threshold_for_radial_pumps'):
+            operating_range_score = config.get('proximity_searcher', 'operating_range_score_for_radial_pumps')
+        elif specific_speed < config.get('proximity_searcher', 'specific_speed_threshold_for_mixed_flow_pumps'):
+            operating_range_score = config.get('proximity_searcher', 'operating_range_score_for_mixed_flow_pumps')
+        else:
+            operating_range_score = config.get('proximity_searcher', 'operating_range_score_for_axial_pumps')
+
+        bep_efficiency = specs.get('bep_efficiency_pct')
+        bep_power = None
+        if has_bep and bep_efficiency:
+            bep_power = (config.get('hydraulic_profile', 'water_density_kg_m3') *
+                         config.get('hydraulic_profile', 'gravitational_acceleration_m_s2') * bep_flow * bep_head) / \
+                (config.get('hydraulic_profile', 'seconds_per_hour') * bep_efficiency / 100.0 * 1000.0)
+
+        return {
+            'normalized_type': normalize_pump_type(pump_type),
+            'physics_exponents': get_exponents_for_pump_type(pump_type),
+            'speed_rpm': speed_rpm,
+            'specific_speed': specific_speed,
+            'suction_specific_speed': suction_specific_speed,
+            'hydraulic_class': HydraulicClassifier.classify_pump_hydraulic_type(specific_speed),
+            'operating_range_score': operating_range_score,
+            'has_bep': has_bep,
+            'bep_flow_m3hr': bep_flow,
+            'bep_head_m': bep_head,
+            'bep_efficiency_pct': bep_efficiency,
+            'bep_npshr_m': npshr_at_bep or None,
+            'bep_power_kw': bep_power,
+            'catalog_version': catalog_version
+        }
+
+    @staticmethod
+    def precompute_catalog(pump_models: List[Dict[str, Any]], catalog_version: str) -> Dict[str, Any]:
+        """
+        Attach a 'hydraulic_profile' to every pump of the catalog.
+
+        Args:
+            pump_models: Loaded pump models
+            catalog_version: Catalog build stamp
+
+        Returns:
+            Summary statistics for catalog metadata
+        """
+        by_class: Dict[str, int] = {}
+        by_type: Dict[str, int] = {}
+        for pump in pump_models:
+            profile = HydraulicProfiler.build_profile(pump, catalog_version)
+            pump['hydraulic_profile'] = profile
+            class_name = profile['hydraulic_class']['type']
+            by_class[class_name] = by_class.get(class_name, 0) + 1
+            by_type[profile['normalized_type']] = by_type.get(profile['normalized_type'], 0) + 1
+
+        logger.info(f"[HYDRAULIC PROFILE] {len(pump_models)} pumps profiled: {by_class}")
+        return {'pumps_profiled': len(pump_models), 'hydraulic_classes': by_class, 'normalized_types': by_type}
+
+    @staticmethod
+    def get_profile(pump: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Get the stored profile of a pump, building it once for pumps that were
+        not loaded through the catalog (e.g. derived variants).
+
+        Args:
+            pump: Pump data
+
+        Returns:
+            Profile dictionary
+        """
+        profile = pump.get('hydraulic_profile')
+        if profile is None:
+            profile = HydraulicProfiler.build_profile(pump)
+            pump['hydraulic_profile'] = profile
+        return profile
+
+    @staticmethod
+    def get_exponents(pump: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Physics model exponents of a pump (a copy callers may modify).
+
+        Args:
+            pump: Pump data
+
+        Returns:
+            Exponent dictionary as returned by get_exponents_for_pump_type
+        """
+        return dict(HydraulicProfiler.get_profile(pump)['physics_exponents'])
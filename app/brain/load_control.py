@@ -0,0 +1,263 @@
+"""
+Load Control Module
+===================
+Load-aware fidelity levels that trade result detail for tail latency
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, List, Any, Optional
+
+from flask import current_app, g, has_app_context, request
+from .config_manager import config
+from ..process_logger import process_logger
+
+logger = logging.getLogger(__name__)
+
+# Attribute names used on flask.g
+_LEVEL_ATTR = '_brain_fidelity_level'
+_STARTED_ATTR = '_brain_request_started'
+
+# Process-wide controller (each gunicorn worker tracks its own load)
+_controller: Optional['LoadController'] = None
+
+
+class LoadController:
+    """
+    Picks a fidelity level from in-flight requests, recent latency and queue wait.
+
+    Levels step down (less detail) as soon as a level's pressure threshold is
+    met and step back up one level at a time once load has stayed below the
+    current level's thresholds, scaled by the recovery factor, for the hold
+    period. A request keeps the level it started with.
+    """
+
+    def __init__(self):
+        """Initialize from the load_control configuration."""
+        self.enabled = config.get('load_control', 'adaptive_fidelity_enabled')
+        self.levels: List[Dict[str, Any]] = config.get('load_control', 'fidelity_levels')
+        self.percentile = config.get('load_control', 'latency_percentile')
+        self.recovery_factor = config.get('load_control', 'recovery_threshold_factor')
+        self.recovery_hold = config.get('load_control', 'recovery_hold_seconds')
+        window = config.get('load_control', 'latency_window_requests')
+
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._latencies_ms = deque(maxlen=window)
+        self._queue_wait_ms = 0.0
+        self._level = 0
+        self._calm_since: Optional[float] = None
+        self._verbose_logging = process_logger.enabled
+        self._stats = {
+            'requests_by_level': {level['name']: 0 for level in self.levels},
+            'transitions': 0,
+            'last_transition': None
+        }
+
+    def _latency_percentile(self) -> float:
+        """Configured percentile of recent request latencies in ms (0 without samples)."""
+        if not self._latencies_ms:
+            return 0.0
+        ordered = sorted(self._latencies_ms)
+        return ordered[min(int(len(ordered) * self.percentile / 100.0), len(ordered) - 1)]
+
+    def _pressure_level(self, scale: float = 1.0) -> int:
+        """Highest level whose in-flight, latency or queue-wait threshold is met."""
+        signals = {
+            'in_flight': self._in_flight,
+            'latency_ms': self._latency_percentile(),
+            'queue_wait_ms': self._queue_wait_ms
+        }
+        level = 0
+        for index, spec in enumerate(self.levels):
+            if any(spec.get(name) and value >= spec[name] * scale for name, value in signals.items()):
+                level = index
+        return level
+
+    def _set_level(self, level: int, now: float):
+        """Switch level, applying its logging policy."""
+        previous = self.levels[self._level]['name']
+        if self.levels[self._level].get('settings', {}).get('verbose_logging', True):
+            self._verbose_logging = process_logger.enabled  # Remember the operator's choice
+        self._level = level
+        self._stats['transitions'] += 1
+        self._stats['last_transition'] = now
+        settings = self.levels[level].get('settings', {})
+        process_logger.enabled = self._verbose_logging and settings.get('verbose_logging', True)
+        logger.warning(f"[LOAD CONTROL] Fidelity {previous} -> {self.levels[level]['name']} "
+                       f"(in flight {self._in_flight}, p{self.percentile} {self._latency_percentile():.0f}ms, "
+                       f"queue {self._queue_wait_ms:.0f}ms)")
+
+    def _update_level(self, now: float):
+        """Step down immediately under pressure, step up one level after a calm hold."""
+        target = self._pressure_level()
+        if target > self._level:
+            self._calm_since = None
+            self._set_level(target, now)
+        elif self._level > 0 and self._pressure_level(self.recovery_factor) < self._level:
+            if self._calm_since is None:
+                self._calm_since = now
+            elif now - self._calm_since >= self.recovery_hold:
+                self._calm_since = now
+                self._set_level(self._level - 1, now)
+        else:
+            self._calm_since = None
+
+    @staticmethod
+    def _queue_wait(header: Optional[str], now: float) -> float:
+        """
+        Queue wait from a proxy X-Request-Start header ('t=<epoch>' in s, ms or µs).
+
+        Returns:
+            Wait in ms (0 when absent or unparseable)
+        """
+        if not header:
+            return 0.0
+        try:
+            stamp = float(header.split('=')[-1])
+        except ValueError:
+            return 0.0
+        while stamp > now * 100:
+            stamp /= 1000.0  # ms or µs -> s
+        return max((now - stamp) * 1000.0, 0.0)
+
+    def request_started(self, queue_header: Optional[str] = None) -> int:
+        """
+        Register a request and fix its fidelity level.
+
+        Args:
+            queue_header: Optional X-Request-Start header value
+
+        Returns:
+            Fidelity level index for the request
+        """
+        now = time.time()
+        with self._lock:
+            self._in_flight += 1
+            self._queue_wait_ms = self._queue_wait(queue_header, now)
+            if self.enabled:
+                self._update_level(now)
+            level = self._level
+            self._stats['requests_by_level'][self.levels[level]['name']] += 1
+        return level
+
+    def request_finished(self, duration_ms: float):
+        """
+        Register the end of a request.
+
+        Args:
+            duration_ms: Request duration in ms
+        """
+        with self._lock:
+            self._in_flight = max(self._in_flight - 1, 0)
+            self._latencies_ms.append(duration_ms)
+
+    def current_level(self) -> int:
+        """Level of the current request, else the controller's level."""
+        if has_app_context() and hasattr(g, _LEVEL_ATTR):
+            return getattr(g, _LEVEL_ATTR)
+        return self._level
+
+    def setting(self, key: str, default: Any = None) -> Any:
+        """
+        Setting of the current fidelity level.
+
+        Args:
+            key: Setting name (e.g. include_exclusions, max_candidates)
+            default: Value when the level does not restrict it
+
+        Returns:
+            Setting value
+        """
+        return self.levels[self.current_level()].get('settings', {}).get(key, default)
+
+    def bind_current_level(self, task: Callable[[], Any]) -> Callable[[], Any]:
+        """
+        Pin a task to the current request's fidelity level.
+
+        Used for work that finishes on another thread (e.g. background cache
+        refreshes) so it computes at the level its cache key was built with.
+
+        Args:
+            task: Callable to run later
+
+        Returns:
+            Callable that runs task inside an app context at the captured level
+        """
+        if not has_app_context():
+            return task
+        level = self.current_level()
+        app = current_app._get_current_object()
+
+        def run():
+            with app.app_context():
+                setattr(g, _LEVEL_ATTR, level)
+                return task()
+        return run
+
+    def describe(self) -> Dict[str, Any]:
+        """Level in use, for responses."""
+        level = self.current_level()
+        return {'level': level, 'name': self.levels[level]['name']}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get load and fidelity statistics.
+
+        Returns:
+            Statistics dictionary
+        """
+        with self._lock:
+            return {
+                'enabled': self.enabled,
+                'level': self._level,
+                'level_name': self.levels[self._level]['name'],
+                'in_flight': self._in_flight,
+                f'latency_p{self.percentile}_ms': self._latency_percentile(),
+                'queue_wait_ms': self._queue_wait_ms,
+                'requests_by_level': dict(self._stats['requests_by_level']),
+                'transitions': self._stats['transitions'],
+                'last_transition': self._stats['last_transition']
+            }
+
+
+def get_load_controller() -> LoadController:
+    """
+    Get the process-wide load controller.
+
+    Returns:
+        LoadController
+    """
+    global _controller
+    if _controller is None:
+        _controller = LoadController()
+    return _controller
+
+
+def register_request_hooks(app):
+    """
+    Track every non-static request and tag responses with the fidelity level.
+
+    Args:
+        app: Flask application
+    """
+    @app.before_request
+    def start_load_tracking():
+        if request.endpoint == 'static':
+            return
+        setattr(g, _STARTED_ATTR, time.monotonic())
+        setattr(g, _LEVEL_ATTR, get_load_controller().request_started(request.headers.get('X-Request-Start')))
+
+    @app.after_request
+    def tag_fidelity(response):
+        if hasattr(g, _LEVEL_ATTR):
+            response.headers['X-Brain-Fidelity'] = get_load_controller().levels[getattr(g, _LEVEL_ATTR)]['name']
+        return response
+
+    @app.teardown_request
+    def finish_load_tracking(exception=None):
+        started = getattr(g, _STARTED_ATTR, None)
+        if started is not None:
+            get_load_controller().request_finished((time.monotonic() - started) * 1000.0)
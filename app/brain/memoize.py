@@ -0,0 +1,78 @@
+"""
+Brain Memoization Module
+========================
+Declarative memoization of Brain facade methods on typed argument keys
+"""
+
+import copy
+import inspect
+import logging
+from functools import wraps
+from typing import Any, Callable, Optional
+
+from .cache import BrainCache
+from .request_context import get_request_context
+
+logger = logging.getLogger(__name__)
+
+# Where a memoized result lives
+SCOPE_REQUEST = 'request'  # Current request only
+SCOPE_PROCESS = 'process'  # BrainCache L1 of this worker
+SCOPE_SHARED = 'shared'    # BrainCache L1 and the host-wide L2
+
+
+def memoized(namespace: str, ttl: Optional[int] = None, scope: str = SCOPE_SHARED, version: int = 1,
+             catalog: bool = True, fidelity: bool = True,
+             negative: Optional[Callable[[Any], bool]] = None,
+             cacheable: Optional[Callable[[Any], bool]] = None,
+             copy_result: bool = False):
+    """
+    Memoize a PumpBrain method on its arguments.
+
+    The key is a tuple of the namespace, the method's version tag, the
+    catalog version, the request's fidelity level and the frozen bound
+    arguments (defaults applied, so positional and keyword calls share
+    entries). Exceptions are never cached, so input validation inside the
+    method still runs on every miss.
+
+    Args:
+        namespace: Key namespace (also the statistics group)
+        ttl: Time-to-live in seconds (cache default when None)
+        scope: SCOPE_REQUEST, SCOPE_PROCESS or SCOPE_SHARED
+        version: Tag to bump when the method's output changes shape or meaning
+        catalog: Scope entries to the loaded catalog version
+        fidelity: Scope entries to the load-control fidelity level
+        negative: Predicate marking negative results (short TTL)
+        cacheable: Predicate a result must pass to outlive the call
+        copy_result: Return a deep copy so callers may annotate the result
+            (nested rows included) without changing the cached value
+
+    Returns:
+        Method decorator
+    """
+    def decorator(method):
+        signature = inspect.signature(method)
+
+        @wraps(method)
+        def wrapper(brain, *args, **kwargs):
+            bound = signature.bind(brain, *args, **kwargs)
+            bound.apply_defaults()
+            parts = [namespace, version]
+            if catalog:
+                parts.append(brain.get_catalog_version())
+            if fidelity:
+                parts.append(brain.load_control.current_level())
+            arguments = list(bound.arguments.values())[1:]
+            key = BrainCache.make_key(*parts, *arguments)
+
+            def compute():
+                return method(brain, *args, **kwargs)
+
+            if scope == SCOPE_REQUEST:
+                result = get_request_context().memoize(namespace, key, compute)
+            else:
+                result = brain._cache.get_or_compute(key, compute, ttl=ttl, negative=negative,
+                                                     shared=scope == SCOPE_SHARED, cacheable=cacheable)
+            return copy.deepcopy(result) if copy_result else result
+        return wrapper
+    return decorator
@@ -0,0 +1,232 @@
+"""
+Multi-Pump Module
+=================
+Parallel, series and duty/standby arrangements of identical catalog pumps
+"""
+
+import logging
+from typing import Dict, List, Any, Optional
+import numpy as np
+from .config_manager import config
+
+logger = logging.getLogger(__name__)
+
+ARRANGEMENT_SINGLE = 'single'
+ARRANGEMENT_PARALLEL = 'parallel'
+ARRANGEMENT_SERIES = 'series'
+
+
+class MultiPumpSelector:
+    """Searches N-pump arrangements with one batched evaluation"""
+
+    def __init__(self, brain):
+        """
+        Initialize with reference to main Brain.
+
+        Args:
+            brain: Parent PumpBrain instance
+        """
+        self.brain = brain
+        self.parallel_counts = config.get('multi_pump', 'parallel_pump_counts')
+        self.series_counts = config.get('multi_pump', 'series_pump_counts')
+        self.pump_penalty = config.get('multi_pump', 'additional_pump_score_penalty')
+        self.default_standby = config.get('multi_pump', 'default_standby_pumps')
+        self.flow_min_range = config.get('multi_pump', 'flow_prefiltering_minimum_range')
+        self.flow_max_range = config.get('multi_pump', 'flow_prefiltering_maximum_range')
+        self.fallback_when_no_single_pump = config.get('multi_pump', 'fallback_when_no_single_pump')
+        self.default_max_results = config.get('selection_core', 'default_maximum_results_to_return')
+
+    def build_arrangements(self, flow: float, head: float,
+                           arrangements: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Scale the system duty point to a per-pump duty for each arrangement.
+
+        Parallel pumps share the flow at the system head; series pumps
+        share the head at the system flow.
+
+        Args:
+            flow: System flow in m³/hr
+            head: System head in meters
+            arrangements: Subset of 'single', 'parallel', 'series' (default all)
+
+        Returns:
+            List of arrangement dictionaries with per-pump duty
+        """
+        arrangements = arrangements or [ARRANGEMENT_SINGLE, ARRANGEMENT_PARALLEL, ARRANGEMENT_SERIES]
+        result = []
+        if ARRANGEMENT_SINGLE in arrangements:
+            result.append({'arrangement': ARRANGEMENT_SINGLE, 'pumps_operating': 1,
+                           'per_pump_flow_m3hr': flow, 'per_pump_head_m': head})
+        if ARRANGEMENT_PARALLEL in arrangements:
+            for count in self.parallel_counts:
+                result.append({'arrangement': ARRANGEMENT_PARALLEL, 'pumps_operating': count,
+                               'per_pump_flow_m3hr': flow / count, 'per_pump_head_m': head})
+        if ARRANGEMENT_SERIES in arrangements:
+            for count in self.series_counts:
+                result.append({'arrangement': ARRANGEMENT_SERIES, 'pumps_operating': count,
+                               'per_pump_flow_m3hr': flow, 'per_pump_head_m': head / count})
+        return result
+
+    @staticmethod
+    def describe(arrangement: Dict[str, Any], standby: int) -> str:
+        """Human-readable arrangement label, e.g. '2 × parallel + 1 standby'."""
+        count = arrangement['pumps_operating']
+        label = 'Single pump' if count == 1 else f"{count} × {arrangement['arrangement']}"
+        if standby:
+            label += f" + {standby} standby"
+        return label
+
+    def _get_candidates(self, arrangements: List[Dict[str, Any]],
+                        constraints: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Pre-filter catalog on BEP flow across all per-pump duties and on pump type."""
+        flows = [a['per_pump_flow_m3hr'] for a in arrangements]
+        min_bep_flow = min(flows) * self.flow_min_range
+        max_bep_flow = max(flows) * self.flow_max_range
+        type_constraint = (constraints.get('pump_type') or 'GENERAL').upper()
+
+        candidates = []
+        for pump in self.brain.repository.get_pump_models():
+            bep_flow = pump.get('specifications', {}).get('bep_flow_m3hr') or 0
+            if not (bep_flow > 0 and min_bep_flow <= bep_flow <= max_bep_flow):
+                continue
+            if type_constraint != 'GENERAL' and (pump.get('pump_type') or '').upper() != type_constraint:
+                continue
+            candidates.append(pump)
+        return candidates
+
+    def _combined_curve(self, batch: Dict[str, Any], pump_index: int, point_index: int,
+                        arrangement: Dict[str, Any]) -> List[Dict[str, float]]:
+        """
+        Combined H-Q curve of the arrangement at the operating trim or speed.
+
+        Args:
+            batch: Result of BatchEvaluator.evaluate
+            pump_index: Row index
+            point_index: Arrangement column
+            arrangement: Arrangement dictionary
+
+        Returns:
+            List of {'flow_m3hr', 'head_m'} points
+        """
+        row = batch['rows'][pump_index]
+        cell = (pump_index, point_index)
+        if batch['is_vfd'][cell]:
+            speed = float(batch['speed_ratio'][cell])
+            flow_scale, head_scale = speed, speed ** 2
+        else:
+            ratio = float(batch['trim_percent'][cell]) / 100.0
+            flow_scale, head_scale = ratio ** row['flow_exp'], ratio ** row['head_exp']
+
+        flows = row['flows'] * flow_scale
+        heads = row['heads'] * head_scale
+        count = arrangement['pumps_operating']
+        if arrangement['arrangement'] == ARRANGEMENT_PARALLEL:
+            flows = flows * count
+        elif arrangement['arrangement'] == ARRANGEMENT_SERIES:
+            heads = heads * count
+        return [{'flow_m3hr': float(q), 'head_m': float(h)} for q, h in zip(flows, heads)]
+
+    def find_best_configurations(self, flow: float, head: float,
+                                 constraints: Optional[Dict[str, Any]] = None,
+                                 include_exclusions: bool = False) -> Dict[str, Any]:
+        """
+        Rank single, parallel and series arrangements of catalog pumps.
+
+        Every per-pump duty is evaluated for every candidate in a single
+        batched pass; each pump keeps its best-scoring arrangement. Scores
+        use the standard evaluator rules less a penalty per extra pump.
+
+        Args:
+            flow: System flow in m³/hr
+            head: System head in meters
+            constraints: Optional constraints (pump_type, max_results,
+                arrangements, standby_pumps)
+            include_exclusions: If True, return exclusion details
+
+        Returns:
+            Dictionary with 'ranked_pumps' (system-level evaluations carrying a
+            'configuration' block) and 'exclusion_details'
+        """
+        constraints = constraints or {}
+        standby = int(constraints.get('standby_pumps', self.default_standby))
+        arrangements = self.build_arrangements(flow, head, constraints.get('arrangements'))
+
+        candidates = self._get_candidates(arrangements, constraints)
+        batch = self.brain.batch_evaluator.evaluate(
+            candidates,
+            [a['per_pump_flow_m3hr'] for a in arrangements],
+            [a['per_pump_head_m'] for a in arrangements]
+        )
+        rows = batch['rows']
+        logger.info(f"[MULTI PUMP] {len(arrangements)} arrangements x {len(rows)} pumps evaluated in one batch")
+
+        if not rows:
+            return {'ranked_pumps': [], 'exclusion_details': None}
+
+        pump_counts = np.array([a['pumps_operating'] for a in arrangements], dtype=float)
+        scores = batch['total_score'] - (pump_counts - 1)[np.newaxis, :] * self.pump_penalty
+
+        # Best arrangement per pump; fewer pumps win ties
+        best = np.lexsort((np.broadcast_to(pump_counts, scores.shape), -scores), axis=1)[:, 0]
+        best_scores = scores[np.arange(len(rows)), best]
+        feasible = np.isfinite(best_scores)
+        order = np.argsort(-np.where(feasible, best_scores, -np.inf), kind='stable')
+
+        max_results = constraints.get('max_results', self.default_max_results)
+        ranked_pumps = []
+        excluded_pumps = []
+
+        for i in order:
+            if not feasible[i]:
+                if include_exclusions:
+                    excluded_pumps.append({
+                        'pump_code': rows[i]['pump_code'],
+                        'exclusion_reasons': ['No feasible single, parallel or series arrangement'],
+                        'score_components': {}
+                    })
+                continue
+            if len(ranked_pumps) >= max_results:
+                continue
+
+            j = int(best[i])
+            arrangement = arrangements[j]
+            count = arrangement['pumps_operating']
+            evaluation = self.brain.batch_evaluator.to_evaluation(batch, i, j)
+            per_pump = {
+                'flow_m3hr': arrangement['per_pump_flow_m3hr'],
+                'head_m': evaluation['head_m'],
+                'power_kw': evaluation['power_kw'],
+                'head_margin_m': evaluation['head_margin_m']
+            }
+
+            # System-level figures for the arrangement
+            if arrangement['arrangement'] == ARRANGEMENT_PARALLEL:
+                evaluation['flow_m3hr'] = flow
+            elif arrangement['arrangement'] == ARRANGEMENT_SERIES:
+                evaluation['head_m'] = evaluation['head_m'] * count
+                evaluation['head_margin_m'] = evaluation['head_margin_m'] * count
+            evaluation['power_kw'] = evaluation['power_kw'] * count
+            evaluation['total_score'] = float(best_scores[i])
+            evaluation['configuration'] = {
+                'arrangement': arrangement['arrangement'],
+                'pumps_operating': count,
+                'standby_pumps': standby,
+                'pumps_installed': count + standby,
+                'label': self.describe(arrangement, standby),
+                'per_pump': per_pump,
+                'combined_curve': self._combined_curve(batch, i, j, arrangement)
+            }
+            ranked_pumps.append(evaluation)
+
+        result = {'ranked_pumps': ranked_pumps}
+        if include_exclusions:
+            result['exclusion_details'] = {
+                'excluded_pumps': excluded_pumps,
+                'exclusion_summary': {'No feasible arrangement': len(excluded_pumps)} if excluded_pumps else {},
+                'total_evaluated': len(rows),
+                'feasible_count': int(feasible.sum()),
+                'excluded_count': len(excluded_pumps)
+            }
+        else:
+            result['exclusion_details'] = None
+        return result
@@ -0,0 +1,194 @@
+"""
+Operating Envelope Module
+=========================
+Precomputed Q-H envelope polygons for fast physical feasibility checks
+"""
+
+import logging
+from typing import Dict, List, Any, Optional, Tuple
+import numpy as np
+from .config_manager import config
+
+logger = logging.getLogger(__name__)
+
+ENVELOPE_INSIDE = 'inside'
+ENVELOPE_OUTSIDE = 'outside'
+ENVELOPE_BORDERLINE = 'borderline'
+
+
+def point_in_polygon(polygon: List[List[float]], x: float, y: float) -> bool:
+    """
+    Ray-casting point-in-polygon test.
+
+    Args:
+        polygon: Closed ring of [x, y] vertices (last edge implied)
+        x: Point x
+        y: Point y
+
+    Returns:
+        True if the point is inside the polygon
+    """
+    inside = False
+    n = len(polygon)
+    j = n - 1
+    for i in range(n):
+        xi, yi = polygon[i]
+        xj, yj = polygon[j]
+        if (yi > y) != (yj > y) and x < (xj - xi) * (y - yi) / (yj - yi) + xi:
+            inside = not inside
+        j = i
+    return inside
+
+
+class OperatingEnvelope:
+    """Builds per-pump envelope polygons and classifies duty points against them"""
+
+    @staticmethod
+    def _valid_curves(pump: Dict[str, Any]) -> List[Tuple[float, List[Tuple[float, float]]]]:
+        """Curves the PhysicalValidator would use, as (diameter, sorted (Q, H) points)."""
+        min_points = config.get('physical_validator', 'minimum_curve_points_required_for_validation')
+        curves = []
+        for curve in pump.get('curves', []):
+            points = curve.get('performance_points', [])
+            if not points or len(points) < min_points:
+                continue
+            curves.append((curve.get('impeller_diameter_mm', 0),
+                           sorted((p['flow_m3hr'], p['head_m']) for p in points)))
+        return curves
+
+    @staticmethod
+    def build(pump: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Build the Q-H envelope of one pump.
+
+        The polygon runs along the maximum-diameter curve, down the
+        maximum-flow line, back along the minimum-diameter curve and up the
+        minimum-flow line. Bounds cover every usable curve.
+
+        Args:
+            pump: Pump model
+
+        Returns:
+            JSON-safe envelope dictionary, or None if the pump has no usable curve
+        """
+        curves = OperatingEnvelope._valid_curves(pump)
+        if not curves:
+            return None
+
+        curves.sort(key=lambda c: c[0])
+        smallest = curves[0][1]
+        largest = curves[-1][1]
+
+        if len(curves) > 1:
+            polygon = [[q, h] for q, h in largest] + [[q, h] for q, h in reversed(smallest)]
+        else:
+            # Single curve: close down to zero head
+            polygon = [[q, h] for q, h in largest] + [[largest[-1][0], 0.0], [largest[0][0], 0.0]]
+
+        # The polygon is only trusted for fast acceptance when the smallest
+        # curve stays below the largest one (a simple, non-crossing ring)
+        small_q = np.array([q for q, _ in smallest])
+        small_h = np.array([h for _, h in smallest])
+        overlap = (small_q >= largest[0][0]) & (small_q <= largest[-1][0])
+        large_h = np.interp(small_q[overlap], [q for q, _ in largest], [h for _, h in largest])
+        simple = bool(np.all(small_h[overlap] <= large_h))
+
+        all_points = [p for _, points in curves for p in points]
+
+        # Tested efficiency samples for region statistics
+        efficiency_points = [
+            [p['flow_m3hr'], p['head_m'], p['efficiency_pct']]
+            for curve in pump.get('curves', [])
+            for p in curve.get('performance_points', [])
+            if p.get('flow_m3hr') and p.get('head_m') and p.get('efficiency_pct')
+        ]
+        return {
+            'polygon': polygon,
+            'flow_min_m3hr': min(q for q, _ in all_points),
+            'flow_max_m3hr': max(q for q, _ in all_points),
+            'head_max_m': max(h for _, h in all_points),
+            'max_curve_flow_min_m3hr': largest[0][0],
+            'max_curve_flow_max_m3hr': largest[-1][0],
+            'max_curve_head_min_m': min(h for _, h in largest),
+            'max_diameter_mm': curves[-1][0],
+            'min_diameter_mm': curves[0][0],
+            'simple_polygon': simple,
+            'efficiency_points': efficiency_points
+        }
+
+    @staticmethod
+    def precompute_catalog(pump_models: List[Dict[str, Any]], catalog_version: str) -> Dict[str, Any]:
+        """
+        Attach an 'operating_envelope' to every pump of the catalog.
+
+        Args:
+            pump_models: Loaded pump models
+            catalog_version: Catalog build stamp
+
+        Returns:
+            Summary statistics for catalog metadata
+        """
+        built = 0
+        for pump in pump_models:
+            envelope = OperatingEnvelope.build(pump)
+            pump['operating_envelope'] = envelope
+            if envelope:
+                built += 1
+        logger.info(f"[ENVELOPE] {built} of {len(pump_models)} pumps have envelope polygons")
+        return {'pumps_with_envelopes': built, 'catalog_version': catalog_version}
+
+    @staticmethod
+    def get_envelope(pump: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Get the stored envelope of a pump, building it once if missing.
+
+        Args:
+            pump: Pump data
+
+        Returns:
+            Envelope dictionary or None
+        """
+        if 'operating_envelope' not in pump:
+            pump['operating_envelope'] = OperatingEnvelope.build(pump)
+        return pump['operating_envelope']
+
+    @staticmethod
+    def classify(envelope: Dict[str, Any], flow: float, head: float,
+                 head_tolerance: float) -> Tuple[str, str]:
+        """
+        Classify a duty point against an envelope.
+
+        'outside' and 'inside' agree with the curve-by-curve validator by
+        construction; anything within the boundary band, or below the
+        minimum-diameter curve, is 'borderline' and left to the validator.
+
+        Args:
+            envelope: Envelope from build()
+            flow: Required flow in m³/hr
+            head: Required head in meters
+            head_tolerance: PhysicalValidator head tolerance (fraction)
+
+        Returns:
+            (classification, reason)
+        """
+        band = config.get('operating_envelope', 'boundary_band_fraction')
+        needed = head * (1 - head_tolerance)
+
+        # Outside every curve's flow range or above every curve's head
+        if flow < envelope['flow_min_m3hr'] * (1 - band) or flow > envelope['flow_max_m3hr'] * (1 + band):
+            return ENVELOPE_OUTSIDE, (f"Flow {flow:.1f} m³/hr outside operating envelope "
+                                      f"{envelope['flow_min_m3hr']:.1f}-{envelope['flow_max_m3hr']:.1f} m³/hr")
+        if needed > envelope['head_max_m'] * (1 + band):
+            return ENVELOPE_OUTSIDE, (f"Cannot deliver {head:.1f}m at {flow:.1f} m³/hr "
+                                      f"(envelope maximum {envelope['head_max_m']:.1f}m)")
+
+        # On the maximum-diameter curve's flow range and at or below it
+        on_max_curve = envelope['max_curve_flow_min_m3hr'] * (1 + band) <= flow <= \
+            envelope['max_curve_flow_max_m3hr'] * (1 - band)
+        if on_max_curve:
+            if needed <= envelope['max_curve_head_min_m'] * (1 - band):
+                return ENVELOPE_INSIDE, "Physically capable"
+            if envelope['simple_polygon'] and point_in_polygon(envelope['polygon'], flow, needed * (1 + band)):
+                return ENVELOPE_INSIDE, "Physically capable"
+
+        return ENVELOPE_BORDERLINE, ""
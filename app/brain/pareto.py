@@ -0,0 +1,197 @@
+"""
+Pareto Module
+=============
+Multi-objective pump selection by vectorized non-dominated sorting
+"""
+
+import logging
+from typing import Dict, List, Any, Optional
+import numpy as np
+from .batch_evaluator import CAUSE_LABELS
+from .config_manager import config
+
+logger = logging.getLogger(__name__)
+
+# Objective name -> (batch field, sense); every objective is minimized internally
+OBJECTIVES = {
+    'efficiency': ('efficiency_pct', 'max'),
+    'power': ('power_kw', 'min'),
+    'npsh_margin': ('npshr_m', 'min'),          # max NPSHa - NPSHr == min NPSHr
+    'qbp_distance': ('qbp_percent', 'distance'),
+    'impeller_size': ('impeller_diameter_mm', 'min')
+}
+
+
+def dominance_matrix(objectives: np.ndarray, chunk_rows: int) -> np.ndarray:
+    """
+    Boolean matrix D with D[i, j] True when candidate i dominates j.
+
+    Args:
+        objectives: (N, K) array, all objectives minimized
+        chunk_rows: Rows per block (memory is chunk_rows × N × K)
+
+    Returns:
+        (N, N) boolean array
+    """
+    n = objectives.shape[0]
+    dominates = np.zeros((n, n), dtype=bool)
+    for start in range(0, n, chunk_rows):
+        block = objectives[start:start + chunk_rows, np.newaxis, :]
+        no_worse = (block <= objectives[np.newaxis, :, :]).all(axis=2)
+        better = (block < objectives[np.newaxis, :, :]).any(axis=2)
+        dominates[start:start + chunk_rows] = no_worse & better
+    return dominates
+
+
+def non_dominated_ranks(objectives: np.ndarray, chunk_rows: int) -> np.ndarray:
+    """
+    Pareto rank of every candidate (0 = non-dominated front).
+
+    Fronts are peeled by decrementing domination counts, so the whole sort
+    is O(N²·K) after the dominance matrix.
+
+    Args:
+        objectives: (N, K) array, all objectives minimized
+        chunk_rows: Rows per dominance block
+
+    Returns:
+        (N,) integer ranks
+    """
+    dominates = dominance_matrix(objectives, chunk_rows)
+    dominated_count = dominates.sum(axis=0)
+    ranks = np.full(objectives.shape[0], -1, dtype=int)
+    front = np.flatnonzero(dominated_count == 0)
+    rank = 0
+    while front.size:
+        ranks[front] = rank
+        dominated_count = dominated_count - dominates[front].sum(axis=0)
+        dominated_count[ranks >= 0] = -1
+        front = np.flatnonzero(dominated_count == 0)
+        rank += 1
+    return ranks
+
+
+class ParetoSelector:
+    """Returns Pareto fronts over selectable objectives for one duty point"""
+
+    def __init__(self, brain):
+        """
+        Initialize with reference to main Brain.
+
+        Args:
+            brain: Parent PumpBrain instance
+        """
+        self.brain = brain
+        self.default_objectives = config.get('pareto_selection', 'default_objectives')
+        self.chunk_rows = config.get('pareto_selection', 'dominance_chunk_rows')
+        self.default_max_results = config.get('pareto_selection', 'default_maximum_results')
+
+    def _objective_matrix(self, batch: Dict[str, Any], names: List[str]) -> np.ndarray:
+        """
+        Build the (N, K) minimization matrix for the feasible column.
+
+        Missing values (e.g. no NPSHr data) count as worst.
+        """
+        columns = []
+        for name in names:
+            field, sense = OBJECTIVES[name]
+            values = batch[field][:, 0].astype(float)
+            if sense == 'max':
+                values = -values
+            elif sense == 'distance':
+                values = np.abs(values - 100.0)
+            columns.append(np.where(np.isfinite(values), values, np.inf))
+        return np.column_stack(columns)
+
+    def find_pareto_pumps(self, flow: float, head: float,
+                          constraints: Optional[Dict[str, Any]] = None,
+                          include_exclusions: bool = False) -> Dict[str, Any]:
+        """
+        Rank feasible pumps by Pareto dominance.
+
+        Every catalog pump is batch-evaluated at the duty point and all
+        feasible candidates take part in the sort; there is no top-k pruning.
+
+        Args:
+            flow: Required flow in m³/hr
+            head: Required head in meters
+            constraints: Optional constraints (pump_type, max_results,
+                objectives, npsh_available_m)
+            include_exclusions: If True, return exclusion details
+
+        Returns:
+            Dictionary with 'ranked_pumps' (PumpEvaluator-shaped, each with a
+            'pareto' block), 'pareto_front_size', 'objectives' and
+            'exclusion_details'
+        """
+        constraints = constraints or {}
+        names = constraints.get('objectives') or self.default_objectives
+        unknown = [n for n in names if n not in OBJECTIVES]
+        if unknown:
+            raise ValueError(f"Unknown Pareto objectives: {unknown} (choose from {sorted(OBJECTIVES)})")
+
+        type_constraint = (constraints.get('pump_type') or 'GENERAL').upper()
+        pumps = [p for p in self.brain.repository.get_pump_models()
+                 if type_constraint == 'GENERAL' or (p.get('pump_type') or '').upper() == type_constraint]
+
+        batch = self.brain.batch_evaluator.evaluate(pumps, [flow], [head])
+        rows = batch['rows']
+        if not rows:
+            return {'ranked_pumps': [], 'pareto_front_size': 0, 'objectives': names, 'exclusion_details': None}
+
+        feasible = np.flatnonzero(batch['feasible'][:, 0])
+        objectives = self._objective_matrix(batch, names)[feasible]
+        ranks = non_dominated_ranks(objectives, self.chunk_rows) if feasible.size else np.array([], dtype=int)
+        logger.info(f"[PARETO] {feasible.size} feasible of {len(rows)} pumps, "
+                    f"{int((ranks == 0).sum())} on the front over {names}")
+
+        scores = batch['total_score'][feasible, 0]
+        order = np.lexsort((-scores, ranks))
+        max_results = constraints.get('max_results', self.default_max_results)
+        npsh_available = constraints.get('npsh_available_m')
+
+        ranked_pumps = []
+        for k in order[:max_results]:
+            i = int(feasible[k])
+            evaluation = self.brain.batch_evaluator.to_evaluation(batch, i, 0)
+            values = {}
+            for name in names:
+                field, _ = OBJECTIVES[name]
+                value = evaluation.get(field)
+                if name == 'qbp_distance' and value is not None:
+                    value = abs(value - 100.0)
+                elif name == 'npsh_margin':
+                    value = npsh_available - value if (npsh_available is not None and value is not None) else None
+                values[name] = value
+            evaluation['pareto'] = {
+                'rank': int(ranks[k]),
+                'on_front': bool(ranks[k] == 0),
+                'objectives': values
+            }
+            ranked_pumps.append(evaluation)
+
+        result = {
+            'ranked_pumps': ranked_pumps,
+            'pareto_front_size': int((ranks == 0).sum()),
+            'objectives': names
+        }
+        if include_exclusions:
+            infeasible = np.flatnonzero(~batch['feasible'][:, 0])
+            exclusion_summary = {}
+            for i in infeasible:
+                label = CAUSE_LABELS.get(int(batch['cause'][i, 0]), 'Outside capability')
+                exclusion_summary[label] = exclusion_summary.get(label, 0) + 1
+            result['exclusion_details'] = {
+                'excluded_pumps': [{
+                    'pump_code': rows[i]['pump_code'],
+                    'exclusion_reasons': [self.brain.batch_evaluator.exclusion_reason(batch, int(i), 0)],
+                    'score_components': {}
+                } for i in infeasible],
+                'exclusion_summary': exclusion_summary,
+                'total_evaluated': len(rows),
+                'feasible_count': int(feasible.size),
+                'excluded_count': int(infeasible.size)
+            }
+        else:
+            result['exclusion_details'] = None
+        return result
@@ -8,10 +8,11 @@ import logging
 import numpy as np
 from typing import Dict, List, Any, Optional, Tuple
 from scipy import interpolate
-from .physics_models import get_exponents_for_pump_type
+from .hydraulic_profile import HydraulicProfiler
 from ..process_logger import process_logger
 from .performance_curves import CurveAnalyzer
 from .performance_affinity import AffinityCalculator
+from .stocked_diameters import StockedDiameterSelector, DIAMETER_MODE_STOCKED
 from .config_manager import config
 
 logger = logging.getLogger(__name__)
@@ -139,7 +140,7 @@ class PerformanceCoreCalculator:
         
         # Get pump type and physics model for detailed logging
         pump_type = pump_data.get('pump_type', 'Unknown')
-        physics_exponents = get_exponents_for_pump_type(pump_type)
+        physics_exponents = HydraulicProfiler.get_exponents(pump_data)
         
         # Log performance calculation entry with detailed formulas
         process_logger.log(f"PERFORMANCE CALCULATION: {pump_code}")
@@ -179,6 +180,11 @@ class PerformanceCoreCalculator:
         # Use industry-standard method from advanced module
         result = advanced_calc.calculate_at_point_industry_standard(pump_data, flow, head, impeller_trim)
         
+        # Stocked mode: snap the continuous trim to the next stocked diameter up
+        if result and impeller_trim is None and \
+                config.get('stocked_diameters', 'diameter_selection_mode') == DIAMETER_MODE_STOCKED:
+            result = self._snap_to_stocked_diameter(pump_data, flow, head, result)
+        
         # Log results
         if result:
             process_logger.log(f"  Results:")
@@ -192,6 +198,38 @@ class PerformanceCoreCalculator:
         
         return result
 
+    def _snap_to_stocked_diameter(self, pump_data: Dict[str, Any], flow: float, head: float,
+                                  result: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Replace the continuous affinity-law diameter with the smallest stocked
+        diameter meeting the duty. The pump is throttled back to the duty, so
+        head, power and efficiency are taken at the stocked diameter.
+        
+        Args:
+            pump_data: Pump data with curves
+            flow: Operating flow rate (m³/hr)
+            head: Operating head (m)
+            result: Continuous industry-standard result
+        
+        Returns:
+            Result at the stocked diameter, or None if no stocked diameter meets the duty
+        """
+        stocked = StockedDiameterSelector.snap(pump_data, flow, head, self.brain.get_catalog_version())
+        if stocked is None:
+            process_logger.log(f"  Stocked Diameters: no stocked diameter meets {head:.2f} m", "WARNING")
+            return None
+        
+        continuous_diameter = result.get('impeller_diameter_mm')
+        result.update(stocked)
+        result['continuous_diameter_mm'] = continuous_diameter
+        result['trim_percent'] = stocked['impeller_diameter_mm'] / stocked['base_diameter_mm'] * 100.0
+        result['diameter_selection'] = DIAMETER_MODE_STOCKED
+        result['meets_requirements'] = True
+        process_logger.log(f"  Stocked Diameter: {stocked['impeller_diameter_mm']:.1f} mm "
+                           f"({stocked['diameter_source']}), continuous {continuous_diameter or 0:.1f} mm, "
+                           f"over-delivery {stocked['over_delivery_m']:.2f} m")
+        return result
+
     def _calculate_required_diameter_direct(self, flows_sorted, heads_sorted, 
                                           largest_diameter, target_flow, target_head, pump_code, physics_exponents=None, pump_data=None):
         """
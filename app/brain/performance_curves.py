@@ -8,7 +8,7 @@ import logging
 import numpy as np
 from typing import Dict, List, Any, Optional, Tuple
 from scipy import interpolate
-from .physics_models import get_exponents_for_pump_type
+from .hydraulic_profile import HydraulicProfiler
 from .config_manager import config
 
 logger = logging.getLogger(__name__)
@@ -77,8 +77,7 @@ class CurveAnalyzer:
             logger.warning(f"[PHYSICS] {pump_code}: Dynamic physics calculation failed: {e}")
         
         # Fallback to static pump type classification
-        pump_type = pump_data.get('pump_type', '')
-        exponents = get_exponents_for_pump_type(pump_type)
+        exponents = HydraulicProfiler.get_exponents(pump_data)
         
         logger.debug(f"[PHYSICS] {pump_code}: Using static pump type exponents")
         return exponents
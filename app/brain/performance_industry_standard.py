@@ -9,6 +9,7 @@ import numpy as np
 from typing import Dict, Any, Optional
 from scipy import interpolate
 from .physics_models import get_exponents_for_pump_type
+from .curve_fits import CurveFitter
 from .config_manager import config
 
 logger = logging.getLogger(__name__)
@@ -214,8 +215,15 @@ class IndustryStandardCalculator:
                 
                 logger.debug(f"[INDUSTRY] {pump_code}: Executing interpolation at flow {flow}...")
                 
+                # Optional analytic mode: evaluate the load-time curve fit instead
+                # of raw-point interpolation (reference mode)
+                curve_model = CurveFitter.get_model(largest_curve) if CurveFitter.is_analytic_mode() else None
+                
                 # STEP 1: Get performance at target flow on largest curve
-                delivered_head = float(head_interp(flow))
+                if curve_model is not None:
+                    delivered_head = curve_model.evaluate('head', flow)
+                else:
+                    delivered_head = float(head_interp(flow))
                 
                 # CRITICAL FIX: Always use authentic BEP efficiency as baseline when available
                 specs = pump_data.get('specifications', {})
@@ -229,7 +237,10 @@ class IndustryStandardCalculator:
                     logger.info(f"[REFINED EFFICIENCY] {pump_code}: Using original BEP efficiency {base_efficiency:.1f}% as baseline")
                 else:
                     # Only fallback to interpolation when no authentic BEP data exists
-                    base_efficiency = float(eff_interp(flow))
+                    if curve_model is not None and curve_model.has('efficiency'):
+                        base_efficiency = curve_model.evaluate('efficiency', flow)
+                    else:
+                        base_efficiency = float(eff_interp(flow))
                     logger.debug(f"[INDUSTRY] {pump_code}: Using interpolated efficiency {base_efficiency:.1f}% (no authentic BEP data)")
                 
                 logger.debug(f"[INDUSTRY] {pump_code}: Base curve performance - head: {delivered_head:.2f}m, eff: {base_efficiency:.1f}%")
@@ -293,7 +304,8 @@ class IndustryStandardCalculator:
                 
                 optimal_trim_result = self.optimizer.calculate_efficiency_optimized_trim(
                     flows_sorted, heads_sorted, largest_diameter, flow, head, 
-                    original_bep_flow, original_bep_head, pump_code or "Unknown", physics_exponents
+                    original_bep_flow, original_bep_head, pump_code or "Unknown", physics_exponents,
+                    curve_model=curve_model
                 )
                 
                 # Extract diameter and trim for compatibility with existing code
@@ -399,9 +411,12 @@ class IndustryStandardCalculator:
                 try:
                     npsh_values = [p.get('npshr_m') for p in curve_points if p.get('npshr_m') is not None]
                     if npsh_values and len(npsh_values) == len(flows_sorted):
-                        npsh_interp = interpolate.interp1d(flows_sorted, npsh_values, 
-                                                         kind='linear', bounds_error=False)
-                        base_npshr = float(npsh_interp(flow))
+                        if curve_model is not None and curve_model.has('npshr'):
+                            base_npshr = curve_model.evaluate('npshr', flow)
+                        else:
+                            npsh_interp = interpolate.interp1d(flows_sorted, npsh_values, 
+                                                             kind='linear', bounds_error=False)
+                            base_npshr = float(npsh_interp(flow))
                         if not np.isnan(base_npshr):
                             # NPSH scales with pump-type-specific exponent from physics model
                             interpolated_npshr = base_npshr * (diameter_ratio ** physics_exponents['npshr_exponent_alpha'])
@@ -0,0 +1,280 @@
+"""
+Performance Map Module
+======================
+Vectorized trimmed-impeller performance maps with iso-efficiency contours
+"""
+
+import logging
+from typing import Dict, List, Any, Optional
+import numpy as np
+from .hydraulic_profile import HydraulicProfiler
+from .config_manager import config
+
+logger = logging.getLogger(__name__)
+
+
+class PerformanceMapGenerator:
+    """Builds and caches full H-Q / efficiency maps across the allowed trim range"""
+
+    def __init__(self, brain):
+        """
+        Initialize with reference to main Brain.
+
+        Args:
+            brain: Parent PumpBrain instance
+        """
+        self.brain = brain
+
+        self.min_trim_percent = config.get('performance_map', 'minimum_trim_percentage_for_map')
+        self.max_trim_percent = config.get('performance_map', 'maximum_trim_percentage_for_map')
+        self.trim_steps = config.get('performance_map', 'trim_grid_steps')
+        self.flow_points = config.get('performance_map', 'flow_grid_points')
+        self.contour_step = config.get('performance_map', 'iso_efficiency_contour_step_pct')
+        self.cache_ttl = config.get('performance_map', 'performance_map_cache_ttl_seconds')
+        self.water_density = config.get('performance_map', 'water_density_kg_m3')
+        self.gravity = config.get('performance_map', 'gravitational_acceleration_m_s2')
+        self.seconds_per_hour = config.get('performance_map', 'seconds_per_hour')
+        self.penalty_volute = config.get('performance_map', 'trim_efficiency_penalty_volute')
+        self.penalty_diffuser = config.get('performance_map', 'trim_efficiency_penalty_diffuser')
+
+    def get_map(self, pump_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Get the performance map for a pump, cached per pump and catalog version.
+
+        Args:
+            pump_data: Pump data from repository
+
+        Returns:
+            Map dictionary with numpy surfaces, or None if the pump has no usable curve
+        """
+        pump_code = pump_data.get('pump_code', '')
+        cache_key = self.brain._cache.make_key(
+            'performance_map', pump_code, self.brain.get_catalog_version()
+        )
+        # Pumps without a usable curve are negatively cached
+        return self.brain._cache.get_or_compute(cache_key, lambda: self.generate_map(pump_data),
+                                                ttl=self.cache_ttl, negative=lambda result: not result)
+
+    def _get_reference_curve(self, pump_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Largest impeller curve - the trim reference used across the Brain."""
+        curves = [c for c in pump_data.get('curves', [])
+                  if c.get('impeller_diameter_mm', 0) > 0 and len(c.get('performance_points', [])) >= 2]
+        if not curves:
+            return None
+        return max(curves, key=lambda c: c.get('impeller_diameter_mm', 0))
+
+    def _get_efficiency_penalty_factor(self, pump_data: Dict[str, Any]) -> float:
+        """Trim efficiency penalty factor by hydraulic design (Δη = ε(1 - D'/D))."""
+        pump_type = (pump_data.get('pump_type') or '').lower()
+        if 'diffuser' in pump_type or 'turbine' in pump_type:
+            return self.penalty_diffuser
+        return self.penalty_volute
+
+    def generate_map(self, pump_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Compute H-Q, efficiency and power surfaces over trim × flow in one pass.
+
+        Each trimmed curve is the reference curve scaled with the pump-type
+        affinity exponents: Q' = Q·d^x, H' = H·d^y, η' = η - ε(1 - d)·100.
+
+        Args:
+            pump_data: Pump data from repository
+
+        Returns:
+            Map dictionary or None if no reference curve is available
+        """
+        pump_code = pump_data.get('pump_code', '')
+        reference_curve = self._get_reference_curve(pump_data)
+        if not reference_curve:
+            logger.warning(f"[PERFORMANCE MAP] {pump_code}: No usable reference curve")
+            return None
+
+        try:
+            points = sorted(
+                (p for p in reference_curve['performance_points'] if p.get('flow_m3hr') is not None),
+                key=lambda p: p['flow_m3hr']
+            )
+            ref_flows = np.array([p['flow_m3hr'] for p in points], dtype=float)
+            ref_heads = np.array([p.get('head_m') or 0.0 for p in points], dtype=float)
+            ref_effs = np.array([p.get('efficiency_pct') or 0.0 for p in points], dtype=float)
+
+            exponents = HydraulicProfiler.get_profile(pump_data)['physics_exponents']
+            flow_exp = exponents['flow_exponent_x']
+            head_exp = exponents['head_exponent_y']
+
+            trims = np.linspace(self.min_trim_percent, self.max_trim_percent, self.trim_steps)
+            ratios = trims / 100.0
+            flow_scale = ratios ** flow_exp
+
+            flow_grid = np.linspace(ref_flows[0] * flow_scale.min(), ref_flows[-1], self.flow_points)
+
+            # Map every (trim, flow) cell back onto the reference curve
+            equivalent_flows = flow_grid[np.newaxis, :] / flow_scale[:, np.newaxis]
+            inside = (equivalent_flows >= ref_flows[0]) & (equivalent_flows <= ref_flows[-1])
+
+            heads = np.interp(equivalent_flows.ravel(), ref_flows, ref_heads).reshape(equivalent_flows.shape)
+            heads *= (ratios ** head_exp)[:, np.newaxis]
+
+            penalty = self._get_efficiency_penalty_factor(pump_data) * (1.0 - ratios) * 100.0
+            effs = np.interp(equivalent_flows.ravel(), ref_flows, ref_effs).reshape(equivalent_flows.shape)
+            effs -= penalty[:, np.newaxis]
+
+            heads[~inside] = np.nan
+            effs[~inside | (effs <= 0)] = np.nan
+
+            with np.errstate(divide='ignore', invalid='ignore'):
+                powers = (self.water_density * self.gravity * flow_grid[np.newaxis, :] * heads) / \
+                         (self.seconds_per_hour * effs / 100.0 * 1000.0)
+
+            performance_map = {
+                'pump_code': pump_code,
+                'catalog_version': self.brain.get_catalog_version(),
+                'reference_diameter_mm': float(reference_curve['impeller_diameter_mm']),
+                'trim_percent': trims,
+                'diameter_mm': ratios * float(reference_curve['impeller_diameter_mm']),
+                'flow_grid_m3hr': flow_grid,
+                'head_surface_m': heads,
+                'efficiency_surface_pct': effs,
+                'power_surface_kw': powers,
+                'exponents': {'flow_exponent_x': flow_exp, 'head_exponent_y': head_exp}
+            }
+            performance_map['iso_efficiency_contours'] = self.extract_iso_efficiency_contours(performance_map)
+
+            logger.debug(f"[PERFORMANCE MAP] {pump_code}: {len(trims)}x{len(flow_grid)} map, "
+                         f"{len(performance_map['iso_efficiency_contours'])} contours")
+            return performance_map
+
+        except Exception as e:
+            logger.error(f"[PERFORMANCE MAP] {pump_code}: Map generation failed - {e}")
+            return None
+
+    def extract_iso_efficiency_contours(self, performance_map: Dict[str, Any],
+                                        levels: Optional[List[float]] = None) -> List[Dict[str, Any]]:
+        """
+        Extract iso-efficiency lines from the efficiency surface.
+
+        For each trim row the rising (left) and falling (right) crossings of
+        each level are located by linear interpolation between grid columns;
+        joining left crossings upwards and right crossings downwards gives
+        the familiar horseshoe contour of manufacturer curve sheets.
+
+        Args:
+            performance_map: Map from generate_map
+            levels: Optional efficiency levels in %, defaults to a regular step
+
+        Returns:
+            List of contours with ordered points
+        """
+        effs = performance_map['efficiency_surface_pct']
+        heads = performance_map['head_surface_m']
+        flows = performance_map['flow_grid_m3hr']
+        trims = performance_map['trim_percent']
+
+        if not np.isfinite(effs).any():
+            return []
+
+        if levels is None:
+            low = np.ceil(np.nanmin(effs) / self.contour_step) * self.contour_step
+            high = np.nanmax(effs)
+            levels = np.arange(low, high, self.contour_step).tolist()
+
+        rows = np.arange(len(trims))
+        contours = []
+        for level in levels:
+            delta = effs - level
+            left, right = delta[:, :-1], delta[:, 1:]
+            valid = np.isfinite(left) & np.isfinite(right)
+            rising = valid & (left < 0) & (right >= 0)
+            falling = valid & (left >= 0) & (right < 0)
+
+            branches = []
+            for mask, pick_last in ((rising, False), (falling, True)):
+                has_cross = mask.any(axis=1)
+                if pick_last:
+                    cols = mask.shape[1] - 1 - np.argmax(mask[:, ::-1], axis=1)
+                else:
+                    cols = np.argmax(mask, axis=1)
+                r, c = rows[has_cross], cols[has_cross]
+                frac = delta[r, c] / (delta[r, c] - delta[r, c + 1])
+                q = flows[c] + frac * (flows[c + 1] - flows[c])
+                h = heads[r, c] + frac * (heads[r, c + 1] - heads[r, c])
+                branches.append([
+                    {'flow_m3hr': float(qi), 'head_m': float(hi), 'trim_percent': float(trims[ri])}
+                    for qi, hi, ri in zip(q, h, r) if np.isfinite(hi)
+                ])
+
+            points = branches[0] + branches[1][::-1]
+            if len(points) >= 2:
+                contours.append({'efficiency_pct': float(level), 'points': points})
+
+        return contours
+
+    def approximate_at_point(self, pump_data: Dict[str, Any], flow: float,
+                             head: float) -> Optional[Dict[str, Any]]:
+        """
+        Fast approximate duty-point lookup from the cached map.
+
+        Args:
+            pump_data: Pump data from repository
+            flow: Operating flow rate in m³/hr
+            head: Operating head in meters
+
+        Returns:
+            Approximate trim/efficiency/power or None if the point is off-map
+        """
+        performance_map = self.get_map(pump_data)
+        if not performance_map:
+            return None
+
+        flows = performance_map['flow_grid_m3hr']
+        if not (flows[0] <= flow <= flows[-1]):
+            return None
+
+        col = int(np.clip(np.searchsorted(flows, flow) - 1, 0, len(flows) - 2))
+        weight = (flow - flows[col]) / (flows[col + 1] - flows[col])
+        heads = performance_map['head_surface_m']
+        effs = performance_map['efficiency_surface_pct']
+        head_column = heads[:, col] * (1 - weight) + heads[:, col + 1] * weight
+        eff_column = effs[:, col] * (1 - weight) + effs[:, col + 1] * weight
+
+        usable = np.isfinite(head_column) & np.isfinite(eff_column)
+        if usable.sum() < 2:
+            return None
+        head_column, eff_column = head_column[usable], eff_column[usable]
+        trims = performance_map['trim_percent'][usable]
+
+        # Head rises monotonically with trim at fixed flow
+        if not (head_column[0] <= head <= head_column[-1]):
+            return None
+
+        trim_percent = float(np.interp(head, head_column, trims))
+        efficiency = float(np.interp(head, head_column, eff_column))
+        power = (self.water_density * self.gravity * flow * head) / \
+                (self.seconds_per_hour * efficiency / 100.0 * 1000.0) if efficiency > 0 else None
+
+        return {
+            'pump_code': performance_map['pump_code'],
+            'flow_m3hr': flow,
+            'head_m': head,
+            'trim_percent': trim_percent,
+            'impeller_diameter_mm': performance_map['reference_diameter_mm'] * trim_percent / 100.0,
+            'efficiency_pct': efficiency,
+            'power_kw': power,
+            'approximate': True
+        }
+
+    @staticmethod
+    def to_payload(performance_map: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Convert a map to JSON-ready lists (NaN cells stay NaN for sanitizing).
+
+        Args:
+            performance_map: Map from generate_map
+
+        Returns:
+            JSON-serializable dictionary
+        """
+        return {
+            key: (value.tolist() if isinstance(value, np.ndarray) else value)
+            for key, value in performance_map.items()
+        }
@@ -73,12 +73,19 @@ class PerformanceOptimizer:
     def calculate_efficiency_optimized_trim(self, flows_sorted: List[float], heads_sorted: List[float], 
                                            largest_diameter: float, target_flow: float, target_head: float,
                                            original_bep_flow: float, original_bep_head: float, 
-                                           pump_code: str, physics_exponents: Optional[Dict[str, float]] = None) -> Optional[Dict[str, Any]]:
+                                           pump_code: str, physics_exponents: Optional[Dict[str, float]] = None,
+                                           curve_model: Optional[Any] = None) -> Optional[Dict[str, Any]]:
         """
         Calculate optimal impeller trim that balances efficiency and head requirements.
         
         This method evaluates multiple trim levels to find the best overall performance,
         considering efficiency at operating point, BEP migration, and head margin.
+        
+        When an analytic CurveFitModel is supplied (analytic curve mode), the
+        minimum trim is solved on the fitted curve by intersecting it with the
+        affinity parabola through the duty point, and each trim level's head is
+        evaluated on the affinity-scaled curve instead of scaling the head at
+        the duty flow.
         """
         try:
             logger.info(f"[EFFICIENCY TRIM] {pump_code}: Optimizing trim for {target_flow} m³/hr @ {target_head}m")
@@ -86,7 +93,10 @@ class PerformanceOptimizer:
             # Step 1: Calculate minimum diameter needed to meet head requirements
             head_interp = interpolate.interp1d(flows_sorted, heads_sorted, 
                                             kind='linear', bounds_error=False, fill_value=self.fill_value_interpolation)
-            deliverable_head = float(head_interp(target_flow))
+            if curve_model is not None:
+                deliverable_head = curve_model.evaluate('head', target_flow)
+            else:
+                deliverable_head = float(head_interp(target_flow))
             
             # Special tolerance for BEP testing - allow small precision differences
             if deliverable_head <= 0 or target_head > deliverable_head * self.bep_precision_tolerance:
@@ -99,6 +109,11 @@ class PerformanceOptimizer:
             # Calculate minimum diameter to meet head (with configured safety margin)
             min_head_ratio = (target_head * self.head_safety_margin) / deliverable_head  # Add safety margin
             min_diameter_ratio = np.sqrt(min_head_ratio) if min_head_ratio > 0 else self.default_diameter_ratio
+            if curve_model is not None and target_flow > 0:
+                # Homologous point: the full-diameter flow on H = (H_req / Q²) * Q²
+                homologous_flow = curve_model.flow_at_head(0.0, system_k=target_head * self.head_safety_margin / target_flow ** 2)
+                if homologous_flow:
+                    min_diameter_ratio = target_flow / homologous_flow
             min_diameter = largest_diameter * min_diameter_ratio
             min_trim_for_head = min_diameter_ratio * self.base_score
             
@@ -115,11 +130,12 @@ class PerformanceOptimizer:
             # Always include minimum trim needed for head
             test_trims.append(min_trim_for_head)
             
-            # Add incremental trims up to 100%
+            # Add incremental trims up to 100% (coarser when the load controller has reduced fidelity)
+            trim_increment = self.trim_test_increment * self.brain.load_control.setting('trim_increment_multiplier', 1)
             current_trim = max(self.min_trim_percent, min_trim_for_head + self.trim_test_start_increment)  # Start increment above minimum
             while current_trim <= self.max_trim_percent:
                 test_trims.append(current_trim)
-                current_trim += self.trim_test_increment  # Test in configured increments
+                current_trim += trim_increment  # Test in configured increments
                 
             # Always include maximum trim (full impeller)
             if self.max_trim_percent not in test_trims:
@@ -137,6 +153,12 @@ class PerformanceOptimizer:
                 # Calculate performance at this trim level using pump-type-specific exponent
                 head_exponent = physics_exponents['head_exponent_y'] if physics_exponents else self.default_head_exponent
                 test_head = deliverable_head * (diameter_ratio ** head_exponent)
+                if curve_model is not None:
+                    # Affinity-scaled curve: H_d(Q) = r^y * H(Q / r^x)
+                    flow_exponent = physics_exponents['flow_exponent_x'] if physics_exponents else self.validator.get_calibration_factor('bep_shift_flow_exponent', self.default_bep_shift_flow_exponent)
+                    scaled_head = (diameter_ratio ** head_exponent) * curve_model.evaluate('head', target_flow / diameter_ratio ** flow_exponent)
+                    if not np.isnan(scaled_head):
+                        test_head = scaled_head
                 
                 # Skip if this trim doesn't meet head requirements
                 if test_head < target_head * self.head_requirement_tolerance:  # Configured tolerance
@@ -6,7 +6,7 @@ Performance validation utilities and envelope checking
 
 import logging
 from typing import Dict, Any
-from .physics_models import get_exponents_for_pump_type
+from .hydraulic_profile import HydraulicProfiler
 from .config_manager import config
 
 logger = logging.getLogger(__name__)
@@ -39,8 +39,7 @@ class PerformanceValidator:
         """
         Get the pump-type-specific physics model exponents.
         """
-        pump_type = pump_data.get('pump_type', '')
-        return get_exponents_for_pump_type(pump_type)
+        return HydraulicProfiler.get_exponents(pump_data)
 
     def get_calibration_factor(self, factor_name: str, default_value: float = None) -> float:
         """Get calibration factor with fallback to config default."""
@@ -8,6 +8,7 @@ import logging
 import numpy as np
 from typing import Dict, Any, Optional
 from scipy import interpolate
+from .curve_fits import CurveFitter
 from .config_manager import config
 
 logger = logging.getLogger(__name__)
@@ -113,37 +114,50 @@ class VFDCalculator:
             best_point = None
             best_error = float('inf')
             
-            # First try interpolation at regular intervals
             flow_min = min(reference_flows)
             flow_max = max(reference_flows)
             
-            # Create interpolation function for the reference curve
-            head_interp = interpolate.interp1d(reference_flows, reference_heads, 
-                                             kind='cubic' if len(reference_flows) > config.get('performance_vfd', 'threshold_for_cubic_interpolation') else 'linear',
-                                             bounds_error=False, fill_value='extrapolate')
-            
-            # Search for the best matching point
-            search_flows = np.linspace(flow_min * config.get('performance_vfd', 'search_flow_range_lower_multiplier'), 
-                                     flow_max * config.get('performance_vfd', 'search_flow_range_upper_multiplier'), 
-                                     config.get('performance_vfd', 'number_of_search_flow_samples'))
-            
-            for q1 in search_flows:
-                if q1 <= 0:
-                    continue
+            # Optional analytic mode: intersect the fitted reference curve with
+            # the system curve H = H_static + k * Q² directly
+            curve_model = CurveFitter.get_model(reference_curve) if CurveFitter.is_analytic_mode() else None
+            if curve_model is not None:
+                q1 = curve_model.flow_at_head(h_static, system_k=k_system)
+                if q1 is not None and q1 > 0:
+                    best_point = {'flow': q1, 'head': curve_model.evaluate('head', q1), 'k': k_system}
+                    best_error = 0.0
+            
+            if best_point is None:
+                # Reference mode: search interpolated points at regular intervals
+                # Create interpolation function for the reference curve
+                head_interp = interpolate.interp1d(reference_flows, reference_heads, 
+                                                 kind='cubic' if len(reference_flows) > config.get('performance_vfd', 'threshold_for_cubic_interpolation') else 'linear',
+                                                 bounds_error=False, fill_value='extrapolate')
+            
+                # Search for the best matching point
+                # Fewer samples when the load controller has reduced fidelity
+                sample_count = config.get('performance_vfd', 'number_of_search_flow_samples')
+                sample_count = max(int(sample_count * self.brain.load_control.setting('vfd_search_sample_fraction', 1.0)), 2)
+                search_flows = np.linspace(flow_min * config.get('performance_vfd', 'search_flow_range_lower_multiplier'), 
+                                         flow_max * config.get('performance_vfd', 'search_flow_range_upper_multiplier'), 
+                                         sample_count)
+            
+                for q1 in search_flows:
+                    if q1 <= 0:
+                        continue
                     
-                h1 = float(head_interp(q1))
-                if h1 <= h_static:
-                    continue  # Head must be above static head
+                    h1 = float(head_interp(q1))
+                    if h1 <= h_static:
+                        continue  # Head must be above static head
                 
-                # Calculate k for this point
-                k_point = (h1 - h_static) / (q1 ** 2)
+                    # Calculate k for this point
+                    k_point = (h1 - h_static) / (q1 ** 2)
                 
-                # Calculate error
-                error = abs(k_point - k_system) / k_system if k_system != 0 else abs(k_point)
+                    # Calculate error
+                    error = abs(k_point - k_system) / k_system if k_system != 0 else abs(k_point)
                 
-                if error < best_error:
-                    best_error = error
-                    best_point = {'flow': q1, 'head': h1, 'k': k_point}
+                    if error < best_error:
+                        best_error = error
+                        best_point = {'flow': q1, 'head': h1, 'k': k_point}
             
             error_tolerance = config.get('performance_vfd', 'error_tolerance_for_system_curve_matching')
             if best_point is None or best_error > error_tolerance:  # Allow configurable error in k matching
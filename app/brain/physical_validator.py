@@ -8,6 +8,7 @@ import logging
 from typing import Dict, Any, Tuple
 from ..process_logger import process_logger
 from .config_manager import config
+from .operating_envelope import OperatingEnvelope, ENVELOPE_INSIDE, ENVELOPE_OUTSIDE
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +42,20 @@ class PhysicalValidator:
             logger.debug(f"Pump {pump_code}: {reason}")
             return False, reason
         
+        # Fast path: precomputed envelope polygon decides clear-cut points
+        if config.get('operating_envelope', 'envelope_fast_path_enabled'):
+            envelope = OperatingEnvelope.get_envelope(pump_data)
+            if envelope:
+                head_tolerance = config.get('physical_validator', 'head_tolerance_for_capability_validation_2')
+                classification, reason = OperatingEnvelope.classify(envelope, flow_m3hr, head_m, head_tolerance)
+                if classification == ENVELOPE_INSIDE:
+                    process_logger.log(f"    {pump_code}: PHYSICALLY CAPABLE - inside operating envelope")
+                    return True, reason
+                if classification == ENVELOPE_OUTSIDE:
+                    process_logger.log(f"    {pump_code}: EXCLUDED - {reason}")
+                    logger.debug(f"Pump {pump_code}: {reason}")
+                    return False, reason
+        
         # Check curves starting with maximum impeller diameter first (authentic manufacturer design)
         sorted_curves = sorted(curves, key=lambda x: x.get('impeller_diameter_mm', 0), reverse=True)
         
@@ -9,6 +9,7 @@ import math
 from typing import Dict, List, Any, Optional
 
 from .hydraulic_classifier import HydraulicClassifier
+from .hydraulic_profile import HydraulicProfiler
 from .bep_calculator import BEPCalculator
 from .config_manager import config
 from ..process_logger import process_logger
@@ -31,6 +32,35 @@ class ProximitySearcher:
         self.hydraulic_classifier = HydraulicClassifier()
         self.bep_calculator = BEPCalculator()
     
+    @staticmethod
+    def bep_distance(pump: Dict[str, Any], flow: float, head: float) -> float:
+        """
+        Weighted BEP distance of a pump from a duty point.
+        
+        Uses symmetric normalized flow/head differences weighted by the
+        pump's hydraulic class, as the proximity search ranks candidates.
+        
+        Args:
+            pump: Pump data
+            flow: Duty flow in m³/hr
+            head: Duty head in meters
+        
+        Returns:
+            Distance (0 at the BEP), infinity for pumps without BEP data
+        """
+        profile = HydraulicProfiler.get_profile(pump)
+        if not profile['has_bep']:
+            return float('inf')
+        bep_flow = profile['bep_flow_m3hr']
+        bep_head = profile['bep_head_m']
+        hydraulic_type = profile['hydraulic_class']
+        flow_delta = abs(flow - bep_flow) / max(flow, bep_flow)
+        head_delta = abs(head - bep_head) / max(head, bep_head)
+        return math.sqrt(
+            hydraulic_type['flow_weight'] * (flow_delta ** 2) +
+            hydraulic_type['head_weight'] * (head_delta ** 2)
+        )
+    
     def find_pumps_by_bep_proximity(self, flow: float, head: float, 
                                    pump_type: Optional[str] = None) -> List[Dict[str, Any]]:
         """
@@ -82,34 +112,26 @@ class ProximitySearcher:
                 if pump_type.upper() not in pump_type_actual.upper():
                     continue
             
-            # Get BEP data from specifications (authentic manufacturer data)
-            specs = pump.get('specifications', {})
-            bep_flow = specs.get('bep_flow_m3hr')
-            bep_head = specs.get('bep_head_m')
-            bep_efficiency = specs.get('bep_efficiency_pct')
+            # BEP data, specific speed and hydraulic class precomputed at catalog load
+            profile = HydraulicProfiler.get_profile(pump)
             
             # Skip pumps without valid BEP data
-            if not bep_flow or not bep_head or bep_flow <= 0 or bep_head <= 0:
+            if not profile['has_bep']:
                 logger.debug(f"[BEP PROXIMITY] {pump_code}: Skipping - no valid BEP data")
                 continue
             
-            # Get speed from specifications or use default
-            default_motor_speed = config.get('proximity_searcher', 'default_2pole_motor_speed_at_50hz_rpm')
-            speed_rpm = specs.get('speed_rpm', default_motor_speed)
-            
-            # Calculate specific speed for pump classification
-            specific_speed = self.hydraulic_classifier.calculate_specific_speed(bep_flow, bep_head, speed_rpm)
-            hydraulic_type = self.hydraulic_classifier.classify_pump_hydraulic_type(specific_speed)
+            bep_flow = profile['bep_flow_m3hr']
+            bep_head = profile['bep_head_m']
+            bep_efficiency = profile['bep_efficiency_pct']
+            specific_speed = profile['specific_speed']
+            hydraulic_type = profile['hydraulic_class']
             
             # Calculate symmetric normalized differences
             flow_delta = abs(flow - bep_flow) / max(flow, bep_flow)
             head_delta = abs(head - bep_head) / max(head, bep_head)
             
             # Apply pump-type-specific weighting to distance calculation
-            weighted_distance = math.sqrt(
-                hydraulic_type['flow_weight'] * (flow_delta ** 2) + 
-                hydraulic_type['head_weight'] * (head_delta ** 2)
-            )
+            weighted_distance = self.bep_distance(pump, flow, head)
             
             # Convert to percentage for display
             proximity_score_pct = weighted_distance * config.get('proximity_searcher', 'percentage_conversion_factor')
@@ -177,17 +199,8 @@ class ProximitySearcher:
                 min_efficiency_floor = config.get('proximity_searcher', 'minimum_realistic_efficiency_floor_percentage')
                 predicted_efficiency = max(bep_efficiency - efficiency_drop, min_efficiency_floor)
             
-            # Calculate operating range score (how well pump can handle flow variations)
-            # Wider operating range is better for variable conditions
-            radial_threshold = config.get('proximity_searcher', 'specific_speed_threshold_for_radial_pumps')
-            mixed_flow_threshold = config.get('proximity_searcher', 'specific_speed_threshold_for_mixed_flow_pumps')
-            
-            if specific_speed < radial_threshold:  # Radial pumps have wider stable range
-                operating_range_score = config.get('proximity_searcher', 'operating_range_score_for_radial_pumps')
-            elif specific_speed < mixed_flow_threshold:  # Mixed flow moderate range
-                operating_range_score = config.get('proximity_searcher', 'operating_range_score_for_mixed_flow_pumps')
-            else:  # Axial narrow stable range
-                operating_range_score = config.get('proximity_searcher', 'operating_range_score_for_axial_pumps')
+            # Operating range score (wider stable range is better for variable conditions)
+            operating_range_score = profile['operating_range_score']
             
             candidate_pumps.append({
                 'pump_code': pump_code,
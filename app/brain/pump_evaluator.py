@@ -52,6 +52,33 @@ class PumpEvaluator:
         self.head_oversizing_threshold = config.get('pump_evaluator', 'head_oversizing_threshold_percentage')  # % above requirement triggers penalty (was 40%)
         self.severe_oversizing_threshold = config.get('pump_evaluator', 'severe_head_oversizing_threshold_percentage')  # % above requirement for severe penalty (was 70%)
     
+    def score_efficiency(self, efficiency: float) -> float:
+        """
+        Efficiency score component (Legacy v6.0 - 35 points max).
+        
+        Args:
+            efficiency: Operating efficiency in percent
+        
+        Returns:
+            Efficiency points
+        """
+        excellent_eff = config.get('pump_evaluator', 'excellent_efficiency_scoring_threshold_percentage')
+        good_eff = config.get('pump_evaluator', 'good_efficiency_scoring_threshold_percentage')
+        fair_eff = config.get('pump_evaluator', 'fair_efficiency_scoring_threshold_percentage')
+        poor_eff = config.get('pump_evaluator', 'poor_efficiency_scoring_threshold_percentage')
+        min_eff = config.get('pump_evaluator', 'minimum_acceptable_efficiency_threshold_percentage')
+        
+        if efficiency >= excellent_eff:
+            return config.get('pump_evaluator', 'maximum_efficiency_score')
+        elif efficiency >= good_eff:
+            return config.get('pump_evaluator', 'base_efficiency_score_for_good_range') + (efficiency - good_eff) * config.get('pump_evaluator', 'efficiency_score_multiplier_for_good_range')
+        elif efficiency >= fair_eff:
+            return config.get('pump_evaluator', 'base_efficiency_score_for_fair_range') + (efficiency - fair_eff) * config.get('pump_evaluator', 'efficiency_score_multiplier_for_good_range')
+        elif efficiency >= poor_eff:
+            return config.get('pump_evaluator', 'base_efficiency_score_for_poor_range') + (efficiency - poor_eff) * config.get('pump_evaluator', 'efficiency_score_multiplier_for_poor_range')
+        else:  # min_eff to poor_eff
+            return max(0, (efficiency - min_eff) * config.get('pump_evaluator', 'efficiency_score_multiplier_for_minimum_range'))
+    
     def evaluate_single_pump(self, pump_data: Dict[str, Any], 
                             flow: float, head: float, pump_code: str) -> Dict[str, Any]:
         """
@@ -283,6 +310,22 @@ class PumpEvaluator:
                 # Use existing impeller trimming calculation
                 performance = self.brain.performance.calculate_at_point(pump_data, flow, head)
                 
+                # FLEXIBLE pumps: search the combined trim + speed space
+                if operation_mode == 'FLEXIBLE' and self.brain.speed_trim.mode != 'off':
+                    combined = self.brain.speed_trim.optimize(pump_data, flow, head)
+                    if combined:
+                        evaluation['combined_speed_trim'] = combined
+                        trim_efficiency = performance.get('efficiency_pct', 0) if performance else 0
+                        if self.brain.speed_trim.mode == 'select' and \
+                                combined['efficiency_pct'] >= trim_efficiency + self.brain.speed_trim.min_efficiency_gain:
+                            performance = combined
+                            evaluation['sizing_method'] = 'Speed + Trim'
+                            evaluation['required_speed_rpm'] = combined['required_speed_rpm']
+                            evaluation['speed_ratio'] = combined['speed_ratio']
+                            evaluation['operating_frequency_hz'] = combined['operating_frequency_hz']
+                            logger.info(f"[FLEXIBLE] {pump_data.get('pump_code')}: Selected trim + speed "
+                                        f"({combined['efficiency_pct']:.1f}% vs {trim_efficiency:.1f}% trim only)")
+                
             elif selection_method == 'SPEED_VARIATION':
                 # Use VFD calculation for speed variation
                 performance = self.brain.performance.calculate_performance_with_speed_variation(pump_data, flow, head)
@@ -443,22 +486,7 @@ class PumpEvaluator:
                 
                 # Efficiency score (Legacy v6.0 - 35 points max)
                 efficiency = performance.get('efficiency_pct', 0)
-                excellent_eff = config.get('pump_evaluator', 'excellent_efficiency_scoring_threshold_percentage')
-                good_eff = config.get('pump_evaluator', 'good_efficiency_scoring_threshold_percentage')
-                fair_eff = config.get('pump_evaluator', 'fair_efficiency_scoring_threshold_percentage')
-                poor_eff = config.get('pump_evaluator', 'poor_efficiency_scoring_threshold_percentage')
-                min_eff = config.get('pump_evaluator', 'minimum_acceptable_efficiency_threshold_percentage')
-                
-                if efficiency >= excellent_eff:
-                    eff_score = config.get('pump_evaluator', 'maximum_efficiency_score')
-                elif efficiency >= good_eff:
-                    eff_score = config.get('pump_evaluator', 'base_efficiency_score_for_good_range') + (efficiency - good_eff) * config.get('pump_evaluator', 'efficiency_score_multiplier_for_good_range')
-                elif efficiency >= fair_eff:
-                    eff_score = config.get('pump_evaluator', 'base_efficiency_score_for_fair_range') + (efficiency - fair_eff) * config.get('pump_evaluator', 'efficiency_score_multiplier_for_good_range')
-                elif efficiency >= poor_eff:
-                    eff_score = config.get('pump_evaluator', 'base_efficiency_score_for_poor_range') + (efficiency - poor_eff) * config.get('pump_evaluator', 'efficiency_score_multiplier_for_poor_range')
-                else:  # min_eff to poor_eff
-                    eff_score = max(0, (efficiency - min_eff) * config.get('pump_evaluator', 'efficiency_score_multiplier_for_minimum_range'))
+                eff_score = self.score_efficiency(efficiency)
                 
                 evaluation['score_components']['efficiency'] = eff_score
                 evaluation['efficiency_pct'] = efficiency
@@ -0,0 +1,141 @@
+"""
+Brain Request Context Module
+============================
+Request-scoped memoization of pump lookups, evaluations and derived models
+"""
+
+import logging
+from typing import Dict, Any, Optional, Callable, Hashable
+
+from flask import g, has_app_context
+
+logger = logging.getLogger(__name__)
+
+# Attribute name used to store the context on flask.g
+_CONTEXT_ATTR = '_brain_request_context'
+
+
+class RequestContext:
+    """
+    Per-request memo of Brain results.
+
+    Lives on flask.g, so it is discarded automatically at the end of the
+    request and never needs cross-request invalidation. Outside a Flask
+    app context a fresh, short-lived instance is returned instead.
+    """
+
+    def __init__(self):
+        """Initialize empty memo tables."""
+        self._pumps: Dict[str, Optional[Dict[str, Any]]] = {}
+        self._evaluations: Dict[Hashable, Dict[str, Any]] = {}
+        self._models: Dict[Hashable, Any] = {}
+        self._stats = {'hits': 0, 'misses': 0}
+
+    @staticmethod
+    def _normalize_code(pump_code: str) -> str:
+        """Normalize a pump code the same way the repository does."""
+        return ''.join((pump_code or '').split()).upper()
+
+    def get_pump(self, repository, pump_code: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up pump data once per request.
+
+        Args:
+            repository: Pump repository instance
+            pump_code: Pump code as supplied by the caller
+
+        Returns:
+            Pump data dictionary or None if not found
+        """
+        key = self._normalize_code(pump_code)
+        if key in self._pumps:
+            self._stats['hits'] += 1
+            return self._pumps[key]
+
+        self._stats['misses'] += 1
+        pump_data = repository.get_pump_by_code(pump_code)
+        self._pumps[key] = pump_data
+        return pump_data
+
+    def get_evaluation(self, pump_code: str, flow: float, head: float,
+                       factory: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Return the evaluation of a pump at a duty point, computing it once.
+
+        A shallow copy is returned so callers that add presentation fields
+        (e.g. suitability_score) do not leak them into other consumers.
+
+        Args:
+            pump_code: Pump code
+            flow: Operating flow rate in m³/hr
+            head: Operating head in meters
+            factory: Callable producing the evaluation on a miss
+
+        Returns:
+            Evaluation dictionary
+        """
+        key = (self._normalize_code(pump_code), float(flow), float(head))
+        if key in self._evaluations:
+            self._stats['hits'] += 1
+        else:
+            self._stats['misses'] += 1
+            self._evaluations[key] = factory()
+
+        evaluation = self._evaluations[key]
+        return dict(evaluation) if isinstance(evaluation, dict) else evaluation
+
+    def memoize(self, namespace: str, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """
+        Generic request-scoped memo for derived models (chart series,
+        selection results, etc.).
+
+        Args:
+            namespace: Logical group of the cached value
+            key: Hashable key within the namespace
+            factory: Callable producing the value on a miss
+
+        Returns:
+            Memoized value
+        """
+        full_key = (namespace, key)
+        if full_key in self._models:
+            self._stats['hits'] += 1
+            return self._models[full_key]
+
+        self._stats['misses'] += 1
+        value = factory()
+        self._models[full_key] = value
+        return value
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get memo statistics for the current request.
+
+        Returns:
+            Statistics dictionary
+        """
+        return {
+            'pumps': len(self._pumps),
+            'evaluations': len(self._evaluations),
+            'models': len(self._models),
+            'hits': self._stats['hits'],
+            'misses': self._stats['misses']
+        }
+
+
+def get_request_context() -> RequestContext:
+    """
+    Get the RequestContext bound to the current request.
+
+    Returns:
+        RequestContext stored on flask.g, or a new unbound instance when
+        called outside an application context (scripts, background jobs)
+    """
+    if not has_app_context():
+        return RequestContext()
+
+    context = getattr(g, _CONTEXT_ATTR, None)
+    if context is None:
+        context = RequestContext()
+        setattr(g, _CONTEXT_ATTR, context)
+    return context
@@ -5,6 +5,7 @@ Main SelectionIntelligence class - orchestrates pump selection process
 """
 
 import logging
+import time
 import numpy as np
 from typing import Dict, List, Any, Optional
 
@@ -12,6 +13,7 @@ from ..data_models import SiteRequirements, PumpEvaluation, ExclusionReason
 from ..process_logger import process_logger
 from .pump_evaluator import PumpEvaluator
 from .proximity_searcher import ProximitySearcher
+from .family_index import FamilyIndex
 from .config_manager import config
 
 logger = logging.getLogger(__name__)
@@ -73,10 +75,14 @@ class SelectionIntelligence:
         self.debug_sample_pumps = config.get('selection_core', 'number_of_sample_pumps_to_log_for_debugging')
         self.max_excluded_display = config.get('selection_core', 'maximum_excluded_pumps_to_display_in_logs')
         self.sample_excluded_show = config.get('selection_core', 'number_of_sample_excluded_pumps_to_show')
+        self.family_pruning_enabled = config.get('family_index', 'family_pruning_enabled')
+        self.default_deadline_seconds = config.get('selection_deadline', 'default_deadline_seconds')
+        self.minimum_evaluations_before_deadline = config.get('selection_deadline', 'minimum_evaluations_before_deadline')
     
     def find_best_pumps(self, flow: float, head: float, 
                        constraints: Optional[Dict[str, Any]] = None, 
-                       include_exclusions: bool = False) -> Dict[str, Any]:
+                       include_exclusions: bool = False,
+                       deadline_seconds: Optional[float] = None) -> Dict[str, Any]:
         """
         Find best pumps for given conditions with optional exclusion details.
         
@@ -85,10 +91,17 @@ class SelectionIntelligence:
             head: Required head (m)
             constraints: Optional constraints
             include_exclusions: If True, return detailed exclusion data
+            deadline_seconds: Optional latency budget; candidates are then
+                evaluated nearest-BEP first and the search stops when it expires
         
         Returns:
-            Dictionary with 'ranked_pumps' and optionally 'exclusion_details'
+            Dictionary with 'ranked_pumps', optionally 'exclusion_details',
+            and 'search_status' when a deadline applies
         """
+        started = time.monotonic()
+        if deadline_seconds is None:
+            deadline_seconds = self.default_deadline_seconds
+        
         # Log function entry
         process_logger.log(f"Executing: {__name__}.SelectionIntelligence.find_best_pumps")
         if not self.brain.repository:
@@ -115,6 +128,15 @@ class SelectionIntelligence:
             process_logger.log("ERROR: No pump models in repository!", "ERROR")
             return {'ranked_pumps': [], 'exclusion_details': None}
         
+        catalog_pumps = all_pumps
+        
+        # Virtual speed/stage variants, materialized only where they can reach the duty
+        variants = []
+        if constraints.get('include_virtual_variants', self.brain.virtual_catalog.include_by_default):
+            variants = self.brain.virtual_catalog.get_variants(flow, head, constraints)
+            process_logger.log(f"VIRTUAL CATALOG: {len(variants)} derived variants added")
+            all_pumps = all_pumps + variants
+        
         # Log all pumps loaded from repository
         process_logger.log_separator()
         process_logger.log(f"REPOSITORY: Loaded {len(all_pumps)} pumps")
@@ -177,7 +199,25 @@ class SelectionIntelligence:
         flow_excluded_list = []
         head_excluded_list = []
         
-        for pump in all_pumps:
+        # FAMILY PRUNING: drop whole series/type families that cannot pass the pre-filter
+        prefilter_pumps = all_pumps
+        if self.family_pruning_enabled:
+            family_index = FamilyIndex.get_index(catalog_pumps, self.brain.get_catalog_version())
+            # Wrong-type pumps are reported as exclusions, so only prune them when none are requested
+            type_constraint = (constraints.get('pump_type') or 'GENERAL').upper()
+            surviving, family_stats = family_index.prune(
+                catalog_pumps,
+                (min_flow_threshold, max_flow_threshold),
+                (min_head_threshold, max_head_threshold),
+                type_constraint if type_constraint != 'GENERAL' and not include_exclusions else None
+            )
+            prefilter_pumps = surviving + variants
+            logger.info(f"[FAMILY INDEX] {family_stats}")
+            process_logger.log(f"FAMILY PRUNING: {family_stats['pumps_pruned']} pumps in "
+                               f"{family_stats['flow_pruned'] + family_stats['head_pruned'] + family_stats['type_pruned']} "
+                               f"of {family_stats['families']} families skipped")
+        
+        for pump in prefilter_pumps:
             specs = pump.get('specifications', {})
             bep_flow = specs.get('bep_flow_m3hr', 0)
             bep_head = specs.get('bep_head_m', 0)
@@ -281,7 +321,72 @@ class SelectionIntelligence:
         # PASS 1: Evaluate all pumps without detailed logging to determine rankings
         pump_evaluations = []  # Store all evaluations for ranking calculation
         
-        for pump_data in pump_models:
+        # Filters and weights only re-rank; per-pump physics comes from the duty-point session
+        score_weights = self.brain.selection_sessions.resolve_weights(constraints)
+        session = self.brain.selection_sessions.get_session(flow, head)
+        max_results = constraints.get('max_results', self.default_max_results)
+        
+        def evaluate_for_ranking(pump_data, pump_code):
+            # PASS 1: Evaluate pump without detailed logging (physics reused across rankings)
+            if session is not None:
+                evaluation = session.get_evaluation(
+                    pump_code,
+                    lambda: self.pump_evaluator.evaluate_single_pump(pump_data, flow, head, pump_code)
+                )
+            else:
+                evaluation = self.pump_evaluator.evaluate_single_pump(pump_data, flow, head, pump_code)
+            # Ranking-time constraints and weights (never part of the cached physics)
+            self.brain.selection_sessions.apply_ranking_constraints(evaluation, constraints, score_weights)
+            return evaluation
+        
+        # Warm start: previous duty's ranked pumps first, then skip pumps whose
+        # score bound cannot reach the top results (ranking stays identical)
+        warm_start = self.brain.warm_start.plan(flow, head, constraints, include_exclusions,
+                                                score_weights, max_results)
+        seeded_evaluations = {}
+        if warm_start is not None:
+            seed_codes = set(warm_start.seed_codes)
+            type_constraint = (constraints.get('pump_type') or 'GENERAL').upper()
+            for pump_data in pump_models:
+                pump_code = pump_data.get('pump_code', 'Unknown')
+                if pump_code not in seed_codes:
+                    continue
+                if type_constraint != 'GENERAL' and pump_data.get('pump_type', '').upper() != type_constraint:
+                    continue
+                try:
+                    evaluation = evaluate_for_ranking(pump_data, pump_code)
+                except Exception as e:
+                    logger.debug(f"[WARM START] Seed {pump_code} left to the main pass: {str(e)}")
+                    continue
+                seeded_evaluations[pump_code] = evaluation
+                warm_start.stats['seeded'] += 1
+                warm_start.offer(evaluation)
+        
+        # LATENCY BUDGET: nearest-BEP candidates first so a cut-off search keeps the likeliest winners
+        # (also when the load controller caps the number of candidates)
+        deadline = started + deadline_seconds if deadline_seconds else None
+        candidate_limit = self.brain.load_control.setting('max_candidates')
+        prioritized = deadline is not None or bool(candidate_limit)
+        evaluation_order = list(range(len(pump_models)))
+        if prioritized:
+            bep_distances = [self.proximity_searcher.bep_distance(p, flow, head) for p in pump_models]
+            evaluation_order.sort(key=lambda k: bep_distances[k])
+        candidates_visited = 0
+        search_partial = False
+        
+        for position in evaluation_order:
+            pump_data = pump_models[position]
+            if deadline is not None and candidates_visited >= self.minimum_evaluations_before_deadline \
+                    and time.monotonic() >= deadline:
+                search_partial = True
+                logger.warning(f"[DEADLINE] {deadline_seconds:.1f}s budget spent after "
+                               f"{candidates_visited} of {len(pump_models)} candidates")
+                break
+            if candidate_limit and candidates_visited >= candidate_limit:
+                search_partial = True
+                logger.info(f"[LOAD CONTROL] Candidate cap {candidate_limit} of {len(pump_models)} reached")
+                break
+            candidates_visited += 1
             try:
                 # Extract pump code for this iteration
                 pump_code = pump_data.get('pump_code', 'Unknown')
@@ -318,8 +423,15 @@ class SelectionIntelligence:
                 logger.debug(f"[SELECTION DEBUG] {pump_code}: BEP {specs.get('bep_flow_m3hr', 0)} m³/hr @ {specs.get('bep_head_m', 0)}m")
                 logger.debug(f"[SELECTION DEBUG] {pump_code}: Max impeller: {specs.get('max_impeller_diameter_mm', 0)}mm")
                 
-                # PASS 1: Evaluate pump without detailed logging
-                evaluation = self.pump_evaluator.evaluate_single_pump(pump_data, flow, head, pump_code)
+                if pump_code in seeded_evaluations:
+                    evaluation = seeded_evaluations[pump_code]
+                elif warm_start is not None and warm_start.can_skip(pump_data, flow, head):
+                    logger.debug(f"[WARM START] {pump_code}: score bound below current top {max_results} - skipped")
+                    continue
+                else:
+                    evaluation = evaluate_for_ranking(pump_data, pump_code)
+                    if warm_start is not None:
+                        warm_start.offer(evaluation)
                 
                 # Store evaluation with pump data for ranking calculation
                 pump_evaluations.append({
@@ -327,16 +439,10 @@ class SelectionIntelligence:
                     'pump_code': pump_code,
                     'evaluation': evaluation,
                     'flow': flow,
-                    'head': head
+                    'head': head,
+                    'position': position
                 })
                 
-                # Apply additional constraints
-                if constraints.get('max_power_kw'):
-                    max_power = constraints['max_power_kw']
-                    if evaluation.get('power_kw', 0) > max_power:
-                        evaluation['feasible'] = False
-                        evaluation['exclusion_reasons'].append('Power exceeds limit')
-                
             except Exception as e:
                 logger.error(f"Error evaluating pump {pump_data.get('pump_code')}: {str(e)}")
                 if include_exclusions:
@@ -349,6 +455,10 @@ class SelectionIntelligence:
                     exclusion_summary['Evaluation error'] = exclusion_summary.get('Evaluation error', 0) + 1
                 continue
         
+        # Back to catalog order so score ties rank exactly as in an unprioritized pass
+        if prioritized:
+            pump_evaluations.sort(key=lambda e: e['position'])
+        
         # Separate feasible and excluded pumps
         for pump_eval in pump_evaluations:
             evaluation = pump_eval['evaluation']
@@ -393,7 +503,6 @@ class SelectionIntelligence:
         feasible_pumps.sort(key=lambda x: x.get('total_score', 0), reverse=True)
         
         # Prepare result structure
-        max_results = constraints.get('max_results', self.default_max_results)
         result = {
             'ranked_pumps': feasible_pumps[:max_results]
         }
@@ -412,6 +521,22 @@ class SelectionIntelligence:
             }
             result.update({'exclusion_details': exclusion_details})
         
+        if prioritized:
+            result['search_status'] = {
+                'partial': search_partial,
+                'deadline_seconds': deadline_seconds,
+                'elapsed_seconds': time.monotonic() - started,
+                'candidates_total': len(pump_models),
+                'candidates_evaluated': candidates_visited,
+                'coverage_fraction': candidates_visited / len(pump_models) if pump_models else 1.0
+            }
+        
+        if session is not None:
+            session.record_ranking([p.get('pump_code') for p in result['ranked_pumps']])
+            logger.info(f"[SELECTION SESSION] {session.get_stats()}")
+        if warm_start is not None:
+            logger.info(f"[WARM START] {warm_start.stats} of {len(pump_models)} candidates")
+        
         # Log final rankings
         process_logger.log_final_rankings(feasible_pumps, excluded_pumps)
         
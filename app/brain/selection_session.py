@@ -0,0 +1,194 @@
+"""
+Selection Session Module
+========================
+Duty-point physics cache so constraint and weight changes only re-rank
+"""
+
+import copy
+import logging
+from typing import Dict, List, Any, Optional, Callable
+from .config_manager import config
+
+logger = logging.getLogger(__name__)
+
+
+class SelectionSession:
+    """
+    Per-pump evaluations for one duty point and catalog version.
+
+    Evaluations depend only on the pump and the duty point, never on
+    filters or weights, so every ranking of the same duty point can share
+    them. Copies are handed out because ranking annotates evaluations.
+    """
+
+    def __init__(self, flow: float, head: float, catalog_version: str):
+        """
+        Args:
+            flow: Duty flow in m³/hr
+            head: Duty head in meters
+            catalog_version: Catalog build stamp the evaluations belong to
+        """
+        self.flow = flow
+        self.head = head
+        self.catalog_version = catalog_version
+        self._evaluations: Dict[str, Dict[str, Any]] = {}
+        self._stats = {'hits': 0, 'misses': 0, 'rankings': 0}
+
+        # Codes returned by the latest ranking (seeds warm starts of nearby duties)
+        self.last_ranked_codes: List[str] = []
+
+    def get_evaluation(self, pump_code: str, factory: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Return the physics evaluation of a pump, computing it once per session.
+
+        Args:
+            pump_code: Pump code
+            factory: Callable producing the evaluation on a miss
+
+        Returns:
+            Independent copy of the evaluation
+        """
+        if pump_code in self._evaluations:
+            self._stats['hits'] += 1
+        else:
+            self._stats['misses'] += 1
+            self._evaluations[pump_code] = factory()
+        return copy.deepcopy(self._evaluations[pump_code])
+
+    def record_ranking(self, ranked_codes: List[str]):
+        """
+        Count one ranking pass served by this session.
+
+        Args:
+            ranked_codes: Pump codes returned by the ranking, best first
+        """
+        self._stats['rankings'] += 1
+        self.last_ranked_codes = list(ranked_codes)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get session statistics.
+
+        Returns:
+            Statistics dictionary
+        """
+        return {
+            'flow_m3hr': self.flow,
+            'head_m': self.head,
+            'catalog_version': self.catalog_version,
+            'evaluations': len(self._evaluations),
+            'hits': self._stats['hits'],
+            'misses': self._stats['misses'],
+            'rankings': self._stats['rankings']
+        }
+
+
+class SelectionSessionStore:
+    """Keeps selection sessions in the Brain cache and resolves ranking weights"""
+
+    def __init__(self, brain):
+        """
+        Initialize with reference to main Brain.
+
+        Args:
+            brain: Parent PumpBrain instance
+        """
+        self.brain = brain
+        self.enabled = config.get('selection_session', 'incremental_ranking_enabled')
+        self.session_ttl = config.get('selection_session', 'session_ttl_seconds')
+        self.profiles = config.get('selection_session', 'selection_profiles')
+        self.npsh_safety_factor = config.get('selection_core', 'npsh_safety_factor')
+
+    def get_session(self, flow: float, head: float) -> Optional[SelectionSession]:
+        """
+        Get (or open) the session of a duty point for the loaded catalog.
+
+        Args:
+            flow: Duty flow in m³/hr
+            head: Duty head in meters
+
+        Returns:
+            SelectionSession, or None when incremental ranking is disabled
+        """
+        if not self.enabled:
+            return None
+
+        version = self.brain.get_catalog_version()
+        # Reduced-fidelity physics must never serve full-fidelity rankings
+        cache_key = self.brain._cache.make_key('selection_session', version, self.brain.load_control.current_level(),
+                                               float(flow), float(head))
+        session = self.brain._cache.get(cache_key)
+        if session is None:
+            session = SelectionSession(float(flow), float(head), version)
+            logger.debug(f"[SELECTION SESSION] Opened {flow:.1f} m³/hr @ {head:.1f} m")
+        # Re-set on every use so an active session keeps its TTL; sessions are
+        # mutated in place, so they stay in this worker's L1 only
+        self.brain._cache.set(cache_key, session, ttl=self.session_ttl, shared=False)
+        return session
+
+    def peek_session(self, flow: float, head: float) -> Optional[SelectionSession]:
+        """
+        Get the session of a duty point only if one is still cached.
+
+        Args:
+            flow: Duty flow in m³/hr
+            head: Duty head in meters
+
+        Returns:
+            SelectionSession or None
+        """
+        if not self.enabled:
+            return None
+        cache_key = self.brain._cache.make_key('selection_session', self.brain.get_catalog_version(),
+                                               self.brain.load_control.current_level(), float(flow), float(head))
+        return self.brain._cache.get(cache_key)
+
+    def resolve_weights(self, constraints: Dict[str, Any]) -> Dict[str, float]:
+        """
+        Score-component multipliers for a ranking pass.
+
+        A named 'selection_profile' supplies defaults; explicit
+        'score_weights' override individual components.
+
+        Args:
+            constraints: Selection constraints
+
+        Returns:
+            Component -> multiplier (components not listed weigh 1.0)
+        """
+        profile = constraints.get('selection_profile')
+        if profile and profile not in self.profiles:
+            raise ValueError(f"Unknown selection profile '{profile}' (choose from {sorted(self.profiles)})")
+
+        weights = dict(self.profiles.get(profile, {})) if profile else {}
+        for component, weight in (constraints.get('score_weights') or {}).items():
+            weights[component] = float(weight)
+        return weights
+
+    def apply_ranking_constraints(self, evaluation: Dict[str, Any], constraints: Dict[str, Any],
+                                  weights: Dict[str, float]):
+        """
+        Apply constraint gates and score weights to one evaluation in place.
+
+        Args:
+            evaluation: Evaluation copy from a SelectionSession
+            constraints: Selection constraints (max_power_kw, npsh_available_m)
+            weights: Multipliers from resolve_weights
+        """
+        if constraints.get('max_power_kw'):
+            if evaluation.get('power_kw', 0) > constraints['max_power_kw']:
+                evaluation['feasible'] = False
+                evaluation['exclusion_reasons'].append('Power exceeds limit')
+
+        npsh_available = constraints.get('npsh_available_m')
+        npshr = evaluation.get('npshr_m')
+        if npsh_available is not None and npshr and npsh_available < npshr * self.npsh_safety_factor:
+            evaluation['feasible'] = False
+            evaluation['exclusion_reasons'].append('Insufficient NPSH margin')
+
+        if weights:
+            evaluation['total_score'] = sum(
+                score * weights.get(component, 1.0)
+                for component, score in evaluation.get('score_components', {}).items()
+            )
+            evaluation['score_weights'] = dict(weights)
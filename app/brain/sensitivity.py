@@ -0,0 +1,173 @@
+"""
+Sensitivity Module
+==================
+Robustness of a selection to uncertain duty data over a perturbed Q-H grid
+"""
+
+import logging
+from typing import Dict, Any, Optional
+import numpy as np
+from .config_manager import config
+
+logger = logging.getLogger(__name__)
+
+
+class SensitivityAnalyzer:
+    """Evaluates the top pumps of a selection on a flow/head perturbation grid in one batch"""
+
+    def __init__(self, brain):
+        """
+        Initialize with reference to main Brain.
+
+        Args:
+            brain: Parent PumpBrain instance
+        """
+        self.brain = brain
+        self.default_span = config.get('sensitivity_analysis', 'default_span_fraction')
+        self.default_step = config.get('sensitivity_analysis', 'default_step_fraction')
+        self.default_top_n = config.get('sensitivity_analysis', 'default_top_n_pumps')
+        self.max_top_n = config.get('sensitivity_analysis', 'maximum_top_n_pumps')
+        self.max_grid_points = config.get('sensitivity_analysis', 'maximum_grid_points')
+
+    def build_grid(self, span: float, step: float) -> np.ndarray:
+        """
+        Symmetric perturbation factors, e.g. span 0.2 / step 0.05 -> -0.2 ... +0.2.
+
+        Args:
+            span: Largest relative perturbation
+            step: Relative step
+
+        Returns:
+            (K,) factors including 0.0
+        """
+        if not (0 < step <= span < 1):
+            raise ValueError("Sensitivity grid needs 0 < step <= span < 1")
+        count = int(round(span / step))
+        factors = np.arange(-count, count + 1) * step
+        if len(factors) ** 2 > self.max_grid_points:
+            raise ValueError(f"Sensitivity grid of {len(factors)}x{len(factors)} points exceeds "
+                             f"{self.max_grid_points}")
+        return factors
+
+    @staticmethod
+    def rank_matrix(scores: np.ndarray) -> np.ndarray:
+        """
+        Rank of every pump at every grid point (0 = best).
+
+        Args:
+            scores: (N, M) total scores, -inf where infeasible
+
+        Returns:
+            (N, M) integer ranks; ties keep the selection order
+        """
+        order = np.argsort(-scores, axis=0, kind='stable')
+        ranks = np.empty_like(order)
+        np.put_along_axis(ranks, order, np.arange(scores.shape[0])[:, np.newaxis], axis=0)
+        return ranks
+
+    @staticmethod
+    def rank_correlation(ranks: np.ndarray, nominal: np.ndarray) -> np.ndarray:
+        """
+        Kendall tau between each grid point's ranking and the nominal ranking.
+
+        Args:
+            ranks: (N, M) ranks
+            nominal: (N,) ranks at the nominal duty
+
+        Returns:
+            (M,) tau values in [-1, 1] (1.0 when fewer than two pumps)
+        """
+        n = ranks.shape[0]
+        if n < 2:
+            return np.ones(ranks.shape[1])
+        i, j = np.triu_indices(n, k=1)
+        agreement = np.sign(ranks[i] - ranks[j]) * np.sign(nominal[i] - nominal[j])[:, np.newaxis]
+        return agreement.mean(axis=0)
+
+    def analyze(self, flow: float, head: float, constraints: Optional[Dict[str, Any]] = None,
+                top_n: Optional[int] = None, span: Optional[float] = None,
+                step: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Evaluate the top-N selected pumps over a perturbed duty grid.
+
+        Args:
+            flow: Nominal flow in m³/hr
+            head: Nominal head in meters
+            constraints: Selection constraints for choosing the pumps
+            top_n: Number of selected pumps to analyze
+            span: Largest relative perturbation (default from config)
+            step: Relative grid step (default from config)
+
+        Returns:
+            Dictionary with the grid axes, per-pump heatmaps (rows follow flow,
+            columns follow head) and 'ranking_stability'
+        """
+        top_n = min(int(top_n or self.default_top_n), self.max_top_n)
+        factors = self.build_grid(span or self.default_span, step or self.default_step)
+
+        selection = self.brain.find_best_pumps({'flow_m3hr': flow, 'head_m': head}, constraints)
+        pumps = []
+        selection_ranks = {}
+        for position, ranked in enumerate(selection.get('ranked_pumps', [])[:top_n], start=1):
+            pump = self.brain.get_pump(ranked.get('pump_code'))
+            if pump:
+                pumps.append(pump)
+                selection_ranks[pump.get('pump_code', '')] = position
+
+        flow_axis = flow * (1.0 + factors)
+        head_axis = head * (1.0 + factors)
+        grid_flows, grid_heads = np.meshgrid(flow_axis, head_axis, indexing='ij')
+
+        result = {
+            'flow_m3hr': flow,
+            'head_m': head,
+            'flow_factors': factors.tolist(),
+            'head_factors': factors.tolist(),
+            'flows_m3hr': flow_axis.tolist(),
+            'heads_m': head_axis.tolist(),
+            'pumps': [],
+            'ranking_stability': None,
+            'catalog_version': self.brain.get_catalog_version()
+        }
+        if not pumps:
+            return result
+
+        # One batched pass over every pump and grid point
+        batch = self.brain.batch_evaluator.evaluate(pumps, grid_flows.ravel(), grid_heads.ravel())
+        rows = batch['rows']
+        if not rows:
+            return result
+
+        shape = grid_flows.shape
+        nominal_index = int(np.ravel_multi_index((len(factors) // 2, len(factors) // 2), shape))
+        feasible = batch['feasible']
+        ranks = self.rank_matrix(batch['total_score'])
+        nominal_ranks = ranks[:, nominal_index]
+        tau = self.rank_correlation(ranks, nominal_ranks)
+        top_pump = np.argmin(ranks, axis=0)
+
+        for i, row in enumerate(rows):
+            efficiency = np.where(feasible[i], batch['efficiency_pct'][i], np.nan).reshape(shape)
+            result['pumps'].append({
+                'pump_code': row['pump_code'],
+                'selection_rank': selection_ranks.get(row['pump_code']),
+                'nominal_rank': int(nominal_ranks[i]) + 1,
+                'heatmaps': {
+                    'efficiency_pct': [[float(v) if np.isfinite(v) else None for v in line] for line in efficiency],
+                    'tier': batch['tier'][i].reshape(shape).astype(int).tolist(),
+                    'feasible': feasible[i].reshape(shape).tolist()
+                },
+                'feasible_fraction': float(feasible[i].mean()),
+                'rank_unchanged_fraction': float((ranks[i] == nominal_ranks[i]).mean())
+            })
+
+        result['ranking_stability'] = {
+            'grid_points': int(tau.size),
+            'top_choice_unchanged_fraction': float((top_pump == top_pump[nominal_index]).mean()),
+            'mean_rank_correlation': float(tau.mean()),
+            'min_rank_correlation': float(tau.min()),
+            'rank_correlation': tau.reshape(shape).tolist()
+        }
+        logger.info(f"[SENSITIVITY] {len(rows)} pumps x {tau.size} points, "
+                    f"top choice stable on {result['ranking_stability']['top_choice_unchanged_fraction']:.0%}")
+        return result
@@ -0,0 +1,177 @@
+"""
+Speed Trim Optimizer Module
+===========================
+Combined impeller trim + speed reduction search for FLEXIBLE pumps
+"""
+
+import logging
+from typing import Dict, Any, Optional, Tuple
+import numpy as np
+from .config_manager import config
+
+logger = logging.getLogger(__name__)
+
+
+class SpeedTrimOptimizer:
+    """Finds the lowest-power (trim ratio, speed ratio) pair for a duty point"""
+
+    def __init__(self, brain):
+        """
+        Initialize with reference to main Brain.
+
+        Args:
+            brain: Parent PumpBrain instance
+        """
+        self.brain = brain
+
+        self.mode = config.get('speed_trim_optimizer', 'combined_speed_trim_mode')
+        self.coarse_points = config.get('speed_trim_optimizer', 'coarse_grid_points')
+        self.refine_points = config.get('speed_trim_optimizer', 'refinement_grid_points')
+        self.refine_passes = config.get('speed_trim_optimizer', 'refinement_passes')
+        self.max_speed_ratio = config.get('speed_trim_optimizer', 'maximum_speed_ratio_for_combined_operation')
+        self.min_efficiency_gain = config.get('speed_trim_optimizer', 'minimum_efficiency_gain_to_select_pct')
+        self.water_density = config.get('speed_trim_optimizer', 'water_density_kg_m3')
+        self.gravity = config.get('speed_trim_optimizer', 'gravitational_acceleration_m_s2')
+        self.seconds_per_hour = config.get('speed_trim_optimizer', 'seconds_per_hour')
+
+        # Same limits the single-path evaluation respects
+        self.min_trim_percent = config.get('pump_evaluator', 'minimum_trim_percentage')
+        self.head_tolerance = config.get('physical_validator', 'head_tolerance_for_capability_validation_2')
+
+    def _get_bounds(self, pump_data: Dict[str, Any], row: Dict[str, Any]) -> Tuple[float, float, float, float, float]:
+        """
+        Trim and speed bounds for a pump.
+
+        Returns:
+            (min_trim_ratio, max_trim_ratio, min_speed_ratio, max_speed_ratio, test_speed_rpm)
+        """
+        specs = pump_data.get('specifications', {})
+        test_speed = specs.get('test_speed_rpm') or config.get('performance_vfd', 'default_4pole_motor_speed_rpm')
+
+        min_speed = (specs.get('min_speed_rpm') or 0) / test_speed or \
+            config.get('performance_vfd', 'default_minimum_vfd_speed_percentage')
+        max_speed = (specs.get('max_speed_rpm') or 0) / test_speed or \
+            config.get('performance_vfd', 'default_maximum_vfd_speed_percentage')
+
+        min_trim = self.min_trim_percent / 100.0
+        min_diameter = specs.get('min_impeller_diameter_mm') or 0
+        if min_diameter and row['reference_diameter_mm']:
+            min_trim = max(min_trim, min_diameter / row['reference_diameter_mm'])
+
+        return min_trim, 1.0, min_speed, min(max_speed, self.max_speed_ratio), test_speed
+
+    def _evaluate_grid(self, row: Dict[str, Any], flow: float, head: float,
+                       trims: np.ndarray, speeds: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Evaluate every (trim, speed) cell at the duty flow.
+
+        Operating curve: Q = Q1·d^x·s, H = H1·d^y·s², η = η1 - ε(1 - d)·100.
+        A cell is feasible when the equivalent reference flow lies on the
+        published curve (no extrapolation) and the delivered head meets the
+        requirement within the PhysicalValidator head tolerance.
+        Excess head is throttled, so power is taken at the delivered head.
+
+        Args:
+            row: Compiled pump row from BatchEvaluator
+            flow: Duty flow in m³/hr
+            head: Duty head in meters
+            trims: Trim ratio samples
+            speeds: Speed ratio samples
+
+        Returns:
+            Dictionary of (T, S) arrays
+        """
+        D, S = np.meshgrid(trims, speeds, indexing='ij')
+        flows, heads, effs, npsh = row['flows'], row['heads'], row['effs'], row['npsh']
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            reference_flow = flow / (D ** row['flow_exp'] * S)
+            inside = (reference_flow >= flows[0]) & (reference_flow <= flows[-1])
+
+            delivered = np.interp(reference_flow, flows, heads) * D ** row['head_exp'] * S ** 2
+            efficiency = np.interp(reference_flow, flows, effs) - row['penalty'] * (1.0 - D) * 100.0
+            npshr = np.interp(reference_flow, flows, npsh) * D ** row['npsh_exp'] * S ** 2
+
+            feasible = inside & (delivered >= head * (1 - self.head_tolerance)) & (efficiency > 0)
+            power = (self.water_density * self.gravity * flow * np.maximum(delivered, head)) / \
+                (self.seconds_per_hour * efficiency / 100.0 * 1000.0)
+            power = np.where(feasible, power, np.inf)
+
+        return {'trim': D, 'speed': S, 'head_m': delivered, 'efficiency_pct': efficiency,
+                'npshr_m': npshr, 'power_kw': power}
+
+    def optimize(self, pump_data: Dict[str, Any], flow: float, head: float) -> Optional[Dict[str, Any]]:
+        """
+        Search trim × speed for the lowest input power meeting the duty.
+
+        A coarse grid over the whole allowed rectangle is followed by
+        refinement grids centred on the best cell, each one grid step wide.
+
+        Args:
+            pump_data: Pump data from repository
+            flow: Duty flow in m³/hr
+            head: Duty head in meters
+
+        Returns:
+            Performance dictionary (calculate_at_point contract) or None if no
+            combination meets the duty
+        """
+        pump_code = pump_data.get('pump_code', '')
+        row = self.brain.batch_evaluator.compile_pump(pump_data)
+        if row is None or not np.isfinite(row['effs']).all():
+            return None
+
+        min_trim, max_trim, min_speed, max_speed, test_speed = self._get_bounds(pump_data, row)
+        if min_speed > max_speed or min_trim > max_trim:
+            return None
+
+        trims = np.linspace(min_trim, max_trim, self.coarse_points)
+        speeds = np.linspace(min_speed, max_speed, self.coarse_points)
+        best = None
+        cells = 0
+
+        for _ in range(self.refine_passes + 1):
+            grid = self._evaluate_grid(row, flow, head, trims, speeds)
+            cells += grid['power_kw'].size
+            index = np.unravel_index(np.argmin(grid['power_kw']), grid['power_kw'].shape)
+            if np.isfinite(grid['power_kw'][index]) and \
+                    (best is None or grid['power_kw'][index] < best['power_kw']):
+                best = {key: float(values[index]) for key, values in grid.items()}
+            if best is None:
+                break
+
+            trim_step = trims[1] - trims[0] if len(trims) > 1 else 0.0
+            speed_step = speeds[1] - speeds[0] if len(speeds) > 1 else 0.0
+            trims = np.linspace(max(min_trim, best['trim'] - trim_step),
+                                min(max_trim, best['trim'] + trim_step), self.refine_points)
+            speeds = np.linspace(max(min_speed, best['speed'] - speed_step),
+                                 min(max_speed, best['speed'] + speed_step), self.refine_points)
+
+        if best is None:
+            logger.debug(f"[SPEED TRIM] {pump_code}: No feasible trim/speed combination")
+            return None
+
+        reference_diameter = row['reference_diameter_mm']
+        delivered = best['head_m']
+        logger.debug(f"[SPEED TRIM] {pump_code}: trim {best['trim'] * 100:.1f}% @ speed {best['speed'] * 100:.1f}% "
+                     f"-> {best['efficiency_pct']:.1f}% ({cells} cells)")
+
+        return {
+            'meets_requirements': True,
+            'flow_m3hr': flow,
+            'head_m': delivered,
+            'head_margin_m': delivered - head,
+            'efficiency_pct': best['efficiency_pct'],
+            'power_kw': best['power_kw'],
+            'npshr_m': best['npshr_m'] if np.isfinite(best['npshr_m']) else None,
+            'impeller_diameter_mm': reference_diameter * best['trim'],
+            'base_diameter_mm': reference_diameter,
+            'trim_percent': best['trim'] * 100.0,
+            'speed_ratio': best['speed'] * 100.0,
+            'required_speed_rpm': round(test_speed * best['speed']),
+            'reference_speed_rpm': test_speed,
+            'operating_frequency_hz': round(
+                config.get('performance_vfd', 'base_frequency_for_vfd_calculations_hz') * best['speed'], 1),
+            'sizing_method': 'Speed + Trim',
+            'grid_cells_evaluated': cells
+        }
@@ -0,0 +1,289 @@
+"""
+Stocked Diameters Module
+========================
+Discrete impeller diameter selection from stocked and standard machined sizes
+"""
+
+import logging
+from typing import Dict, List, Any, Optional, Tuple
+import numpy as np
+from .batch_evaluator import batched_interp
+from .hydraulic_profile import HydraulicProfiler
+from .config_manager import config
+
+logger = logging.getLogger(__name__)
+
+# Diameter sources, in order of authority
+SOURCE_TESTED_CURVE = 'tested_curve'
+SOURCE_PUMP_DIAMETERS = 'pump_diameters'
+SOURCE_STANDARD_INCREMENT = 'standard_increment'
+
+DIAMETER_MODE_CONTINUOUS = 'continuous'
+DIAMETER_MODE_STOCKED = 'stocked'
+
+# Candidate tables keyed by (pump_code, catalog_version)
+_diameter_tables: Dict[Tuple[str, str], 'DiameterTable'] = {}
+
+
+class DiameterTable:
+    """Candidate diameters of one pump with their H-Q / efficiency / NPSH curves"""
+
+    def __init__(self, diameters: np.ndarray, sources: List[str], flows: np.ndarray,
+                 heads: np.ndarray, effs: np.ndarray, npsh: np.ndarray, reference_diameter: float):
+        """
+        Args:
+            diameters: (D,) ascending diameters in mm
+            sources: Source of each diameter
+            flows: (D, K) NaN-padded flows per diameter
+            heads: (D, K) heads per diameter
+            effs: (D, K) efficiencies per diameter
+            npsh: (D, K) NPSHr per diameter
+            reference_diameter: Largest impeller diameter in mm
+        """
+        self.diameters = diameters
+        self.sources = sources
+        self.flows = flows
+        self.heads = heads
+        self.effs = effs
+        self.npsh = npsh
+        self.reference_diameter = reference_diameter
+
+    def at_flow(self, flow: float) -> Dict[str, np.ndarray]:
+        """Head, efficiency and NPSHr of every candidate diameter at one flow."""
+        query = np.full((len(self.diameters), 1), float(flow))
+        return {
+            'head_m': batched_interp(self.flows, self.heads, query)[:, 0],
+            'efficiency_pct': batched_interp(self.flows, self.effs, query)[:, 0],
+            'npshr_m': batched_interp(self.flows, self.npsh, query)[:, 0]
+        }
+
+
+class StockedDiameterSelector:
+    """Builds candidate diameter tables at load and snaps trims to them"""
+
+    @staticmethod
+    def get_mode() -> str:
+        """
+        Get configured diameter selection mode.
+
+        Returns:
+            'continuous' (affinity-law diameter) or 'stocked'
+        """
+        return config.get('stocked_diameters', 'diameter_selection_mode')
+
+    @staticmethod
+    def _curve_arrays(curve: Dict[str, Any]) -> Optional[Dict[str, np.ndarray]]:
+        """Sorted flow/head/efficiency/NPSHr arrays of a curve (None if unusable)."""
+        points = sorted(
+            (p for p in curve.get('performance_points', [])
+             if p.get('flow_m3hr') is not None and p.get('head_m') is not None),
+            key=lambda p: p['flow_m3hr']
+        )
+        if len(points) < 2:
+            return None
+        return {
+            'flows': np.array([p['flow_m3hr'] for p in points], dtype=float),
+            'heads': np.array([p['head_m'] for p in points], dtype=float),
+            'effs': np.array([np.nan if p.get('efficiency_pct') is None else p['efficiency_pct']
+                              for p in points], dtype=float),
+            'npsh': np.array([np.nan if p.get('npshr_m') is None else p['npshr_m']
+                              for p in points], dtype=float)
+        }
+
+    @staticmethod
+    def _candidate_diameters(pump: Dict[str, Any], reference_diameter: float) -> List[Tuple[float, str]]:
+        """Stocked diameters from pump_diameters, or standard machined steps when none are listed."""
+        stocked = sorted({float(d) for d in pump.get('available_diameters', []) if d and d <= reference_diameter})
+        if stocked:
+            return [(d, SOURCE_PUMP_DIAMETERS) for d in stocked]
+
+        increment = config.get('stocked_diameters', 'standard_machining_increment_mm')
+        min_trim = config.get('stocked_diameters', 'minimum_trim_percentage_for_standard_diameters')
+        smallest = reference_diameter * min_trim / 100.0
+        steps = np.arange(np.ceil(smallest / increment) * increment, reference_diameter, increment)
+        return [(float(d), SOURCE_STANDARD_INCREMENT) for d in steps] + \
+            [(reference_diameter, SOURCE_STANDARD_INCREMENT)]
+
+    @staticmethod
+    def build_table(pump: Dict[str, Any]) -> Optional[DiameterTable]:
+        """
+        Build the candidate diameter table for one pump.
+
+        Diameters that match a tested curve use its measured points; all
+        others are affinity-scaled from the largest impeller
+        (Q' = Q·d^x, H' = H·d^y, η' = η - ε(1 - d)·100, NPSH' = NPSH·d^α).
+
+        Args:
+            pump: Pump model from the loader
+
+        Returns:
+            DiameterTable or None if the pump has no usable curve
+        """
+        tested = {}
+        for curve in pump.get('curves', []):
+            diameter = curve.get('impeller_diameter_mm', 0)
+            arrays = StockedDiameterSelector._curve_arrays(curve) if diameter > 0 else None
+            if arrays:
+                tested[float(diameter)] = arrays
+        if not tested:
+            return None
+
+        reference_diameter = max(tested)
+        reference = tested[reference_diameter]
+        exponents = HydraulicProfiler.get_profile(pump)['physics_exponents']
+        pump_type = (pump.get('pump_type') or '').lower()
+        if 'diffuser' in pump_type or 'turbine' in pump_type:
+            penalty = config.get('performance_industry_standard', 'efficiency_penalty_diffuser_default_factor')
+        else:
+            penalty = config.get('performance_industry_standard', 'efficiency_penalty_volute_default_factor')
+        match_tolerance = config.get('stocked_diameters', 'diameter_match_tolerance_mm')
+
+        diameters, sources, curves = [], [], []
+        for diameter, source in StockedDiameterSelector._candidate_diameters(pump, reference_diameter):
+            match = min(tested, key=lambda d: abs(d - diameter))
+            if abs(match - diameter) <= match_tolerance:
+                arrays = tested[match]
+                source = SOURCE_TESTED_CURVE
+            else:
+                ratio = diameter / reference_diameter
+                arrays = {
+                    'flows': reference['flows'] * ratio ** exponents['flow_exponent_x'],
+                    'heads': reference['heads'] * ratio ** exponents['head_exponent_y'],
+                    'effs': reference['effs'] - penalty * (1.0 - ratio) * 100.0,
+                    'npsh': reference['npsh'] * ratio ** exponents['npshr_exponent_alpha']
+                }
+            diameters.append(diameter)
+            sources.append(source)
+            curves.append(arrays)
+
+        width = max(len(c['flows']) for c in curves)
+
+        def pad(field):
+            matrix = np.full((len(curves), width), np.nan)
+            for i, c in enumerate(curves):
+                matrix[i, :len(c[field])] = c[field]
+            return matrix
+
+        return DiameterTable(np.array(diameters), sources, pad('flows'), pad('heads'),
+                             pad('effs'), pad('npsh'), reference_diameter)
+
+    @staticmethod
+    def precompute_catalog(pump_models: List[Dict[str, Any]], catalog_version: str) -> Dict[str, Any]:
+        """
+        Build candidate diameter tables for the whole catalog.
+
+        Tables are kept in a module cache; each pump gets a JSON-safe
+        'stocked_diameters' list for display.
+
+        Args:
+            pump_models: Loaded pump models
+            catalog_version: Catalog build stamp
+
+        Returns:
+            Summary statistics for catalog metadata
+        """
+        _diameter_tables.clear()
+        counts = {SOURCE_TESTED_CURVE: 0, SOURCE_PUMP_DIAMETERS: 0, SOURCE_STANDARD_INCREMENT: 0}
+        pumps_with_tables = 0
+
+        for pump in pump_models:
+            try:
+                table = StockedDiameterSelector.build_table(pump)
+            except Exception as e:
+                logger.warning(f"[STOCKED DIAMETERS] {pump.get('pump_code')}: table build failed - {e}")
+                table = None
+
+            if table is None:
+                pump['stocked_diameters'] = []
+                continue
+
+            _diameter_tables[(pump.get('pump_code', ''), catalog_version)] = table
+            pump['stocked_diameters'] = [
+                {'diameter_mm': float(d), 'source': s} for d, s in zip(table.diameters, table.sources)
+            ]
+            pumps_with_tables += 1
+            for source in table.sources:
+                counts[source] += 1
+
+        summary = {
+            'pumps_with_tables': pumps_with_tables,
+            'diameters_by_source': counts,
+            'mode': StockedDiameterSelector.get_mode()
+        }
+        logger.info(f"[STOCKED DIAMETERS] {pumps_with_tables} pumps, {sum(counts.values())} candidate diameters")
+        return summary
+
+    @staticmethod
+    def get_table(pump_data: Dict[str, Any], catalog_version: str) -> Optional[DiameterTable]:
+        """
+        Get the candidate table for a pump, building it on demand if the
+        catalog was loaded without precomputation.
+
+        Args:
+            pump_data: Pump data from repository
+            catalog_version: Current catalog build stamp
+
+        Returns:
+            DiameterTable or None
+        """
+        key = (pump_data.get('pump_code', ''), catalog_version)
+        table = _diameter_tables.get(key)
+        if table is None:
+            table = StockedDiameterSelector.build_table(pump_data)
+            if table is not None:
+                _diameter_tables[key] = table
+        return table
+
+    @staticmethod
+    def snap(pump_data: Dict[str, Any], flow: float, head: float,
+             catalog_version: str) -> Optional[Dict[str, Any]]:
+        """
+        Pick the smallest candidate diameter that meets the head with margin.
+
+        Args:
+            pump_data: Pump data from repository
+            flow: Operating flow in m³/hr
+            head: Required head in meters
+            catalog_version: Current catalog build stamp
+
+        Returns:
+            Performance at the chosen diameter (with over-delivery), or None
+            if no candidate diameter meets the duty
+        """
+        table = StockedDiameterSelector.get_table(pump_data, catalog_version)
+        if table is None:
+            return None
+
+        margin = config.get('stocked_diameters', 'minimum_head_margin_percentage') / 100.0
+        at_flow = table.at_flow(flow)
+        delivered = at_flow['head_m']
+        with np.errstate(invalid='ignore'):
+            meets = np.isfinite(delivered) & (delivered >= head * (1 + margin)) & \
+                np.isfinite(at_flow['efficiency_pct']) & (at_flow['efficiency_pct'] > 0)
+        if not meets.any():
+            return None
+
+        # Diameters are ascending, so the first match is the smallest
+        i = int(np.argmax(meets))
+        diameter = float(table.diameters[i])
+        efficiency = float(at_flow['efficiency_pct'][i])
+        delivered_head = float(delivered[i])
+        npshr = float(at_flow['npshr_m'][i])
+
+        # Fixed diameter is throttled back to the duty: power at the delivered head
+        power = (config.get('stocked_diameters', 'water_density_kg_m3') *
+                 config.get('stocked_diameters', 'gravitational_acceleration_m_s2') * flow * delivered_head) / \
+            (config.get('stocked_diameters', 'seconds_per_hour') * efficiency / 100.0 * 1000.0)
+
+        return {
+            'impeller_diameter_mm': diameter,
+            'base_diameter_mm': table.reference_diameter,
+            'diameter_source': table.sources[i],
+            'head_m': delivered_head,
+            'head_margin_m': delivered_head - head,
+            'over_delivery_m': delivered_head - head,
+            'over_delivery_pct': (delivered_head - head) / head * 100.0,
+            'efficiency_pct': efficiency,
+            'power_kw': power,
+            'npshr_m': npshr if np.isfinite(npshr) else None
+        }
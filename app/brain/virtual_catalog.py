@@ -0,0 +1,302 @@
+"""
+Virtual Catalog Module
+======================
+Lazily derived speed and stage-count variants of catalog pumps
+"""
+
+import re
+import logging
+from typing import Dict, List, Any, Optional, Tuple
+from .hydraulic_profile import HydraulicProfiler
+from .curve_fits import CurveFitter
+from .config_manager import config
+
+logger = logging.getLogger(__name__)
+
+# Variant codes: "<base code> @ <rpm>rpm" with optional " x<n>st" stage multiplier
+VARIANT_CODE_PATTERN = re.compile(r'^(?P<base>.+) @ (?P<rpm>\d+)rpm(?: x(?P<stages>\d+)st)?$')
+
+
+def make_variant_code(base_code: str, speed_rpm: int, stage_multiplier: int = 1) -> str:
+    """Build the pump code of a virtual variant."""
+    code = f"{base_code} @ {int(speed_rpm)}rpm"
+    if stage_multiplier > 1:
+        code += f" x{int(stage_multiplier)}st"
+    return code
+
+
+def parse_variant_code(pump_code: str) -> Optional[Tuple[str, int, int]]:
+    """
+    Split a virtual variant code.
+
+    Returns:
+        (base_code, speed_rpm, stage_multiplier) or None for catalog codes
+    """
+    match = VARIANT_CODE_PATTERN.match(str(pump_code or '').strip())
+    if not match:
+        return None
+    return match.group('base'), int(match.group('rpm')), int(match.group('stages') or 1)
+
+
+class VirtualCatalog:
+    """Derives speed/stage variants of base pumps on demand, pruned by envelope"""
+
+    def __init__(self, brain):
+        """
+        Initialize with reference to main Brain.
+
+        Args:
+            brain: Parent PumpBrain instance
+        """
+        self.brain = brain
+
+        self.include_by_default = config.get('virtual_catalog', 'include_virtual_variants_by_default')
+        self.motor_speeds = config.get('virtual_catalog', 'standard_motor_speeds_rpm')
+        self.speed_tolerance = config.get('virtual_catalog', 'speed_match_tolerance_rpm')
+        self.allow_unrated_speed_up = config.get('virtual_catalog', 'allow_speed_increase_without_rated_maximum')
+        self.stage_multipliers = config.get('virtual_catalog', 'stage_count_multipliers')
+        self.flow_min_fraction = config.get('virtual_catalog', 'envelope_flow_minimum_fraction')
+        self.head_min_trim_ratio = config.get('virtual_catalog', 'envelope_head_minimum_trim_ratio')
+        self.max_variants = config.get('virtual_catalog', 'maximum_variants_per_request')
+        self.cache_ttl = config.get('virtual_catalog', 'variant_cache_ttl_seconds')
+        self.npsh_speed_exp = config.get('performance_vfd', 'speed_ratio_exponent_for_npsh_scaling')
+
+        # Base-pump envelopes, rebuilt when the catalog version changes
+        self._envelopes: Dict[str, Optional[Dict[str, float]]] = {}
+        self._envelope_version = None
+
+    def _get_envelope(self, pump: Dict[str, Any]) -> Optional[Dict[str, float]]:
+        """
+        Flow/head bounds of a base pump at its test speed (cached per catalog version).
+
+        Returns:
+            Dictionary with min/max flow and head, or None if the pump has no curves
+        """
+        version = self.brain.get_catalog_version()
+        if version != self._envelope_version:
+            self._envelopes = {}
+            self._envelope_version = version
+
+        pump_code = pump.get('pump_code', '')
+        if pump_code in self._envelopes:
+            return self._envelopes[pump_code]
+
+        flows, heads, smallest = [], [], None
+        for curve in pump.get('curves', []):
+            points = [p for p in curve.get('performance_points', []) if p.get('flow_m3hr') and p.get('head_m')]
+            if not points:
+                continue
+            flows.extend(p['flow_m3hr'] for p in points)
+            heads.extend(p['head_m'] for p in points)
+            if smallest is None or curve.get('impeller_diameter_mm', 0) < smallest[0]:
+                smallest = (curve.get('impeller_diameter_mm', 0), points)
+
+        envelope = None
+        if flows:
+            head_exp = HydraulicProfiler.get_profile(pump)['physics_exponents']['head_exponent_y']
+            envelope = {
+                'min_flow_m3hr': min(flows) * self.flow_min_fraction,
+                'max_flow_m3hr': max(flows),
+                'max_head_m': max(heads),
+                'min_head_m': min(p['head_m'] for p in smallest[1]) * self.head_min_trim_ratio ** head_exp
+            }
+        self._envelopes[pump_code] = envelope
+        return envelope
+
+    def _allowed_speeds(self, pump: Dict[str, Any]) -> List[int]:
+        """Standard motor speeds this pump may run at, other than its test speed."""
+        specs = pump.get('specifications', {})
+        test_speed = specs.get('test_speed_rpm') or 0
+        if test_speed <= 0:
+            return []
+
+        max_speed = specs.get('max_speed_rpm') or 0
+        speeds = []
+        for speed in self.motor_speeds:
+            if abs(speed - test_speed) <= self.speed_tolerance:
+                continue
+            if speed > test_speed:
+                if max_speed > 0 and speed > max_speed:
+                    continue
+                if max_speed <= 0 and not self.allow_unrated_speed_up:
+                    continue
+            speeds.append(int(speed))
+        return speeds
+
+    def _allowed_stage_multipliers(self, pump: Dict[str, Any]) -> List[int]:
+        """Stage multipliers for multistage pump types (always includes 1)."""
+        if HydraulicProfiler.get_profile(pump)['normalized_type'] != 'MULTI_STAGE':
+            return [1]
+        return [1] + [int(m) for m in self.stage_multipliers if int(m) > 1]
+
+    def _reaches(self, envelope: Dict[str, float], speed_ratio: float, stage_multiplier: int,
+                 flow: float, head: float) -> bool:
+        """Whether a variant's scaled envelope can contain the duty point."""
+        head_scale = speed_ratio ** 2 * stage_multiplier
+        return (envelope['min_flow_m3hr'] * speed_ratio <= flow <= envelope['max_flow_m3hr'] * speed_ratio and
+                envelope['min_head_m'] * head_scale <= head <= envelope['max_head_m'] * head_scale)
+
+    def materialize(self, base: Dict[str, Any], speed_rpm: int, stage_multiplier: int = 1) -> Dict[str, Any]:
+        """
+        Build one variant from its base pump.
+
+        Speed variants follow the speed affinity laws (Q ∝ n, H ∝ n²,
+        NPSHr ∝ n^performance_vfd exponent) at unchanged efficiency. Stage
+        variants multiply head by the stage multiplier; flow, efficiency and
+        first-stage NPSHr are unchanged. Trimming of the variant later uses the
+        base pump type's physics exponents as usual.
+
+        Args:
+            base: Catalog pump data
+            speed_rpm: Variant speed in rpm
+            stage_multiplier: Multiple of the catalogued stage count
+
+        Returns:
+            Pump data dictionary with a 'virtual_variant' provenance block
+        """
+        specs = base.get('specifications', {})
+        base_speed = specs.get('test_speed_rpm') or speed_rpm
+        code = make_variant_code(base.get('pump_code', ''), speed_rpm, stage_multiplier)
+
+        cache_key = self.brain._cache.make_key('virtual_variant', code, self.brain.get_catalog_version())
+        cached = self.brain._cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        s = speed_rpm / base_speed
+        head_scale = s ** 2 * stage_multiplier
+        npsh_scale = s ** self.npsh_speed_exp
+
+        curves = []
+        for curve in base.get('curves', []):
+            points = [
+                {
+                    **point,
+                    'flow_m3hr': point['flow_m3hr'] * s,
+                    'head_m': point['head_m'] * head_scale,
+                    'npshr_m': point['npshr_m'] * npsh_scale if point.get('npshr_m') is not None else None
+                }
+                for point in curve.get('performance_points', [])
+            ]
+            variant_curve = {
+                **curve,
+                'curve_id': f"{curve.get('curve_id', '')}@{speed_rpm}" +
+                            (f"x{stage_multiplier}" if stage_multiplier > 1 else ''),
+                'test_speed_rpm': speed_rpm,
+                'performance_points': points
+            }
+            # The base fit describes the unscaled curve; refit the scaled points
+            if curve.get('analytic_fit'):
+                variant_curve['analytic_fit'] = CurveFitter.fit_curve(variant_curve, self.brain.get_catalog_version())
+            curves.append(variant_curve)
+
+        def scaled(value, factor):
+            return value * factor if value is not None else None
+
+        variant_specs = {
+            **specs,
+            'test_speed_rpm': speed_rpm,
+            'max_flow_m3hr': scaled(specs.get('max_flow_m3hr'), s),
+            'max_head_m': scaled(specs.get('max_head_m'), head_scale),
+            'bep_flow_m3hr': scaled(specs.get('bep_flow_m3hr'), s),
+            'bep_head_m': scaled(specs.get('bep_head_m'), head_scale),
+            'npshr_at_bep': scaled(specs.get('npshr_at_bep'), npsh_scale)
+        }
+
+        variant = {
+            **base,
+            'pump_code': code,
+            'description': f"{code} (derived from {base.get('pump_code', '')})",
+            'specifications': variant_specs,
+            'curves': curves,
+            'max_flow_m3hr': scaled(base.get('max_flow_m3hr'), s),
+            'max_head_m': scaled(base.get('max_head_m'), head_scale),
+            'is_virtual': True,
+            'virtual_variant': {
+                'base_pump_code': base.get('pump_code', ''),
+                'base_speed_rpm': base_speed,
+                'speed_rpm': speed_rpm,
+                'speed_ratio': s,
+                'stage_multiplier': stage_multiplier,
+                'speed_derived': speed_rpm != base_speed,
+                'stage_derived': stage_multiplier > 1,
+                'catalog_version': self.brain.get_catalog_version()
+            }
+        }
+        # Load-time derived data belongs to the base pump only
+        for key in ('stocked_diameters', 'hydraulic_profile', 'operating_envelope'):
+            variant.pop(key, None)
+
+        self.brain._cache.set(cache_key, variant, ttl=self.cache_ttl)
+        return variant
+
+    def get_variants(self, flow: float, head: float,
+                     constraints: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Materialize only the variants whose envelope can reach the duty point.
+
+        Args:
+            flow: Required flow in m³/hr
+            head: Required head in meters
+            constraints: Optional constraints (pump_type)
+
+        Returns:
+            List of variant pump data dictionaries
+        """
+        constraints = constraints or {}
+        type_constraint = (constraints.get('pump_type') or 'GENERAL').upper()
+
+        variants = []
+        considered = 0
+        for base in self.brain.repository.get_pump_models():
+            if type_constraint != 'GENERAL' and (base.get('pump_type') or '').upper() != type_constraint:
+                continue
+
+            envelope = self._get_envelope(base)
+            if envelope is None:
+                continue
+            base_speed = base.get('specifications', {}).get('test_speed_rpm') or 0
+            if base_speed <= 0:
+                continue
+
+            speeds = [int(base_speed)] + self._allowed_speeds(base)
+            for speed in speeds:
+                for multiplier in self._allowed_stage_multipliers(base):
+                    if speed == base_speed and multiplier == 1:
+                        continue
+                    considered += 1
+                    if not self._reaches(envelope, speed / base_speed, multiplier, flow, head):
+                        continue
+                    if len(variants) >= self.max_variants:
+                        logger.warning(f"[VIRTUAL CATALOG] Variant limit {self.max_variants} reached")
+                        return variants
+                    variants.append(self.materialize(base, speed, multiplier))
+
+        logger.info(f"[VIRTUAL CATALOG] {len(variants)} of {considered} variants reach "
+                    f"{flow:.1f} m³/hr @ {head:.1f} m")
+        return variants
+
+    def resolve(self, pump_code: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a variant by its code, materializing it from the base pump.
+
+        Args:
+            pump_code: Variant code (see make_variant_code)
+
+        Returns:
+            Variant pump data, or None if the code is not a valid variant
+        """
+        parsed = parse_variant_code(pump_code)
+        if not parsed:
+            return None
+        base_code, speed, multiplier = parsed
+
+        base = self.brain.repository.get_pump_by_code(base_code)
+        if not base:
+            return None
+        base_speed = base.get('specifications', {}).get('test_speed_rpm') or 0
+        if speed != base_speed and speed not in self._allowed_speeds(base):
+            return None
+        if multiplier not in self._allowed_stage_multipliers(base):
+            return None
+        return self.materialize(base, speed, multiplier)
@@ -0,0 +1,195 @@
+"""
+Warm Start Module
+=================
+Exact re-selection for nudged duty points by seeded branch-and-bound ranking
+"""
+
+import heapq
+import logging
+from typing import Dict, List, Any, Optional
+from .curve_fits import CurveFitter
+from .operating_envelope import OperatingEnvelope, ENVELOPE_OUTSIDE
+from .config_manager import config
+
+logger = logging.getLogger(__name__)
+
+# Score keys whose maximum bounds the BEP proximity component
+_BEP_SCORE_KEYS = (
+    'bep_proximity_sweet_spot_score', 'bep_proximity_good_range_score',
+    'bep_proximity_acceptable_range_score', 'bep_proximity_marginal_range_score',
+    'bep_proximity_poor_range_score'
+)
+
+# Efficiency thresholds where the efficiency score changes branch
+_EFFICIENCY_THRESHOLD_KEYS = (
+    'excellent_efficiency_scoring_threshold_percentage', 'good_efficiency_scoring_threshold_percentage',
+    'fair_efficiency_scoring_threshold_percentage', 'poor_efficiency_scoring_threshold_percentage'
+)
+
+
+class WarmStartPlan:
+    """
+    Running top-k threshold for one ranked-only selection.
+
+    A pump is skipped only when its score upper bound is below the k-th best
+    score already found, so it could never enter the returned top k and the
+    ranking is identical to a full evaluation.
+    """
+
+    def __init__(self, selector: 'WarmStartSelector', seed_codes: List[str], max_results: int):
+        """
+        Args:
+            selector: Owning WarmStartSelector (supplies the bounds)
+            seed_codes: Ranked pump codes of the previous duty point
+            max_results: Number of pumps the ranking returns
+        """
+        self.selector = selector
+        self.seed_codes = list(seed_codes)
+        self.max_results = max_results
+        self._top_scores: List[float] = []
+        self.stats = {'seeded': 0, 'evaluated': 0, 'skipped': 0}
+
+    @property
+    def threshold(self) -> float:
+        """Score a skipped pump must fall below (-inf until k pumps are feasible)."""
+        if len(self._top_scores) < self.max_results:
+            return float('-inf')
+        return self._top_scores[0]
+
+    def offer(self, evaluation: Dict[str, Any]):
+        """Record an evaluated pump's final (ranking-time) score."""
+        self.stats['evaluated'] += 1
+        if not evaluation.get('feasible', False):
+            return
+        score = evaluation.get('total_score', 0)
+        if len(self._top_scores) < self.max_results:
+            heapq.heappush(self._top_scores, score)
+        elif score > self._top_scores[0]:
+            heapq.heapreplace(self._top_scores, score)
+
+    def can_skip(self, pump_data: Dict[str, Any], flow: float, head: float) -> bool:
+        """Whether a pump provably cannot reach the current top k."""
+        if self.selector.score_upper_bound(pump_data, flow, head) < self.threshold:
+            self.stats['skipped'] += 1
+            return True
+        return False
+
+
+class WarmStartSelector:
+    """Plans warm-started rankings from the previous duty point's selection session"""
+
+    def __init__(self, brain):
+        """
+        Initialize with reference to main Brain.
+
+        Args:
+            brain: Parent PumpBrain instance
+        """
+        self.brain = brain
+        self.enabled = config.get('warm_start', 'warm_start_enabled')
+        self.max_relative_change = config.get('warm_start', 'maximum_relative_duty_change')
+        self.head_tolerance = config.get('physical_validator', 'head_tolerance_for_capability_validation_2')
+
+        self.bep_score_max = max(config.get('pump_evaluator', key) for key in _BEP_SCORE_KEYS)
+        self.head_margin_score_max = config.get('pump_evaluator', 'perfect_head_margin_score')
+        self.physical_penalty = config.get('pump_evaluator', 'physical_limitation_penalty')
+        self.efficiency_floor = config.get('performance_industry_standard',
+                                           'qbp_efficiency_penalty_lower_bound_percentage')
+
+    def plan(self, flow: float, head: float, constraints: Dict[str, Any],
+             include_exclusions: bool, score_weights: Dict[str, float],
+             max_results: int) -> Optional[WarmStartPlan]:
+        """
+        Build a warm-start plan when the request allows an exact one.
+
+        Exclusion details need every pump's evaluation, re-weighted scores
+        have no component bounds, and analytic curve models may exceed the
+        tested efficiencies, so those requests run cold.
+
+        Args:
+            flow: New duty flow in m³/hr
+            head: New duty head in meters
+            constraints: Selection constraints carrying 'warm_start_from'
+            include_exclusions: Whether exclusion details were requested
+            score_weights: Ranking-time weights in effect
+            max_results: Number of pumps the ranking returns
+
+        Returns:
+            WarmStartPlan, or None to run cold
+        """
+        previous = constraints.get('warm_start_from')
+        if not (self.enabled and previous) or include_exclusions or score_weights:
+            return None
+        if CurveFitter.is_analytic_mode():
+            return None
+
+        previous_flow = float(previous.get('flow_m3hr') or 0)
+        previous_head = float(previous.get('head_m') or 0)
+        if previous_flow <= 0 or previous_head <= 0:
+            return None
+        if abs(flow - previous_flow) > previous_flow * self.max_relative_change or \
+                abs(head - previous_head) > previous_head * self.max_relative_change:
+            logger.debug(f"[WARM START] Duty change {previous_flow:.1f} m³/hr @ {previous_head:.1f}m -> "
+                         f"{flow:.1f} m³/hr @ {head:.1f}m too large, running cold")
+            return None
+
+        session = self.brain.selection_sessions.peek_session(previous_flow, previous_head)
+        if session is None or not session.last_ranked_codes:
+            return None
+        return WarmStartPlan(self, session.last_ranked_codes, max_results)
+
+    def efficiency_upper_bound(self, pump_data: Dict[str, Any]) -> float:
+        """
+        Highest efficiency any performance path can report for a pump.
+
+        Trimming and BEP-migration only lower efficiency from the tested
+        points or the catalogue BEP value; the migration penalty is floored.
+        Speed paths may extrapolate or fall back to a default, so variable
+        speed pumps are unbounded.
+        """
+        specs = pump_data.get('specifications', {})
+        if specs.get('variable_speed', False):
+            return float('inf')
+        candidates = [specs.get('bep_efficiency') or 0, specs.get('bep_efficiency_pct') or 0, self.efficiency_floor]
+        for curve in pump_data.get('curves', []):
+            for point in curve.get('performance_points', []):
+                candidates.append(point.get('efficiency_pct') or 0)
+        return max(candidates)
+
+    def score_upper_bound(self, pump_data: Dict[str, Any], flow: float, head: float) -> float:
+        """
+        Upper bound on a pump's PumpEvaluator total score at a duty point.
+
+        BEP proximity and head margin use their maximum points, efficiency
+        the best score up to the pump's efficiency ceiling, penalties zero;
+        a duty point outside the envelope polygon carries the physical
+        limitation penalty exactly, as the validator agrees with 'outside'.
+
+        Args:
+            pump_data: Pump data
+            flow: Duty flow in m³/hr
+            head: Duty head in meters
+
+        Returns:
+            Score bound in points
+        """
+        evaluator = self.brain.selection.pump_evaluator
+        ceiling = self.efficiency_upper_bound(pump_data)
+
+        # The efficiency score is piecewise; take the best value left of each branch change
+        if ceiling == float('inf'):
+            efficiency_points = config.get('pump_evaluator', 'maximum_efficiency_score')
+        else:
+            efficiency_points = evaluator.score_efficiency(ceiling)
+            for key in _EFFICIENCY_THRESHOLD_KEYS:
+                threshold = config.get('pump_evaluator', key)
+                if threshold <= ceiling:
+                    efficiency_points = max(efficiency_points, evaluator.score_efficiency(threshold - 1e-9))
+
+        bound = self.bep_score_max + self.head_margin_score_max + efficiency_points
+        envelope = OperatingEnvelope.get_envelope(pump_data)
+        if envelope:
+            classification, _ = OperatingEnvelope.classify(envelope, flow, head, self.head_tolerance)
+            if classification == ENVELOPE_OUTSIDE:
+                bound += self.physical_penalty
+        return bound
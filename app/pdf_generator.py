@@ -849,7 +849,11 @@ def _format_lifecycle_cost_analysis(evaluation: Dict[str, Any]) -> Dict[str, Any
             
             # Basic cost estimation
             estimated_pump_cost = 85000 + (power_kw * 1700)  # R85k base + R1700/kW
-            annual_energy_cost = power_kw * 8760 * 2.485  # 24/7 operation at R2.49/kWh
+            energy_simulation = evaluation.get('energy_simulation')
+            if energy_simulation:
+                annual_energy_cost = energy_simulation['annual_energy_cost']  # Simulated 8760 h VFD operation
+            else:
+                annual_energy_cost = power_kw * 8760 * 2.485  # 24/7 operation at R2.49/kWh
             annual_maintenance = estimated_pump_cost * 0.04  # 4% of pump cost
             total_10_year = estimated_pump_cost + (annual_energy_cost * 10) + (annual_maintenance * 10)
             
@@ -891,8 +895,13 @@ def _format_environmental_impact(evaluation: Dict[str, Any]) -> Dict[str, Any]:
             power_kw = operating_point.get('achieved_power_kw', 0)
             
             # Basic environmental estimation
-            annual_kwh = power_kw * 8760  # 24/7 operation
-            annual_co2_kg = annual_kwh * 0.233  # UK grid average
+            energy_simulation = evaluation.get('energy_simulation')
+            if energy_simulation:
+                annual_kwh = energy_simulation['annual_energy_kwh']
+                annual_co2_kg = energy_simulation['annual_co2_kg']
+            else:
+                annual_kwh = power_kw * 8760  # 24/7 operation
+                annual_co2_kg = annual_kwh * 0.233  # UK grid average
             
             environmental_impact = {
                 'annual_co2_kg': annual_co2_kg,
@@ -936,8 +945,15 @@ def _format_vfd_analysis(evaluation: Dict[str, Any]) -> Dict[str, Any]:
         # Determine VFD recommendation based on power and efficiency
         vfd_recommended = power_kw > 15 and efficiency_pct > 70
         
-        energy_savings_pct = 15 if vfd_recommended else 5  # Typical VFD savings
-        annual_savings = (power_kw * 8760 * 0.15) * (energy_savings_pct / 100)
+        energy_simulation = evaluation.get('energy_simulation')
+        if energy_simulation and energy_simulation.get('savings_percent') is not None:
+            # Simulated savings against fixed-speed throttled operation
+            energy_savings_pct = round(energy_simulation['savings_percent'])
+            annual_savings = energy_simulation['annual_savings_cost']
+            vfd_recommended = energy_savings_pct > 5
+        else:
+            energy_savings_pct = 15 if vfd_recommended else 5  # Typical VFD savings
+            annual_savings = (power_kw * 8760 * 0.15) * (energy_savings_pct / 100)
         vfd_cost = power_kw * 150  # Typical VFD cost per kW
         payback_years = vfd_cost / annual_savings if annual_savings > 0 else 999
         
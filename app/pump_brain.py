@@ -23,7 +23,24 @@ from .brain import PerformanceAnalyzer
 from .brain.charts import ChartIntelligence
 from .brain.validation import DataValidator
 from .brain.cache import BrainCache
+from .brain.memoize import memoized
 from .brain.ai_analyst import AIAnalyst
+from .brain.request_context import get_request_context
+from .brain.performance_map import PerformanceMapGenerator
+from .brain.batch_evaluator import BatchEvaluator
+from .brain.duty_cycle import DutyCycleSelector
+from .brain.energy_simulation import EnergySimulator
+from .brain.multi_pump import MultiPumpSelector
+from .brain.speed_trim_optimizer import SpeedTrimOptimizer
+from .brain.virtual_catalog import VirtualCatalog
+from .brain.coverage import CoverageQuery
+from .brain.pareto import ParetoSelector
+from .brain.selection_session import SelectionSessionStore
+from .brain.warm_start import WarmStartSelector
+from .brain.sensitivity import SensitivityAnalyzer
+from .brain.duty_suggestions import DutySuggester
+from .brain.curve_similarity import CurveSimilarity
+from .brain.load_control import get_load_controller
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -158,6 +175,7 @@ class PumpBrain:
         # Store dependencies
         self.repository = repository
         self.config_service = config_service
+        self.load_control = get_load_controller()
         
         # Initialize intelligence modules
         self.selection = SelectionIntelligence(self)
@@ -165,9 +183,24 @@ class PumpBrain:
         self.charts = ChartIntelligence(self)
         self.validator = DataValidator(self)
         self.ai_analyst = AIAnalyst()
-        
-        # Initialize cache
-        self._cache = BrainCache()
+        self.performance_map = PerformanceMapGenerator(self)
+        self.batch_evaluator = BatchEvaluator(self)
+        self.duty_cycle = DutyCycleSelector(self)
+        self.energy_simulation = EnergySimulator(self)
+        self.multi_pump = MultiPumpSelector(self)
+        self.speed_trim = SpeedTrimOptimizer(self)
+        self.virtual_catalog = VirtualCatalog(self)
+        self.coverage = CoverageQuery(self)
+        self.pareto = ParetoSelector(self)
+        self.selection_sessions = SelectionSessionStore(self)
+        self.warm_start = WarmStartSelector(self)
+        self.sensitivity = SensitivityAnalyzer(self)
+        self.duty_suggestions = DutySuggester(self)
+        self.curve_similarity = CurveSimilarity(self)
+        
+        # Initialize cache (shared-tier entries are scoped to the loaded catalog,
+        # background refreshes keep the fidelity level of the request that saw the stale entry)
+        self._cache = BrainCache(scope=self.get_catalog_version, background=self.load_control.bind_current_level)
         
         # Log initialization
         logger.info(f"PumpBrain initialized in {BRAIN_MODE} mode")
@@ -187,6 +220,7 @@ class PumpBrain:
     # ==================== SELECTION OPERATIONS ====================
     
     @measure_performance
+    @memoized('best_pump', ttl=300, copy_result=True, negative=lambda results: not results)  # Empty: infeasible duty
     def find_best_pump(self, flow: float, head: float, 
                       constraints: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """
@@ -200,12 +234,6 @@ class PumpBrain:
         Returns:
             List of pump recommendations with scores and details
         """
-        # Check cache first - use robust cache key generation
-        cache_key = self._cache.make_key("best_pump", flow, head, constraints)
-        cached = self._cache.get(cache_key)
-        if cached:
-            return cached
-        
         # Validate inputs
         validation = self.validator.validate_operating_point(flow, head)
         if not validation['valid']:
@@ -215,24 +243,15 @@ class PumpBrain:
         brain_result = self.selection.find_best_pumps(flow, head, constraints, include_exclusions=False)
         
         # Extract just the ranked pumps for legacy compatibility
-        results = brain_result.get('ranked_pumps', [])
-        
-        # Cache results
-        self._cache.set(cache_key, results, ttl=300)  # 5 minute TTL
-        
-        return results
+        return brain_result.get('ranked_pumps', [])
     
     @measure_performance
+    @memoized('all_pump_codes', ttl=3600, fidelity=False, copy_result=True)  # Cache for 1 hour
     def get_all_pump_codes(self) -> List[Dict[str, str]]:
         """
         Returns a minimal list of all pumps for UI elements like autocomplete.
         Single source of truth for pump list data.
         """
-        cache_key = "all_pump_codes_list"
-        cached = self._cache.get(cache_key)
-        if cached:
-            return cached
-
         pump_models = self.repository.get_pump_models()
         pump_list = [
             {
@@ -247,11 +266,11 @@ class PumpBrain:
         # Sort by pump code for consistency
         pump_list.sort(key=lambda x: x['pump_code'])
         
-        self._cache.set(cache_key, pump_list, ttl=3600)  # Cache for 1 hour
         logger.info(f"Brain: Generated pump list with {len(pump_list)} pumps")
         return pump_list
     
     @measure_performance
+    @memoized('evaluate_pump', ttl=300, copy_result=True)
     def evaluate_pump(self, pump_id: str, flow: float, head: float) -> Dict[str, Any]:
         """
         Evaluate a specific pump at given operating conditions.
@@ -268,15 +287,45 @@ class PumpBrain:
         if not self.repository:
             raise RuntimeError("Brain requires repository for pump evaluation")
         
-        pump_data = self.repository.get_pump_by_code(pump_id)
+        # get_pump also resolves virtual speed/stage variant codes
+        pump_data = self.get_pump(pump_id)
         if not pump_data:
             raise ValueError(f"Pump {pump_id} not found")
         
-        # Perform evaluation
-        evaluation = self.selection.evaluate_single_pump(pump_data, flow, head, pump_id)
+        # Perform evaluation once per request for this duty point
+        evaluation = get_request_context().get_evaluation(
+            pump_id, flow, head,
+            lambda: self.selection.evaluate_single_pump(pump_data, flow, head, pump_id)
+        )
         
         return evaluation
     
+    def get_pump(self, pump_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get pump data, memoized for the lifetime of the current request.
+        Virtual speed/stage variant codes are materialized from their base pump.
+        
+        Args:
+            pump_id: Pump identifier (code or ID)
+        
+        Returns:
+            Pump data dictionary or None if not found
+        """
+        if not self.repository:
+            raise RuntimeError("Brain requires repository for pump lookup")
+        
+        # Unknown codes cost a full catalog scan; remember them briefly (L1 only)
+        missing_key = self._cache.make_key('missing_pump', self.get_catalog_version(), pump_id)
+        if self._cache.is_negative(missing_key):
+            return None
+        
+        pump_data = get_request_context().get_pump(self.repository, pump_id)
+        if pump_data is None:
+            pump_data = self.virtual_catalog.resolve(pump_id)
+        if pump_data is None:
+            self._cache.set_negative(missing_key)
+        return pump_data
+    
     @measure_performance
     def rank_pumps(self, pump_list: List[str], criteria: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
@@ -292,13 +341,20 @@ class PumpBrain:
         return self.selection.rank_pumps(pump_list, criteria)
     
     @measure_performance
+    @memoized('find_best_pumps', ttl=300, copy_result=True,
+              cacheable=lambda result: not (result.get('search_status') or {}).get('partial'))
     def find_best_pumps(self, site_requirements: Dict[str, Any], 
                        constraints: Optional[Dict[str, Any]] = None,
-                       include_exclusions: bool = False) -> Dict[str, Any]:
+                       include_exclusions: bool = False,
+                       deadline_seconds: Optional[float] = None) -> Dict[str, Any]:
         """
         Find best pumps with optional detailed exclusion analysis.
         
         DEBUG: Main Brain entry point for pump selection.
+        
+        With deadline_seconds (or the configured default budget) the best
+        pumps found in time are returned, and 'search_status' reports
+        whether the search was partial.
         """
         # CRITICAL DEBUG: Log main Brain entry point
         flow = site_requirements.get('flow_m3hr', 0)
@@ -312,11 +368,258 @@ class PumpBrain:
         if not validation['valid']:
             raise ValueError(f"Invalid operating point: {validation['errors']}")
         
-        # Use selection intelligence with exclusion tracking
-        return self.selection.find_best_pumps(flow, head, constraints, include_exclusions)
+        # Reduced fidelity under load: no exclusion detail, tighter latency budget
+        if include_exclusions and not self.load_control.setting('include_exclusions', True):
+            include_exclusions = False
+        budget = self.load_control.setting('deadline_seconds')
+        if budget and (deadline_seconds is None or deadline_seconds > budget):
+            deadline_seconds = budget
+        
+        # Use selection intelligence with exclusion tracking; deadline-truncated
+        # results are returned but never cached
+        result = self.selection.find_best_pumps(flow, head, constraints, include_exclusions, deadline_seconds)
+        result['fidelity'] = self.load_control.describe()
+        return result
+    
+    @measure_performance
+    @memoized('find_best_pump_configurations', ttl=300, copy_result=True)
+    def find_best_pump_configurations(self, site_requirements: Dict[str, Any],
+                                      constraints: Optional[Dict[str, Any]] = None,
+                                      include_exclusions: bool = False) -> Dict[str, Any]:
+        """
+        Find best single, parallel and series arrangements of identical pumps.
+        
+        Args:
+            site_requirements: Dictionary with flow_m3hr and head_m (system duty)
+            constraints: Optional constraints (pump_type, max_results,
+                arrangements, standby_pumps)
+            include_exclusions: If True, include exclusion details
+        
+        Returns:
+            Same shape as find_best_pumps, each pump carrying a 'configuration' block
+        """
+        flow = site_requirements.get('flow_m3hr', 0)
+        head = site_requirements.get('head_m', 0)
+        
+        validation = self.validator.validate_operating_point(flow, head)
+        if not validation['valid']:
+            raise ValueError(f"Invalid operating point: {validation['errors']}")
+        
+        return self.multi_pump.find_best_configurations(flow, head, constraints, include_exclusions)
+    
+    @measure_performance
+    @memoized('find_best_pumps_duty_cycle', ttl=300, copy_result=True)
+    def find_best_pumps_duty_cycle(self, operating_points: List[Dict[str, Any]],
+                                   constraints: Optional[Dict[str, Any]] = None,
+                                   include_exclusions: bool = False) -> Dict[str, Any]:
+        """
+        Find best pumps over a weighted duty cycle of operating points.
+        
+        All points x candidate pumps are evaluated in a single batched pass.
+        
+        Args:
+            operating_points: List of {'flow_m3hr', 'head_m', 'weight'}
+            constraints: Optional selection constraints
+            include_exclusions: If True, include exclusion details
+        
+        Returns:
+            Same shape as find_best_pumps, each pump carrying a 'duty_cycle' breakdown
+        """
+        for point in operating_points:
+            validation = self.validator.validate_operating_point(
+                point.get('flow_m3hr', 0), point.get('head_m', 0)
+            )
+            if not validation['valid']:
+                raise ValueError(f"Invalid operating point: {validation['errors']}")
+        
+        return self.duty_cycle.find_best_pumps(operating_points, constraints, include_exclusions)
+    
+    @measure_performance
+    @memoized('find_best_pumps_pareto', ttl=300, copy_result=True)
+    def find_best_pumps_pareto(self, site_requirements: Dict[str, Any],
+                               constraints: Optional[Dict[str, Any]] = None,
+                               include_exclusions: bool = False) -> Dict[str, Any]:
+        """
+        Find the Pareto-optimal pumps across selectable objectives.
+        
+        Args:
+            site_requirements: Dictionary with flow_m3hr and head_m
+            constraints: Optional constraints (pump_type, max_results,
+                objectives, npsh_available_m)
+            include_exclusions: If True, include exclusion details
+        
+        Returns:
+            Same shape as find_best_pumps, ordered by dominance rank, each pump
+            carrying a 'pareto' block
+        """
+        flow = site_requirements.get('flow_m3hr', 0)
+        head = site_requirements.get('head_m', 0)
+        
+        validation = self.validator.validate_operating_point(flow, head)
+        if not validation['valid']:
+            raise ValueError(f"Invalid operating point: {validation['errors']}")
+        
+        return self.pareto.find_pareto_pumps(flow, head, constraints, include_exclusions)
+    
+    @measure_performance
+    @memoized('analyze_duty_sensitivity', ttl=300, copy_result=True)
+    def analyze_duty_sensitivity(self, site_requirements: Dict[str, Any],
+                                 constraints: Optional[Dict[str, Any]] = None,
+                                 top_n: Optional[int] = None,
+                                 span: Optional[float] = None,
+                                 step: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Evaluate the top selected pumps over a grid of perturbed duty points.
+        
+        Args:
+            site_requirements: Dictionary with flow_m3hr and head_m
+            constraints: Optional selection constraints
+            top_n: Number of selected pumps to analyze
+            span: Largest relative flow/head perturbation (e.g. 0.2 for ±20%)
+            step: Relative grid step (e.g. 0.05)
+        
+        Returns:
+            Efficiency, tier and feasibility heatmaps per pump plus ranking stability
+        """
+        flow = site_requirements.get('flow_m3hr', 0)
+        head = site_requirements.get('head_m', 0)
+        
+        validation = self.validator.validate_operating_point(flow, head)
+        if not validation['valid']:
+            raise ValueError(f"Invalid operating point: {validation['errors']}")
+        
+        return self.sensitivity.analyze(flow, head, constraints, top_n, span, step)
+    
+    @measure_performance
+    @memoized('suggest_duty_changes', ttl=300, copy_result=True)
+    def suggest_duty_changes(self, site_requirements: Dict[str, Any],
+                             constraints: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Suggest the smallest flow/head changes that make the closest pumps feasible.
+        
+        Intended for duties where find_best_pumps returns nothing; distances
+        come from precomputed envelope geometry, not repeated evaluations.
+        
+        Args:
+            site_requirements: Dictionary with flow_m3hr and head_m
+            constraints: Optional constraints (pump_type, max_tier, max_results)
+        
+        Returns:
+            Ranked suggestions with per-move options and messages
+        """
+        flow = site_requirements.get('flow_m3hr', 0)
+        head = site_requirements.get('head_m', 0)
+        
+        validation = self.validator.validate_operating_point(flow, head)
+        if not validation['valid']:
+            raise ValueError(f"Invalid operating point: {validation['errors']}")
+        
+        return self.duty_suggestions.suggest(flow, head, constraints)
+    
+    @measure_performance
+    @memoized('find_pumps_covering_region', ttl=300, fidelity=False, copy_result=True)  # Envelope geometry only
+    def find_pumps_covering_region(self, region: Dict[str, Any],
+                                   constraints: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Find pumps whose operating envelope covers a Q-H duty region.
+        
+        Answered from precomputed envelope polygons through a spatial index;
+        no pump is evaluated at sampled points.
+        
+        Args:
+            region: {'flow_min', 'flow_max', 'head_min', 'head_max'} rectangle
+                or {'polygon': [[flow, head], ...]}
+            constraints: Optional constraints (pump_type, max_results, min_coverage)
+        
+        Returns:
+            Pumps with coverage fraction and efficiency statistics over the region
+        """
+        return self.coverage.find_covering_pumps(region, constraints)
     
     # ==================== PERFORMANCE ANALYSIS ====================
     
+    @measure_performance
+    def get_performance_map(self, pump_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the full trimmed-impeller performance map for a pump.
+        
+        Args:
+            pump_id: Pump identifier (code or ID)
+        
+        Returns:
+            Map with H-Q/efficiency/power surfaces and iso-efficiency contours
+        """
+        pump_data = self.get_pump(pump_id)
+        if not pump_data:
+            raise ValueError(f"Pump {pump_id} not found")
+        
+        return self.performance_map.get_map(pump_data)
+    
+    @measure_performance
+    @memoized('find_alternative_pumps', ttl=300, fidelity=False, copy_result=True)  # Fingerprints only
+    def find_alternative_pumps(self, pump_id: str,
+                               constraints: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Find catalog pumps whose curve shape resembles a pump's.
+        
+        Args:
+            pump_id: Pump identifier (code or ID)
+            constraints: Optional constraints (max_results, match_size,
+                pump_type, exclude_manufacturer)
+        
+        Returns:
+            Ranked alternatives with shape distance and BEP size ratios
+        """
+        pump_data = self.get_pump(pump_id)
+        if not pump_data:
+            raise ValueError(f"Pump {pump_id} not found")
+        
+        return self.curve_similarity.find_alternatives(pump_data, constraints)
+    
+    @memoized('duplicate_report', ttl=3600, fidelity=False, copy_result=True)
+    def get_duplicate_report(self, shape_radius: Optional[float] = None,
+                             size_tolerance: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Report groups of catalog pumps that appear to be the same hydraulic.
+        
+        Args:
+            shape_radius: Optional fingerprint distance limit
+            size_tolerance: Optional relative BEP flow/head limit
+        
+        Returns:
+            Near-duplicate groups and the thresholds used
+        """
+        return self.curve_similarity.duplicate_report(shape_radius, size_tolerance)
+    
+    @measure_performance
+    @memoized('simulate_annual_energy', ttl=300, copy_result=True)
+    def simulate_annual_energy(self, pump_id: str, flow: float, head: float,
+                               hourly_flows: Optional[List[float]] = None,
+                               h_static_ratio: Optional[float] = None,
+                               electricity_rate: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Simulate a year of VFD operation on the system curve through the duty point.
+        
+        Args:
+            pump_id: Pump identifier (code or ID)
+            flow: Design flow rate in m³/hr
+            head: Design head in meters
+            hourly_flows: Optional 8760-value hourly demand (defaults to config profile)
+            h_static_ratio: Optional static head fraction of design head
+            electricity_rate: Optional tariff per kWh
+        
+        Returns:
+            Annual kWh/cost summary, or None if the pump is not variable speed
+        """
+        pump_data = self.get_pump(pump_id)
+        if not pump_data:
+            raise ValueError(f"Pump {pump_id} not found")
+        
+        return self.energy_simulation.simulate(
+            pump_data, flow, head, hourly_flows=hourly_flows,
+            h_static_ratio=h_static_ratio, electricity_rate=electricity_rate
+        )
+    
     @measure_performance
     def calculate_performance(self, pump: Dict[str, Any], flow: float, 
                             head: float, impeller_trim: Optional[float] = None) -> Dict[str, Any]:
@@ -518,9 +821,24 @@ class PumpBrain:
             'uptime_seconds': uptime,
             'cache_stats': self._cache.get_stats(),
             'metrics': BrainMetrics.get_metrics(),
+            'load_control': self.load_control.get_stats(),
             'initialized_at': self._initialized_at.isoformat()
         }
     
+    def get_catalog_version(self) -> str:
+        """
+        Get the version stamp of the loaded catalog (a digest of its content).
+        Used to scope cached derived data to one catalog; identical across
+        workers and worker restarts that load the same data.
+        
+        Returns:
+            Catalog version string
+        """
+        if not self.repository:
+            return ''
+        metadata = self.repository.get_metadata()
+        return str(metadata.get('catalog_version') or metadata.get('build_date', ''))
+    
     def clear_cache(self):
         """Clear Brain cache."""
         self._cache.clear()
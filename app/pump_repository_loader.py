@@ -5,6 +5,8 @@ PostgreSQL data loading and transformation
 """
 
 import os
+import hashlib
+import json
 import logging
 from typing import Dict, Any
 from datetime import datetime
@@ -335,6 +337,7 @@ class PostgreSQLLoader:
                     # Build metadata with both old and new field names for compatibility
                     metadata = {
                         'build_date': datetime.now().isoformat(),
+                        'catalog_version': self._content_version(pump_models),
                         'source': 'postgresql',
                         'total_models': len(pump_models),
                         'total_curves': total_curves,
@@ -348,6 +351,9 @@ class PostgreSQLLoader:
                         'tables_found': list(tables.keys())
                     }
 
+                    # Precompute derived per-pump data once per catalog load
+                    self._precompute_derived_data(pump_models, metadata)
+
                     # Build catalog data structure
                     self.repository._catalog_data = {
                         'metadata': metadata,
@@ -370,4 +376,68 @@ class PostgreSQLLoader:
             import traceback
             logger.error(f"Repository: Error loading from PostgreSQL: {e}")
             logger.error(f"Repository: Traceback: {traceback.format_exc()}")
-            return False
\ No newline at end of file
+            return False
+
+    @staticmethod
+    def _content_version(pump_models) -> str:
+        """
+        Version stamp derived from the catalog content, so every worker (and
+        every recycled worker) loading the same data gets the same version.
+        Must run before derived data is attached to the pump models.
+
+        Args:
+            pump_models: Freshly built pump model list
+
+        Returns:
+            Short hex digest of the pump models
+        """
+        content = json.dumps(pump_models, sort_keys=True, default=str)
+        return hashlib.sha256(content.encode()).hexdigest()[:16]
+
+    def _precompute_derived_data(self, pump_models, metadata: Dict[str, Any]) -> None:
+        """
+        Attach load-time derived data (analytic curve fits, hydraulic profiles, etc.) to pump models.
+        Failures are logged and never block the catalog load.
+
+        Args:
+            pump_models: Freshly built pump model list
+            metadata: Catalog metadata (catalog_version, the content digest, is used as version)
+        """
+        catalog_version = metadata.get('catalog_version') or metadata.get('build_date', '')
+
+        try:
+            from .brain.curve_fits import CurveFitter
+            metadata['curve_fits'] = CurveFitter.fit_catalog(pump_models, catalog_version)
+        except Exception as e:
+            logger.error(f"Repository: Curve fit precomputation failed: {e}")
+
+        try:
+            from .brain.stocked_diameters import StockedDiameterSelector
+            metadata['stocked_diameters'] = StockedDiameterSelector.precompute_catalog(
+                pump_models, str(catalog_version))
+        except Exception as e:
+            logger.error(f"Repository: Stocked diameter precomputation failed: {e}")
+
+        try:
+            from .brain.hydraulic_profile import HydraulicProfiler
+            metadata['hydraulic_profiles'] = HydraulicProfiler.precompute_catalog(pump_models, str(catalog_version))
+        except Exception as e:
+            logger.error(f"Repository: Hydraulic profile precomputation failed: {e}")
+
+        try:
+            from .brain.operating_envelope import OperatingEnvelope
+            metadata['operating_envelopes'] = OperatingEnvelope.precompute_catalog(pump_models, str(catalog_version))
+        except Exception as e:
+            logger.error(f"Repository: Operating envelope precomputation failed: {e}")
+
+        try:
+            from .brain.family_index import FamilyIndex
+            metadata['pump_families'] = FamilyIndex.precompute_catalog(pump_models, str(catalog_version))
+        except Exception as e:
+            logger.error(f"Repository: Family index precomputation failed: {e}")
+
+        try:
+            from .brain.curve_similarity import CurveFingerprintIndex
+            metadata['curve_fingerprints'] = CurveFingerprintIndex.precompute_catalog(pump_models, str(catalog_version))
+        except Exception as e:
+            logger.error(f"Repository: Curve fingerprint precomputation failed: {e}")
@@ -51,7 +51,7 @@ def get_chart_data(pump_code):
 
         # SINGLE SOURCE OF TRUTH: Brain handles ALL logic
         brain = get_pump_brain()
-        pump = brain.repository.get_pump_by_code(pump_code)
+        pump = brain.get_pump(pump_code)
         evaluation = brain.evaluate_pump(pump_code, flow_rate, head)
         
         if not pump or not evaluation:
@@ -76,6 +76,268 @@ def get_chart_data(pump_code):
         return jsonify({'error': 'Internal server error'}), 500
 
 
+@api_bp.route('/performance_map/<path:pump_code>')
+def get_performance_map(pump_code):
+    """
+    BRAIN-ONLY API: Full trimmed-impeller performance map with iso-efficiency contours.
+    
+    Query: optional flow and head to mark the approximate duty point.
+    """
+    try:
+        brain = get_pump_brain()
+        pump = brain.get_pump(pump_code)
+        
+        if not pump:
+            return jsonify({'error': f'Pump {pump_code} not found'}), 404
+
+        map_payload = brain.charts.generate_performance_map_payload(
+            pump,
+            flow=request.args.get('flow', type=float),
+            head=request.args.get('head', type=float)
+        )
+        
+        if not map_payload:
+            return jsonify({'error': f'Brain could not generate performance map for {pump_code}'}), 404
+        
+        sanitized_data = sanitize_json_data(map_payload)
+        response = make_response(json.dumps(sanitized_data))
+        response.headers['Content-Type'] = 'application/json'
+        response.headers['Cache-Control'] = 'public, max-age=300'  # 5 minute cache
+        return response
+
+    except Exception as e:
+        logger.error(f"Error in Brain performance map API: {str(e)}")
+        return jsonify({'error': 'Internal server error'}), 500
+
+
+@api_bp.route('/alternatives/<path:pump_code>')
+def get_alternative_pumps(pump_code):
+    """
+    BRAIN-ONLY API: Pumps with curves like this one.
+    
+    Query: optional max_results, match_size (0 to compare shape only),
+    pump_type and exclude_manufacturer.
+    """
+    try:
+        constraints = {'pump_type': request.args.get('pump_type', 'GENERAL')}
+        if request.args.get('max_results', type=int):
+            constraints['max_results'] = request.args.get('max_results', type=int)
+        if request.args.get('match_size') is not None:
+            constraints['match_size'] = request.args.get('match_size') not in ('0', 'false', 'no')
+        if request.args.get('exclude_manufacturer'):
+            constraints['exclude_manufacturer'] = request.args.get('exclude_manufacturer')
+        
+        brain = get_pump_brain()
+        alternatives = brain.find_alternative_pumps(pump_code, constraints)
+        return jsonify(sanitize_json_data(alternatives))
+    
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 404
+    except Exception as e:
+        logger.error(f"Error in Brain alternatives API: {str(e)}")
+        return jsonify({'error': 'Internal server error'}), 500
+
+
+@api_bp.route('/energy_simulation/<path:pump_code>', methods=['GET', 'POST'])
+def get_energy_simulation(pump_code):
+    """
+    BRAIN-ONLY API: 8760-hour VFD energy simulation for one pump.
+    
+    Query: flow, head, optional static_head_ratio and rate.
+    POST body may carry 'hourly_flows' (8760 values) to replace the default load profile.
+    """
+    try:
+        flow = request.args.get('flow', type=float)
+        head = request.args.get('head', type=float)
+        if not (flow and head):
+            return jsonify({'error': 'Flow and head parameters are required'}), 400
+        
+        hourly_flows = None
+        if request.method == 'POST':
+            hourly_flows = (request.get_json(silent=True) or {}).get('hourly_flows')
+        
+        brain = get_pump_brain()
+        simulation = brain.simulate_annual_energy(
+            pump_code, flow, head,
+            hourly_flows=hourly_flows,
+            h_static_ratio=request.args.get('static_head_ratio', type=float),
+            electricity_rate=request.args.get('rate', type=float)
+        )
+        
+        if not simulation:
+            return jsonify({'error': f'Pump {pump_code} is not variable speed or has no usable curve'}), 404
+        
+        return jsonify(sanitize_json_data(simulation))
+    
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        logger.error(f"Error in Brain energy simulation API: {str(e)}")
+        return jsonify({'error': 'Internal server error'}), 500
+
+
+@api_bp.route('/energy_comparison')
+def get_energy_comparison():
+    """
+    BRAIN-ONLY API: Annual energy for the top-N variable-speed pumps of a selection.
+    """
+    try:
+        flow = request.args.get('flow', type=float)
+        head = request.args.get('head', type=float)
+        if not (flow and head):
+            return jsonify({'error': 'Flow and head parameters are required'}), 400
+        
+        brain = get_pump_brain()
+        selection = brain.find_best_pumps({'flow_m3hr': flow, 'head_m': head})
+        simulations = brain.energy_simulation.simulate_selection(
+            selection.get('ranked_pumps', []), flow, head,
+            top_n=request.args.get('top_n', type=int),
+            h_static_ratio=request.args.get('static_head_ratio', type=float),
+            electricity_rate=request.args.get('rate', type=float)
+        )
+        
+        return jsonify(sanitize_json_data({'flow_m3hr': flow, 'head_m': head, 'simulations': simulations}))
+    
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        logger.error(f"Error in Brain energy comparison API: {str(e)}")
+        return jsonify({'error': 'Internal server error'}), 500
+
+
+@api_bp.route('/reselect')
+def get_reselection():
+    """
+    BRAIN-ONLY API: Ranked selection for a nudged duty point.
+    
+    Query: flow, head, previous_flow, previous_head, optional pump_type and
+    max_results. The previous duty's ranking seeds the search; results are
+    identical to a full selection at the new duty.
+    """
+    try:
+        flow = request.args.get('flow', type=float)
+        head = request.args.get('head', type=float)
+        if not (flow and head):
+            return jsonify({'error': 'Flow and head parameters are required'}), 400
+        
+        constraints = {'pump_type': request.args.get('pump_type', 'GENERAL')}
+        if request.args.get('max_results', type=int):
+            constraints['max_results'] = request.args.get('max_results', type=int)
+        previous_flow = request.args.get('previous_flow', type=float)
+        previous_head = request.args.get('previous_head', type=float)
+        if previous_flow and previous_head:
+            constraints['warm_start_from'] = {'flow_m3hr': previous_flow, 'head_m': previous_head}
+        
+        brain = get_pump_brain()
+        selection = brain.find_best_pumps({'flow_m3hr': flow, 'head_m': head}, constraints)
+        return jsonify(sanitize_json_data({
+            'flow_m3hr': flow,
+            'head_m': head,
+            'ranked_pumps': selection.get('ranked_pumps', [])
+        }))
+    
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        logger.error(f"Error in Brain reselection API: {str(e)}")
+        return jsonify({'error': 'Internal server error'}), 500
+
+
+@api_bp.route('/sensitivity')
+def get_duty_sensitivity():
+    """
+    BRAIN-ONLY API: Duty-point sensitivity grid for the top selected pumps.
+    
+    Query: flow, head, optional pump_type, top_n, span and step (relative
+    fractions, e.g. span=0.2&step=0.05 for ±20% in 5% steps).
+    """
+    try:
+        flow = request.args.get('flow', type=float)
+        head = request.args.get('head', type=float)
+        if not (flow and head):
+            return jsonify({'error': 'Flow and head parameters are required'}), 400
+        
+        brain = get_pump_brain()
+        analysis = brain.analyze_duty_sensitivity(
+            {'flow_m3hr': flow, 'head_m': head},
+            {'pump_type': request.args.get('pump_type', 'GENERAL')},
+            top_n=request.args.get('top_n', type=int),
+            span=request.args.get('span', type=float),
+            step=request.args.get('step', type=float)
+        )
+        return jsonify(sanitize_json_data(analysis))
+    
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        logger.error(f"Error in Brain sensitivity API: {str(e)}")
+        return jsonify({'error': 'Internal server error'}), 500
+
+
+@api_bp.route('/duty_suggestions')
+def get_duty_suggestions():
+    """
+    BRAIN-ONLY API: Nearest feasible duty points for the closest pumps.
+    
+    Query: flow, head, optional pump_type, max_tier (1-3) and max_results.
+    """
+    try:
+        flow = request.args.get('flow', type=float)
+        head = request.args.get('head', type=float)
+        if not (flow and head):
+            return jsonify({'error': 'Flow and head parameters are required'}), 400
+        
+        constraints = {'pump_type': request.args.get('pump_type', 'GENERAL')}
+        if request.args.get('max_tier', type=int):
+            constraints['max_tier'] = request.args.get('max_tier', type=int)
+        if request.args.get('max_results', type=int):
+            constraints['max_results'] = request.args.get('max_results', type=int)
+        
+        brain = get_pump_brain()
+        suggestions = brain.suggest_duty_changes({'flow_m3hr': flow, 'head_m': head}, constraints)
+        return jsonify(sanitize_json_data(suggestions))
+    
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        logger.error(f"Error in Brain duty suggestions API: {str(e)}")
+        return jsonify({'error': 'Internal server error'}), 500
+
+
+@api_bp.route('/coverage', methods=['GET', 'POST'])
+def get_coverage():
+    """
+    BRAIN-ONLY API: Pumps whose operating envelope covers a Q-H region.
+    
+    Query: flow_min, flow_max, head_min, head_max, optional pump_type,
+    max_results and min_coverage (fraction). POST body may carry 'polygon'
+    ([[flow, head], ...]) instead of the rectangle.
+    """
+    try:
+        region = {key: request.args.get(key, type=float)
+                  for key in ('flow_min', 'flow_max', 'head_min', 'head_max')}
+        if request.method == 'POST':
+            body = request.get_json(silent=True) or {}
+            if body.get('polygon'):
+                region = {'polygon': body['polygon']}
+        
+        constraints = {'pump_type': request.args.get('pump_type')}
+        if request.args.get('max_results', type=int):
+            constraints['max_results'] = request.args.get('max_results', type=int)
+        if request.args.get('min_coverage', type=float) is not None:
+            constraints['min_coverage'] = request.args.get('min_coverage', type=float)
+        
+        brain = get_pump_brain()
+        coverage = brain.find_pumps_covering_region(region, constraints)
+        return jsonify(sanitize_json_data(coverage))
+    
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        logger.error(f"Error in Brain coverage API: {str(e)}")
+        return jsonify({'error': 'Internal server error'}), 500
+
+
 @api_bp.route('/pump_search')
 def pump_search():
     """
@@ -110,6 +110,22 @@ def brain_health():
             'timestamp': time.time()
         }), 503
 
+@brain_admin_bp.route('/admin/brain/duplicates')
+def duplicate_report():
+    """Near-duplicate pumps by curve-shape fingerprint"""
+    try:
+        from ..pump_brain import get_pump_brain
+        
+        brain = get_pump_brain()
+        report = brain.get_duplicate_report(
+            shape_radius=request.args.get('shape_distance', type=float),
+            size_tolerance=request.args.get('size_tolerance', type=float)
+        )
+        return jsonify(report)
+    except Exception as e:
+        logger.error(f"Error building duplicate report: {e}")
+        return jsonify({'error': str(e)}), 500
+
 @brain_admin_bp.route('/admin/brain/calibration')
 def calibration_tool():
     """Brain Calibration Tool - Tunable Physics Engine Interface"""
@@ -60,7 +60,10 @@ def brain_status():
                 'size': cache_stats['size'],
                 'max_size': cache_stats['max_size'],
                 'hits': cache_stats['hits'],
-                'misses': cache_stats['misses']
+                'misses': cache_stats['misses'],
+                'bytes': cache_stats['bytes'],
+                'max_bytes': cache_stats['max_bytes'],
+                'namespaces': cache_stats['namespaces']
             },
             'operations': operation_stats,
             'discrepancies': discrepancy_summary,
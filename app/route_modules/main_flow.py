@@ -305,6 +305,14 @@ def pump_options():
             'max_results': 10,
             'application_type': application_type
         }
+        if request.args.get('virtual_variants') is not None:
+            # Include derived speed/stage variants, e.g. virtual_variants=1
+            constraints['include_virtual_variants'] = request.args.get('virtual_variants') in ('1', 'true', 'yes')
+        if request.args.get('selection_profile'):
+            # Re-weight score components, e.g. selection_profile=efficiency_first
+            constraints['selection_profile'] = request.args.get('selection_profile')
+        if request.args.get('npsh_available', type=float) is not None:
+            constraints['npsh_available_m'] = request.args.get('npsh_available', type=float)
         
         process_logger.log_data("Constraints", constraints)
 
@@ -315,8 +323,39 @@ def pump_options():
             # CRITICAL: Brain system validates with authentic exclusion reasons
             site_reqs = {'flow_m3hr': flow, 'head_m': head}
             
-            process_logger.log("Calling Brain.find_best_pumps()...")
-            brain_result = brain.find_best_pumps(site_reqs, constraints, include_exclusions=True)
+            duty_profile = request.args.get('duty_profile')
+            if duty_profile:
+                # Weighted multi-point selection, e.g. duty_profile=60:20,100:50,110:30
+                operating_points = brain.duty_cycle.parse_duty_profile(duty_profile, flow, head)
+                process_logger.log(f"Calling Brain.find_best_pumps_duty_cycle() with {len(operating_points)} points...")
+                brain_result = brain.find_best_pumps_duty_cycle(operating_points, constraints, include_exclusions=True)
+            elif request.args.get('selection_mode') == 'pareto':
+                # Pareto front instead of a weighted score, e.g. objectives=efficiency,power
+                if request.args.get('objectives'):
+                    constraints['objectives'] = [o.strip() for o in request.args.get('objectives').split(',') if o.strip()]
+                process_logger.log("Calling Brain.find_best_pumps_pareto()...")
+                brain_result = brain.find_best_pumps_pareto(site_reqs, constraints, include_exclusions=True)
+            elif request.args.get('arrangement') in ('parallel', 'series', 'multi'):
+                # Explicit multi-pump search (parallel / series, optional standby)
+                constraints['standby_pumps'] = request.args.get('standby', default=0, type=int)
+                if request.args.get('arrangement') != 'multi':
+                    constraints['arrangements'] = ['single', request.args.get('arrangement')]
+                process_logger.log("Calling Brain.find_best_pump_configurations()...")
+                brain_result = brain.find_best_pump_configurations(site_reqs, constraints, include_exclusions=True)
+            else:
+                process_logger.log("Calling Brain.find_best_pumps()...")
+                # Optional latency budget in seconds, e.g. deadline=2
+                brain_result = brain.find_best_pumps(site_reqs, constraints, include_exclusions=True,
+                                                     deadline_seconds=request.args.get('deadline', type=float))
+                search_status = brain_result.get('search_status') or {}
+                if search_status.get('partial'):
+                    safe_flash(f"Search time limit reached - showing the best of "
+                               f"{search_status['coverage_fraction']:.0%} of candidate pumps.", 'info')
+                
+                # No single pump meets the duty - look for parallel/series arrangements
+                if not brain_result.get('ranked_pumps') and brain.multi_pump.fallback_when_no_single_pump:
+                    process_logger.log("No single pump feasible - calling Brain.find_best_pump_configurations()...")
+                    brain_result = brain.find_best_pump_configurations(site_reqs, constraints, include_exclusions=True)
             
             # Extract ranked pumps and authentic exclusion data
             pump_selections = brain_result.get('ranked_pumps', [])
@@ -410,6 +449,15 @@ def pump_options():
 
         if not pump_selections:
             safe_flash('No suitable pumps found for your requirements. Please adjust your specifications.', 'warning')
+            if brain.duty_suggestions.enabled:
+                # Point at the smallest duty changes that would make the closest pumps work
+                try:
+                    suggestions = brain.suggest_duty_changes(site_reqs, {'pump_type': pump_type})
+                    safe_session_set('duty_suggestions', suggestions.get('suggestions', []))
+                    for suggestion in suggestions.get('suggestions', [])[:3]:
+                        safe_flash(suggestion['options'][0]['message'], 'info')
+                except Exception as e:
+                    logger.error(f"Error computing duty suggestions: {e}")
             return redirect(url_for('main_flow.index'))
 
         # Store site requirements for reports (pump_selections already saved above with correct data)
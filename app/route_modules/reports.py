@@ -129,13 +129,7 @@ def bep_proximity_report(pump_code):
     brain = get_pump_brain()
     
     # Get pump data without strict evaluation
-    pump_data = None
-    if brain.repository:
-        all_pumps = brain.repository.get_pump_models()
-        for pump in all_pumps:
-            if pump.get('pump_code') == pump_code:
-                pump_data = pump
-                break
+    pump_data = brain.get_pump(pump_code) if brain.repository else None
     
     if not pump_data:
         safe_flash(f"Pump {pump_code} not found.", "error")
@@ -253,8 +247,7 @@ def engineering_report(pump_code):
         selected_pump['suitability_score'] = selected_pump['total_score']
     
     # Add pump specifications for template fields that need min/max impeller, test speed, etc.
-    pump_models = brain.repository.get_pump_models()
-    pump_model = next((p for p in pump_models if p.get('pump_code') == clean_pump_code), None)
+    pump_model = brain.get_pump(clean_pump_code)
     if pump_model and 'specifications' in pump_model:
         specs = pump_model['specifications'].copy()
         
@@ -278,6 +271,14 @@ def engineering_report(pump_code):
         # Log the min/max impeller values for debugging
         logger.info(f"Pump {clean_pump_code} specifications: min_impeller={specs.get('min_impeller_diameter_mm')}, max_impeller={specs.get('max_impeller_diameter_mm')}")
     
+    # Annual energy for variable-speed pumps on the system curve through the duty point
+    try:
+        energy_simulation = brain.simulate_annual_energy(clean_pump_code, flow, head)
+        if energy_simulation:
+            selected_pump['energy_simulation'] = energy_simulation
+    except Exception as e:
+        logger.warning(f"Could not run energy simulation for {clean_pump_code}: {e}")
+    
     # Get alternatives from the session if they exist
     pump_selections = safe_session_get('suitable_pumps', [])
     alternatives = [p for p in pump_selections if p.get('pump_code') != pump_code][:2]
@@ -398,6 +399,14 @@ def pump_report_data_api(pump_code):
         # CRITICAL FIX: Map Brain's total_score to template's expected suitability_score
         if 'total_score' in evaluation_result:
             evaluation_result['suitability_score'] = evaluation_result['total_score']
+        
+        # Annual energy for variable-speed pumps (optional add-on)
+        try:
+            energy_simulation = brain.simulate_annual_energy(pump_code, flow, head)
+            if energy_simulation:
+                evaluation_result['energy_simulation'] = energy_simulation
+        except Exception as e:
+            logger.warning(f"Could not run energy simulation for {pump_code}: {e}")
             
         return jsonify({
             'success': True,